@@ -1,4 +1,4 @@
-from pydantic_settings import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 from typing import List
 from functools import lru_cache
 
@@ -16,14 +16,24 @@ class Settings(BaseSettings):
     API_HOST: str = "0.0.0.0"
     API_PORT: int = 8000
     API_BASE_URL: str = "/api/v1"
+    EMIT_PROCESS_TIME_HEADER: bool = False  # Add X-Process-Time to every response
+    API_WORKERS: int | None = None  # uvicorn worker processes when DEBUG is off (default: CPU count)
 
     # Database
     DATABASE_URL: str
-    DB_ECHO: bool = False
+    DB_ECHO: bool = False  # Sampled SQL logging, not SQLAlchemy's per-statement echo
+    DB_ECHO_SAMPLE_RATE: float = 0.001  # Fraction of statements logged when DB_ECHO is on
+    DB_SLOW_QUERY_MS: int = 50  # Statements slower than this are logged when DB_ECHO is on
+    DB_POOL_SIZE: int = 10
+    DB_MAX_OVERFLOW: int = 20
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a pooled connection is replaced
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_QUERY_CACHE_SIZE: int = 2048  # Compiled-statement cache entries per engine
 
     # Redis
     REDIS_URL: str
     REDIS_QUEUE_NAME: str = "ai_inbox_queue"
+    REDIS_MAX_CONNECTIONS: int = 50
 
     # JWT
     SECRET_KEY: str
@@ -45,6 +55,8 @@ class Settings(BaseSettings):
     # OpenAI API
     OPENAI_API_KEY: str | None = None
     OPENAI_MODEL: str = "gpt-4-turbo-preview"
+    # OpenAI-compatible server (e.g. vLLM: http://vllm:8000/v1); no API key required
+    OPENAI_BASE_URL: str | None = None
 
     # Additional LLM APIs
     ANTHROPIC_API_KEY: str | None = None
@@ -82,9 +94,12 @@ class Settings(BaseSettings):
     # Email Sync Settings
     EMAIL_SYNC_INTERVAL_MINUTES: int = 5
     EMAIL_SYNC_LOOKBACK_DAYS: int = 90
+    EMAIL_SYNC_BATCH_SIZE: int = 500  # Emails per multi-row INSERT during sync
+    EMAIL_SYNC_QUEUE_INTERVAL_SECONDS: int = 15  # How often webhook-queued syncs are drained
 
     # Gmail Webhooks
     GMAIL_PUBSUB_TOPIC: str = "projects/your-project-id/topics/gmail-push"
+    PUBSUB_VERIFICATION_TOKEN: str | None = None  # Shared secret in the push endpoint's ?token= parameter
 
     # Outlook Webhooks
     OUTLOOK_WEBHOOK_URL: str = "https://your-domain.com/api/v1/webhooks/outlook/push"
@@ -95,6 +110,9 @@ class Settings(BaseSettings):
     AI_PROCESSING_BATCH_SIZE: int = 5         # Reduced to prevent quota exhaustion
     AI_CONTEXT_MAX_TOKENS: int = 8000
     AI_TEMPERATURE: float = 0.7
+    COMPANY_CONTEXT_CACHE_TTL: int = 600  # Seconds a user's company context stays cached
+    AI_RESULT_CACHE_TTL: int = 86400  # Seconds an LLM response stays cached by prompt hash
+    SYNC_STATUS_CACHE_TTL: int = 5  # Seconds a user's sync status stays cached between polls
 
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -105,15 +123,16 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
 
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
+    # Frozen so the cached instance from get_settings() can't be mutated at runtime
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=True, frozen=True)
 
 
 @lru_cache()
 def get_settings() -> Settings:
-    """Get cached settings instance"""
-    return Settings()
-
+    """
+    Get cached settings instance
 
-settings = get_settings()
+    This is the single source of settings; import it and call it rather than
+    constructing Settings directly so .env is parsed once per process.
+    """
+    return Settings()
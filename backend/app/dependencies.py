@@ -1,13 +1,14 @@
 from fastapi import Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
 from db import get_db
 from models import User
-from core import decode_token, AuthenticationError
+from core import decode_token, load_user, AuthenticationError
 
 security = HTTPBearer()
-
+_optional_security = HTTPBearer(auto_error=False)
 
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
@@ -22,7 +23,8 @@ async def get_current_user(
         return {"user_id": current_user.id}
     """
     token = credentials.credentials
-    payload = decode_token(token)
+    # JWT verification and the DB lookup both block, keep them off the event loop
+    payload = await run_in_threadpool(decode_token, token)
 
     if payload is None:
         raise AuthenticationError("Invalid token")
@@ -31,7 +33,7 @@ async def get_current_user(
     if user_id is None:
         raise AuthenticationError("Invalid token payload")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = await run_in_threadpool(load_user, db, user_id)
     if user is None:
         raise AuthenticationError("User not found")
 
@@ -39,7 +41,7 @@ async def get_current_user(
 
 
 async def get_current_user_optional(
-    credentials: Optional[HTTPAuthorizationCredentials] = Depends(HTTPBearer(auto_error=False)),
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(_optional_security),
     db: Session = Depends(get_db),
 ) -> Optional[User]:
     """
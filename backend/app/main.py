@@ -1,14 +1,20 @@
 from fastapi import FastAPI, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from contextlib import asynccontextmanager
 import logging
-from app.config import settings
+import os
+from app.config import get_settings
 from app.middleware import setup_middleware
 from db import check_db_connection, init_db
-from routers import auth, users, emails, threads, context, ai, integrations, workers
+from db.notify import NotificationListener
+from models.company_context import COMPANY_CONTEXT_CHANNEL
+from routers import auth, users, emails, threads, context, ai, integrations, workers, webhooks
+from services.ai_orchestrator import invalidate_company_context
 from workers import start_scheduler, stop_scheduler
 
+settings = get_settings()
+
 # Setup logging
 logging.basicConfig(
     level=logging.INFO if not settings.DEBUG else logging.DEBUG,
@@ -16,6 +22,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_BASE = settings.API_BASE_URL
+
+# Trigger-driven cache invalidation: company_context writes NOTIFY the user_id
+_notification_listener = NotificationListener(
+    {COMPANY_CONTEXT_CHANNEL: invalidate_company_context}
+)
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -33,10 +46,12 @@ async def lifespan(app: FastAPI):
         if settings.ENV == "development":
             init_db()
 
-    # Start background worker scheduler
+    _notification_listener.start()
+
+    # Start background worker scheduler (only one worker process runs it)
     try:
-        start_scheduler()
-        logger.info("Background worker scheduler started")
+        if start_scheduler():
+            logger.info("Background worker scheduler started")
     except Exception as e:
         logger.error(f"Failed to start worker scheduler: {e}")
 
@@ -45,10 +60,11 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down AI Inbox Manager API...")
 
+    _notification_listener.stop()
+
     # Stop background worker scheduler
     try:
         stop_scheduler()
-        logger.info("Background worker scheduler stopped")
     except Exception as e:
         logger.error(f"Failed to stop worker scheduler: {e}")
 
@@ -59,9 +75,11 @@ app = FastAPI(
     version=settings.APP_VERSION,
     description="AI-powered email management for Gmail & Outlook",
     lifespan=lifespan,
-    docs_url=f"{settings.API_BASE_URL}/docs",
-    redoc_url=f"{settings.API_BASE_URL}/redoc",
-    openapi_url=f"{settings.API_BASE_URL}/openapi.json",
+    # orjson encodes UUIDs/datetimes natively and much faster than json.dumps
+    default_response_class=ORJSONResponse,
+    docs_url=f"{_BASE}/docs",
+    redoc_url=f"{_BASE}/redoc",
+    openapi_url=f"{_BASE}/openapi.json",
 )
 
 # Setup middleware
@@ -84,7 +102,9 @@ async def validation_exception_handler(request: Request, exc: RequestValidationE
 @app.exception_handler(Exception)
 async def general_exception_handler(request: Request, exc: Exception):
     """Handle general exceptions"""
-    logger.error(f"Unhandled exception: {exc}", exc_info=True)
+    # Unexpected errors always carry their traceback; application errors
+    # subclass HTTPException and are served by FastAPI's own handler
+    logger.error("Unhandled exception: %s", exc, exc_info=exc)
     return JSONResponse(
         status_code=500,
         content={
@@ -113,27 +133,39 @@ async def root():
     return {
         "app": settings.APP_NAME,
         "version": settings.APP_VERSION,
-        "docs": f"{settings.API_BASE_URL}/docs",
+        "docs": f"{_BASE}/docs",
     }
 
 
 # Include routers
-app.include_router(auth.router, prefix=f"{settings.API_BASE_URL}/auth", tags=["Authentication"])
-app.include_router(users.router, prefix=f"{settings.API_BASE_URL}/user", tags=["Users"])
-app.include_router(emails.router, prefix=f"{settings.API_BASE_URL}/emails", tags=["Emails"])
-app.include_router(threads.router, prefix=f"{settings.API_BASE_URL}/threads", tags=["Threads"])
-app.include_router(context.router, prefix=f"{settings.API_BASE_URL}/context", tags=["Company Context"])
-app.include_router(ai.router, prefix=f"{settings.API_BASE_URL}/ai", tags=["AI Processing"])
-app.include_router(integrations.router, prefix=f"{settings.API_BASE_URL}/integrations", tags=["Integrations"])
-app.include_router(workers.router, prefix=f"{settings.API_BASE_URL}/workers", tags=["Background Workers"])
+app.include_router(auth.router, prefix=f"{_BASE}/auth", tags=["Authentication"])
+app.include_router(users.router, prefix=f"{_BASE}/user", tags=["Users"])
+app.include_router(emails.router, prefix=f"{_BASE}/emails", tags=["Emails"])
+app.include_router(threads.router, prefix=f"{_BASE}/threads", tags=["Threads"])
+app.include_router(context.router, prefix=f"{_BASE}/context", tags=["Company Context"])
+app.include_router(ai.router, prefix=f"{_BASE}/ai", tags=["AI Processing"])
+app.include_router(integrations.router, prefix=f"{_BASE}/integrations", tags=["Integrations"])
+app.include_router(workers.router, prefix=f"{_BASE}/workers", tags=["Background Workers"])
+app.include_router(webhooks.router, prefix=f"{_BASE}/webhooks", tags=["Webhooks"])
 
 
 if __name__ == "__main__":
     import uvicorn
 
-    uvicorn.run(
-        "app.main:app",
-        host=settings.API_HOST,
-        port=settings.API_PORT,
-        reload=settings.DEBUG,
-    )
+    if settings.DEBUG:
+        uvicorn.run(
+            "app.main:app",
+            host=settings.API_HOST,
+            port=settings.API_PORT,
+            reload=True,
+        )
+    else:
+        uvicorn.run(
+            "app.main:app",
+            host=settings.API_HOST,
+            port=settings.API_PORT,
+            workers=settings.API_WORKERS or os.cpu_count(),
+            # uvloop where available (not on Windows), asyncio otherwise
+            loop="auto",
+            http="httptools",
+        )
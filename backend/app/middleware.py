@@ -4,7 +4,9 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 import time
 import logging
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
@@ -13,25 +15,29 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """Log all requests"""
 
     async def dispatch(self, request: Request, call_next):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
+        log_enabled = logger.isEnabledFor(logging.INFO)
 
         # Log request
-        logger.info(f"Request: {request.method} {request.url.path}")
+        if log_enabled:
+            logger.info("Request: %s %s", request.method, request.url.path)
 
         try:
             response = await call_next(request)
-            process_time = (time.time() - start_time) * 1000
-            response.headers["X-Process-Time"] = f"{process_time:.2f}ms"
+            process_ms = (time.perf_counter_ns() - start_ns) / 1e6
+
+            if settings.EMIT_PROCESS_TIME_HEADER:
+                response.headers["X-Process-Time"] = f"{process_ms:.2f}ms"
 
-            logger.info(
-                f"Response: {request.method} {request.url.path} "
-                f"- Status: {response.status_code} "
-                f"- Time: {process_time:.2f}ms"
-            )
+            if log_enabled:
+                logger.info(
+                    "Response: %s %s - Status: %s - Time: %.2fms",
+                    request.method, request.url.path, response.status_code, process_ms,
+                )
 
             return response
         except Exception as e:
-            logger.error(f"Request error: {request.method} {request.url.path} - {str(e)}")
+            logger.error("Request error: %s %s - %s", request.method, request.url.path, e)
             raise
 
 
@@ -43,6 +49,7 @@ def setup_cors(app):
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["X-Next-Cursor"],
     )
 
 
@@ -4,19 +4,36 @@ Main CLI Entry Point
 Command-line interface for AI Inbox Manager
 """
 
+import importlib
 import click
-from cli.worker_commands import worker
 
 
-@click.group()
+class LazyGroup(click.Group):
+    """Click group that imports sub-command modules on first access"""
+
+    def __init__(self, *args, lazy_subcommands=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Maps command name -> "module.path:attribute"
+        self.lazy_subcommands = lazy_subcommands or {}
+
+    def list_commands(self, ctx):
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx, cmd_name):
+        if cmd_name in self.lazy_subcommands and cmd_name not in self.commands:
+            module_name, attr = self.lazy_subcommands[cmd_name].split(":")
+            self.add_command(getattr(importlib.import_module(module_name), attr), cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands={"worker": "cli.worker_commands:worker"},
+)
 def cli():
     """AI Inbox Manager - Command Line Interface"""
     pass
 
 
-# Add command groups
-cli.add_command(worker)
-
-
 if __name__ == '__main__':
     cli()
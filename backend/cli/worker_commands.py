@@ -8,10 +8,8 @@ import click
 import logging
 from typing import Optional
 
-from workers import get_scheduler
-from workers.email_sync_worker import sync_user_emails, sync_all_users
-from workers.ai_processing_worker import process_thread_ai, process_all_unprocessed_threads
-from workers.monitoring import get_monitor
+# Worker modules are imported inside each command: they pull in SQLAlchemy,
+# Redis, APScheduler and the LLM SDKs, which `--help` never needs.
 
 # Setup logging
 logging.basicConfig(
@@ -37,8 +35,10 @@ def scheduler():
 def start():
     """Start the worker scheduler"""
     try:
-        from workers import start_scheduler
-        start_scheduler()
+        from workers import start_scheduler, stop_scheduler, get_scheduler
+        if not start_scheduler():
+            click.echo("✗ Worker scheduler is already running in another process", err=True)
+            return
         click.echo("✓ Worker scheduler started successfully")
 
         # Display scheduled jobs
@@ -58,7 +58,7 @@ def start():
                 time.sleep(1)
         except KeyboardInterrupt:
             click.echo("\n\nStopping scheduler...")
-            sched.stop()
+            stop_scheduler()
             click.echo("✓ Worker scheduler stopped")
 
     except Exception as e:
@@ -82,6 +82,7 @@ def stop():
 def status():
     """Show scheduler status and jobs"""
     try:
+        from workers import get_scheduler
         sched = get_scheduler()
 
         if sched.is_running:
@@ -113,6 +114,7 @@ def status():
 def pause(job_id: str):
     """Pause a scheduled job"""
     try:
+        from workers import get_scheduler
         sched = get_scheduler()
         sched.pause_job(job_id)
         click.echo(f"✓ Job '{job_id}' paused successfully")
@@ -126,6 +128,7 @@ def pause(job_id: str):
 def resume(job_id: str):
     """Resume a paused job"""
     try:
+        from workers import get_scheduler
         sched = get_scheduler()
         sched.resume_job(job_id)
         click.echo(f"✓ Job '{job_id}' resumed successfully")
@@ -139,6 +142,7 @@ def resume(job_id: str):
 def remove(job_id: str):
     """Remove a scheduled job"""
     try:
+        from workers import get_scheduler
         sched = get_scheduler()
         sched.remove_job(job_id)
         click.echo(f"✓ Job '{job_id}' removed successfully")
@@ -161,6 +165,7 @@ def sync():
 def user(user_id: str, provider: Optional[str], full: bool, lookback_days: int):
     """Sync emails for a specific user"""
     try:
+        from workers.email_sync_worker import sync_user_emails
         click.echo(f"Starting email sync for user {user_id}...")
 
         result = sync_user_emails(
@@ -189,6 +194,7 @@ def user(user_id: str, provider: Optional[str], full: bool, lookback_days: int):
 def all(lookback_days: int):
     """Sync emails for all users"""
     try:
+        from workers.email_sync_worker import sync_all_users
         click.echo("Starting bulk email sync for all users...")
 
         result = sync_all_users(lookback_days=lookback_days)
@@ -228,6 +234,7 @@ def ai():
 def thread(user_id: str, thread_id: str, tasks: tuple):
     """Process a specific thread with AI"""
     try:
+        from workers.ai_processing_worker import process_thread_ai
         task_list = list(tasks) if tasks else None
 
         click.echo(f"Starting AI processing for thread {thread_id}...")
@@ -266,6 +273,7 @@ def thread(user_id: str, thread_id: str, tasks: tuple):
 def bulk(user_id: Optional[str], limit: int, tasks: tuple):
     """Process unprocessed threads with AI"""
     try:
+        from workers.ai_processing_worker import process_all_unprocessed_threads
         task_list = list(tasks) if tasks else None
 
         click.echo(f"Starting bulk AI processing...")
@@ -311,6 +319,7 @@ def monitor():
 def stats(worker_name: Optional[str]):
     """Show worker statistics"""
     try:
+        from workers.monitoring import get_monitor
         mon = get_monitor()
 
         if worker_name:
@@ -356,6 +365,7 @@ def stats(worker_name: Optional[str]):
 def history(worker_name: str, limit: int):
     """Show worker execution history"""
     try:
+        from workers.monitoring import get_monitor
         mon = get_monitor()
         hist = mon.get_worker_history(worker_name, limit)
 
@@ -384,6 +394,7 @@ def history(worker_name: str, limit: int):
 def failures(limit: int, hours: int):
     """Show recent worker failures"""
     try:
+        from workers.monitoring import get_monitor
         mon = get_monitor()
         recent_failures = mon.get_recent_failures(limit, hours)
 
@@ -411,6 +422,7 @@ def failures(limit: int, hours: int):
 def clear(worker_name: Optional[str], clear_all: bool):
     """Clear worker statistics"""
     try:
+        from workers.monitoring import get_monitor
         mon = get_monitor()
 
         if clear_all:
@@ -1,9 +1,13 @@
 from .security import (
     verify_password,
+    verify_and_update_password,
     get_password_hash,
+    run_kdf,
     create_access_token,
     create_refresh_token,
     decode_token,
+    load_user,
+    invalidate_user_cache,
 )
 from .exceptions import (
     AuthenticationError,
@@ -17,10 +21,14 @@ from .exceptions import (
 
 __all__ = [
     "verify_password",
+    "verify_and_update_password",
     "get_password_hash",
+    "run_kdf",
     "create_access_token",
     "create_refresh_token",
     "decode_token",
+    "load_user",
+    "invalidate_user_cache",
     "AuthenticationError",
     "PermissionDeniedError",
     "NotFoundError",
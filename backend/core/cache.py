@@ -0,0 +1,65 @@
+"""
+Redis Cache Helpers
+
+Best-effort JSON caching on top of the shared Redis client. Redis errors are
+logged and treated as cache misses so an outage never fails a request.
+"""
+
+import json
+import logging
+from typing import Any, Optional
+
+from core.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+
+def cache_get(key: str) -> Optional[Any]:
+    """
+    Get a JSON value from the cache
+
+    Args:
+        key: Cache key
+
+    Returns:
+        Decoded value, or None on a miss or Redis error
+    """
+    try:
+        raw = get_redis().get(key)
+    except Exception as e:
+        logger.warning(f"Cache read failed for {key}: {str(e)}")
+        return None
+
+    if raw is None:
+        return None
+    return json.loads(raw)
+
+
+def cache_set(key: str, value: Any, ttl: int) -> None:
+    """
+    Store a JSON-serializable value in the cache
+
+    Args:
+        key: Cache key
+        value: Value to store
+        ttl: Expiration in seconds
+    """
+    try:
+        get_redis().set(key, json.dumps(value, default=str), ex=ttl)
+    except Exception as e:
+        logger.warning(f"Cache write failed for {key}: {str(e)}")
+
+
+def cache_delete(*keys: str) -> None:
+    """
+    Remove keys from the cache
+
+    Args:
+        keys: Cache keys to delete
+    """
+    if not keys:
+        return
+    try:
+        get_redis().delete(*keys)
+    except Exception as e:
+        logger.warning(f"Cache delete failed for {keys}: {str(e)}")
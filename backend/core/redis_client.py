@@ -4,18 +4,40 @@ Redis Client
 Provides Redis connection for queuing and caching
 """
 
+import json
 import logging
 import redis
-from typing import Optional
-from app.config import settings
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+QUEUE_PREFIX = "queue"
+
+
+class QueuePipeline:
+    """Buffers queue pushes and sends them in a single round trip"""
+
+    def __init__(self, pipe: "redis.client.Pipeline"):
+        self._pipe = pipe
+
+    def enqueue(self, queue: str, job_data: Dict[str, Any]) -> None:
+        """Buffer a job for the named queue"""
+        self._pipe.rpush(f"{QUEUE_PREFIX}:{queue}", json.dumps(job_data))
+
+    def execute(self) -> list:
+        """Send all buffered commands"""
+        return self._pipe.execute()
+
 
 class RedisClient:
     """Redis client singleton"""
 
     _instance: Optional[redis.Redis] = None
+    _pool: Optional[redis.ConnectionPool] = None
 
     @classmethod
     def get_instance(cls) -> redis.Redis:
@@ -27,13 +49,16 @@ class RedisClient:
         """
         if cls._instance is None:
             try:
-                cls._instance = redis.from_url(
+                # Bounded pool shared by every caller in this process
+                cls._pool = redis.ConnectionPool.from_url(
                     settings.REDIS_URL,
+                    max_connections=settings.REDIS_MAX_CONNECTIONS,
                     decode_responses=True,
                     socket_connect_timeout=5,
                     socket_keepalive=True,
                     health_check_interval=30
                 )
+                cls._instance = redis.Redis(connection_pool=cls._pool)
                 # Test connection
                 cls._instance.ping()
                 logger.info("Redis connection established")
@@ -43,12 +68,62 @@ class RedisClient:
 
         return cls._instance
 
+    @classmethod
+    def enqueue(cls, queue: str, job_data: Dict[str, Any]) -> None:
+        """
+        Push a job onto a named queue
+
+        Args:
+            queue: Queue name (e.g. 'email_sync')
+            job_data: JSON-serializable job payload
+        """
+        cls.get_instance().rpush(f"{QUEUE_PREFIX}:{queue}", json.dumps(job_data))
+
+    @classmethod
+    def dequeue(cls, queue: str, count: int) -> List[Dict[str, Any]]:
+        """
+        Pop up to ``count`` jobs off the front of a named queue
+
+        The read and the trim run in one MULTI, so concurrent consumers
+        never receive the same job.
+
+        Args:
+            queue: Queue name (e.g. 'email_sync')
+            count: Maximum number of jobs to take
+
+        Returns:
+            Decoded job payloads, oldest first
+        """
+        key = f"{QUEUE_PREFIX}:{queue}"
+        with cls.get_instance().pipeline() as pipe:
+            pipe.lrange(key, 0, count - 1)
+            pipe.ltrim(key, count, -1)
+            raw_jobs, _ = pipe.execute()
+        return [json.loads(raw) for raw in raw_jobs]
+
+    @classmethod
+    @contextmanager
+    def pipeline(cls) -> Iterator[QueuePipeline]:
+        """
+        Batch several enqueues into one round trip
+
+        Usage:
+            with redis_client.pipeline() as pipe:
+                pipe.enqueue('email_sync', job_data)
+                pipe.execute()
+        """
+        with cls.get_instance().pipeline(transaction=False) as pipe:
+            yield QueuePipeline(pipe)
+
     @classmethod
     def close(cls):
         """Close Redis connection"""
         if cls._instance:
             cls._instance.close()
             cls._instance = None
+        if cls._pool:
+            cls._pool.disconnect()
+            cls._pool = None
             logger.info("Redis connection closed")
 
 
@@ -56,11 +131,9 @@ def get_redis() -> redis.Redis:
     """
     Get Redis client instance
 
+    The connection is opened on first call, not at import time.
+
     Usage in dependencies:
         redis_client = get_redis()
     """
     return RedisClient.get_instance()
-
-
-# Global instance
-redis_client = get_redis()
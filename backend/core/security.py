@@ -1,26 +1,108 @@
+import asyncio
+import hashlib
+import os
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional, Tuple
+from cachetools import TTLCache
 from jose import JWTError, jwt
-from passlib.context import CryptContext
+import bcrypt
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import InvalidHashError, VerificationError
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
-from app.config import settings
+from sqlalchemy.orm import Session, make_transient_to_detached
+from app.config import get_settings
+from core.cache import cache_get, cache_set, cache_delete
 from db import get_db
 from models import User
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+settings = get_settings()
+
+# Password hashing - Argon2id via argon2-cffi (libargon2's optimized C
+# implementation), PHC-recommended parameters. Legacy bcrypt hashes still
+# verify and are rehashed on the next successful login.
+_password_hasher = PasswordHasher(
+    time_cost=3,
+    memory_cost=64 * 1024,
+    parallelism=1,
+    type=Type.ID,
+)
+
+# Dedicated executor for the password KDF. argon2-cffi and bcrypt release the
+# GIL while hashing, so these threads run in parallel across cores without
+# occupying the default threadpool that serves DB work.
+_kdf_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1, thread_name_prefix="kdf"
+)
+
+# Decoded JWT payloads keyed by a hash of the token (the raw token is never stored).
+# TTL is kept well below ACCESS_TOKEN_EXPIRE_MINUTES so polling clients skip the
+# HMAC verify + JSON parse on repeat requests.
+_token_cache: TTLCache = TTLCache(maxsize=10000, ttl=30)
+_token_cache_lock = threading.Lock()
+
+# Column snapshots of recently authenticated users are cached in Redis, so an
+# invalidation reaches every worker process at once. Snapshots (not ORM
+# instances) are cached so nothing is shared across sessions.
+_USER_CACHE_TTL = 60
+# Only what request auth needs; the password hash never goes into Redis
+_USER_SNAPSHOT_COLUMNS = ("id", "email", "name", "created_at")
+
+
+def _is_argon2_hash(hashed_password: str) -> bool:
+    return hashed_password.startswith("$argon2")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    if _is_argon2_hash(hashed_password):
+        try:
+            return _password_hasher.verify(hashed_password, plain_password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    try:
+        return bcrypt.checkpw(plain_password.encode(), hashed_password.encode())
+    except ValueError:
+        return False
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a replacement hash if the stored one is outdated
+
+    Returns:
+        Tuple of (is_valid, new_hash); new_hash is None unless the stored
+        hash is bcrypt or uses outdated Argon2 parameters
+    """
+    if not verify_password(plain_password, hashed_password):
+        return False, None
+
+    if not _is_argon2_hash(hashed_password) or _password_hasher.check_needs_rehash(hashed_password):
+        return True, get_password_hash(plain_password)
+
+    return True, None
 
 
 def get_password_hash(password: str) -> str:
     """Generate password hash"""
-    return pwd_context.hash(password)
+    return _password_hasher.hash(password)
+
+
+async def run_kdf(fn: Callable[..., Any], *args) -> Any:
+    """
+    Run a password hashing/verification function on the KDF executor
+
+    Usage:
+        password_hash = await run_kdf(get_password_hash, password)
+    """
+    return await asyncio.get_running_loop().run_in_executor(_kdf_executor, fn, *args)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -63,22 +145,87 @@ def create_refresh_token(data: dict) -> str:
     return encoded_jwt
 
 
+def _token_cache_key(token: str) -> str:
+    """Cache key for a token - a truncated SHA-256 digest, never the token itself"""
+    return hashlib.sha256(token.encode()).hexdigest()[:32]
+
+
 def decode_token(token: str) -> Optional[dict]:
     """
     Decode and verify JWT token
 
+    Successfully decoded payloads are cached for a short TTL so repeat
+    requests with the same token skip signature verification.
+
     Args:
         token: JWT token string
 
     Returns:
         Decoded payload dictionary or None if invalid
     """
+    key = _token_cache_key(token)
+    with _token_cache_lock:
+        payload = _token_cache.get(key)
+
+    if payload is not None:
+        # Don't serve a cached payload past the token's own expiry
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        with _token_cache_lock:
+            _token_cache.pop(key, None)
+        return None
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
-        return payload
     except JWTError:
         return None
 
+    with _token_cache_lock:
+        _token_cache[key] = payload
+    return payload
+
+
+def _user_cache_key(user_id) -> str:
+    return f"user:{user_id}"
+
+
+def load_user(db: Session, user_id: str) -> Optional[User]:
+    """
+    Load a user by id, serving repeat lookups from the Redis user cache
+
+    Args:
+        db: Database session
+        user_id: User id from the token payload (or OAuth state)
+
+    Returns:
+        User attached to ``db`` or None if not found
+    """
+    try:
+        user_id = str(uuid.UUID(str(user_id)))
+    except ValueError:
+        return None
+
+    snapshot = cache_get(_user_cache_key(user_id))
+    if snapshot is not None:
+        snapshot["created_at"] = datetime.fromisoformat(snapshot["created_at"])
+        user = User(**snapshot)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    # Primary-key lookup: checks the identity map first and reuses the cached statement
+    user = db.get(User, user_id)
+    if user is not None:
+        snapshot = {name: getattr(user, name) for name in _USER_SNAPSHOT_COLUMNS}
+        snapshot["created_at"] = snapshot["created_at"].isoformat()
+        cache_set(_user_cache_key(user_id), snapshot, _USER_CACHE_TTL)
+    return user
+
+
+def invalidate_user_cache(user_id) -> None:
+    """Drop a cached user snapshot after the row has been modified or deleted"""
+    cache_delete(_user_cache_key(user_id))
+
 
 # HTTP Bearer token authentication
 security = HTTPBearer()
@@ -117,7 +264,7 @@ def get_current_user(
     if user_id is None:
         raise credentials_exception
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
     if user is None:
         raise credentials_exception
 
@@ -1,4 +1,5 @@
 from .session import engine, SessionLocal, get_db
 from .init_db import init_db, check_db_connection
+from .bulk import insert_rows, upsert_row
 
-__all__ = ["engine", "SessionLocal", "get_db", "init_db", "check_db_connection"]
+__all__ = ["engine", "SessionLocal", "get_db", "init_db", "check_db_connection", "insert_rows", "upsert_row"]
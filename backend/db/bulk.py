@@ -0,0 +1,89 @@
+"""
+Bulk Write Helpers
+
+Batched multi-row INSERTs for high-volume write paths (email sync) and
+single-statement upserts for the one-row-per-thread AI tables
+"""
+
+from typing import Any, Dict, List, Optional, Sequence, Type
+from sqlalchemy import insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+
+def insert_rows(
+    db: Session,
+    model: Type,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Optional[Sequence[str]] = None,
+) -> int:
+    """
+    Insert many rows in a single executemany and commit
+
+    Column defaults (id, created_at) are applied as with a normal ORM add.
+    Rows are plain dicts, so no ORM instances are built or tracked.
+
+    With ``conflict_columns``, rows that collide on that unique key (already
+    stored, e.g. by a re-sync or a concurrent worker, or repeated within the
+    batch) are skipped with ON CONFLICT DO NOTHING instead of failing the
+    whole batch.
+
+    Args:
+        db: Database session
+        model: Mapped model class
+        rows: Column-name to value mappings
+        conflict_columns: Columns of a unique constraint to skip conflicts on
+
+    Returns:
+        Number of rows actually inserted
+    """
+    if not rows:
+        return 0
+
+    if conflict_columns is None:
+        db.execute(insert(model), rows)
+        db.commit()
+        return len(rows)
+
+    stmt = (
+        pg_insert(model)
+        .on_conflict_do_nothing(index_elements=list(conflict_columns))
+        .returning(model.id)
+    )
+    # Skipped rows return nothing, so the RETURNING rows count the inserts
+    inserted = len(db.execute(stmt, rows).all())
+    db.commit()
+    return inserted
+
+
+def upsert_row(
+    db: Session,
+    model: Type,
+    values: Dict[str, Any],
+    index_elements: Sequence[str] = ("thread_id",),
+):
+    """
+    INSERT ... ON CONFLICT DO UPDATE a single row and commit
+
+    Replaces select-then-insert-or-update with one statement, which also
+    closes the race between the existence check and the insert.
+
+    Args:
+        db: Database session
+        model: Mapped model class
+        values: Column-name to value mappings for the row
+        index_elements: Columns of the unique constraint to upsert on
+
+    Returns:
+        The inserted or updated model instance
+    """
+    stmt = pg_insert(model).values(**values)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=list(index_elements),
+        set_={key: stmt.excluded[key] for key in values if key not in index_elements},
+    ).returning(model)
+
+    # populate_existing refreshes an instance already in the identity map
+    row = db.execute(stmt, execution_options={"populate_existing": True}).scalar_one()
+    db.commit()
+    return row
@@ -1,4 +1,4 @@
-from sqlalchemy import inspect
+from sqlalchemy import inspect, text
 from models import Base
 from db.session import engine
 import logging
@@ -10,7 +10,8 @@ def init_db():
     """Initialize database - create all tables"""
     try:
         Base.metadata.create_all(bind=engine)
-        logger.info("Database tables created successfully")
+        tables = inspect(engine).get_table_names()
+        logger.info(f"Database tables created successfully. Found {len(tables)} tables.")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
         raise
@@ -19,9 +20,10 @@ def init_db():
 def check_db_connection():
     """Check if database connection is working"""
     try:
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
-        logger.info(f"Database connection successful. Found {len(tables)} tables.")
+        # Single round-trip; catalog reflection is left to init_db
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+        logger.info("Database connection successful.")
         return True
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
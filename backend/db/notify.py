@@ -0,0 +1,88 @@
+"""
+Postgres LISTEN/NOTIFY Listener
+
+Runs a background thread on a dedicated (non-pooled) connection that
+LISTENs on a set of channels and hands each notification payload to the
+channel's handler. Used for trigger-driven cache invalidation.
+"""
+
+import logging
+import select
+import threading
+from typing import Callable, Dict, Optional
+
+from db.session import engine
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationListener:
+    """Dispatch Postgres notifications to per-channel handlers"""
+
+    def __init__(
+        self,
+        handlers: Dict[str, Callable[[str], None]],
+        poll_timeout: float = 5.0,
+        reconnect_delay: float = 5.0,
+    ):
+        self.handlers = handlers
+        self.poll_timeout = poll_timeout
+        self.reconnect_delay = reconnect_delay
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start listening in a daemon thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="pg-notify-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the listener thread to exit and wait for it"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=self.poll_timeout + 1)
+
+    def _connect(self):
+        """Open an autocommit DBAPI connection outside the engine's pool"""
+        cargs, cparams = engine.dialect.create_connect_args(engine.url)
+        conn = engine.dialect.connect(*cargs, **cparams)
+        conn.autocommit = True
+        with conn.cursor() as cursor:
+            for channel in self.handlers:
+                cursor.execute(f'LISTEN "{channel}"')
+        return conn
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            conn = None
+            try:
+                conn = self._connect()
+                logger.info(f"Listening for notifications on: {', '.join(self.handlers)}")
+
+                while not self._stop.is_set():
+                    if select.select([conn], [], [], self.poll_timeout) == ([], [], []):
+                        continue
+                    conn.poll()
+                    while conn.notifies:
+                        self._dispatch(conn.notifies.pop(0))
+
+            except Exception as e:
+                logger.error(f"Notification listener error: {e}")
+                self._stop.wait(self.reconnect_delay)
+            finally:
+                if conn is not None:
+                    conn.close()
+
+    def _dispatch(self, notify) -> None:
+        handler = self.handlers.get(notify.channel)
+        if handler is None:
+            return
+        try:
+            handler(notify.payload)
+        except Exception as e:
+            logger.error(f"Handler for {notify.channel} failed: {e}")
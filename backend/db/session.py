@@ -1,17 +1,51 @@
-from sqlalchemy import create_engine
+import logging
+import random
+import time
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from typing import Generator
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
 
 # Create database engine
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DB_ECHO,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    # Compiled-statement cache shared across sessions (default is 500 entries)
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
+    # psycopg2: batch multi-row INSERT/UPDATE via execute_values / execute_batch
+    executemany_mode="values_plus_batch",
 )
 
+
+def _sampled_log(conn, cursor, statement, parameters, context, executemany):
+    """Log a random sample of statements and start the slow-query timer"""
+    # Kept on the per-execution context, so a statement that raises leaves
+    # nothing behind on the connection
+    context._query_start = time.perf_counter()
+    if random.random() < settings.DB_ECHO_SAMPLE_RATE:
+        logger.debug("SQL (sampled): %s", statement)
+
+
+def _log_slow_query(conn, cursor, statement, parameters, context, executemany):
+    """Log statements that ran longer than DB_SLOW_QUERY_MS"""
+    elapsed_ms = (time.perf_counter() - context._query_start) * 1000
+    if elapsed_ms > settings.DB_SLOW_QUERY_MS:
+        logger.warning("Slow query (%.1f ms): %s", elapsed_ms, statement)
+
+
+# echo=True formats every statement through logging; DB_ECHO instead enables
+# sampled statement logging plus slow-query reports (skipped under python -O)
+if __debug__ and settings.DB_ECHO:
+    event.listen(engine, "before_cursor_execute", _sampled_log)
+    event.listen(engine, "after_cursor_execute", _log_slow_query)
+
 # Create session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -0,0 +1,37 @@
+"""
+Prebuilt Statements
+
+lambda_stmt versions of the hot AI-path queries. The statement construct is
+built and its SQL compiled once; later executions only bind parameters.
+"""
+
+from sqlalchemy import bindparam, lambda_stmt, select
+
+from models import Thread, Email
+
+# Thread owned by a user, outer-joined to the prompt columns of its emails,
+# oldest first (email columns are NULL for a thread with no emails):
+# params tid, uid
+GET_THREAD_WITH_EMAILS = lambda_stmt(
+    lambda: select(Thread, Email.sender, Email.timestamp, Email.body_text_clean)
+    .outerjoin(Email, Email.thread_id == Thread.id)
+    .where(
+        Thread.id == bindparam("tid"),
+        Thread.user_id == bindparam("uid"),
+    )
+    .order_by(Email.timestamp)
+)
+
+# Subject of a thread owned by a user and the prompt columns of its newest
+# email only (email columns are NULL for a thread with no emails):
+# params tid, uid
+GET_THREAD_LATEST_EMAIL = lambda_stmt(
+    lambda: select(Thread.subject, Email.sender, Email.timestamp, Email.body_text_clean)
+    .outerjoin(Email, Email.thread_id == Thread.id)
+    .where(
+        Thread.id == bindparam("tid"),
+        Thread.user_id == bindparam("uid"),
+    )
+    .order_by(Email.timestamp.desc().nulls_last())
+    .limit(1)
+)
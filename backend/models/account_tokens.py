@@ -1,7 +1,6 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, UUIDType
 
 
 class AccountToken(BaseModel):
@@ -9,12 +8,20 @@ class AccountToken(BaseModel):
 
     __tablename__ = "account_tokens"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False)
     provider = Column(String, nullable=False)  # gmail or outlook
     email_address = Column(String, nullable=False)
     access_token = Column(String, nullable=False)
     refresh_token = Column(String, nullable=False)  # encrypted
     expires_at = Column(DateTime, nullable=False)
+    # Outlook webhook subscription; notifications are matched back by its ID
+    subscription_id = Column(String, index=True)
+    subscription_expires_at = Column(DateTime)
+
+    # One account per (user, provider); also covers plain user_id lookups
+    __table_args__ = (
+        Index("ix_account_tokens_user_provider", "user_id", "provider", unique=True),
+    )
 
     # Relationships
     user = relationship("User", back_populates="account_tokens")
@@ -1,7 +1,6 @@
 from sqlalchemy import Column, String, Text, Float, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, UUIDType
 
 
 class AIThreadSummary(BaseModel):
@@ -9,9 +8,10 @@ class AIThreadSummary(BaseModel):
 
     __tablename__ = "ai_thread_summary"
 
-    thread_id = Column(UUID(as_uuid=True), ForeignKey("threads.id"), nullable=False, unique=True, index=True)
+    thread_id = Column(UUIDType, ForeignKey("threads.id"), nullable=False, unique=True, index=True)
     summary_text = Column(Text, nullable=False)
     model_used = Column(String, nullable=False)
+    content_hash = Column(String(64), index=True)  # Hash of the prompt that produced this result
 
     # Relationships
     thread = relationship("Thread", back_populates="summary")
@@ -25,9 +25,10 @@ class AIPriority(BaseModel):
 
     __tablename__ = "ai_priority"
 
-    thread_id = Column(UUID(as_uuid=True), ForeignKey("threads.id"), nullable=False, unique=True, index=True)
+    thread_id = Column(UUIDType, ForeignKey("threads.id"), nullable=False, unique=True, index=True)
     priority_level = Column(String, nullable=False)  # urgent, customer, vendor, internal, low
     category = Column(String, nullable=False)
+    content_hash = Column(String(64), index=True)  # Hash of the prompt that produced this result
 
     # Relationships
     thread = relationship("Thread", back_populates="priority")
@@ -41,11 +42,12 @@ class AISentiment(BaseModel):
 
     __tablename__ = "ai_sentiment"
 
-    thread_id = Column(UUID(as_uuid=True), ForeignKey("threads.id"), nullable=False, unique=True, index=True)
+    thread_id = Column(UUIDType, ForeignKey("threads.id"), nullable=False, unique=True, index=True)
     sentiment_score = Column(Float, nullable=False)  # -1.0 to 1.0
     sentiment_label = Column(String, nullable=False)  # positive, neutral, negative
     anger_level = Column(Float, nullable=False)  # 0.0 to 1.0
     urgency_score = Column(Float, nullable=False)  # 0.0 to 1.0
+    content_hash = Column(String(64), index=True)  # Hash of the prompt that produced this result
 
     # Relationships
     thread = relationship("Thread", back_populates="sentiment")
@@ -59,9 +61,10 @@ class AIReplyDraft(BaseModel):
 
     __tablename__ = "ai_reply_draft"
 
-    thread_id = Column(UUID(as_uuid=True), ForeignKey("threads.id"), nullable=False, unique=True, index=True)
+    thread_id = Column(UUIDType, ForeignKey("threads.id"), nullable=False, unique=True, index=True)
     draft_text = Column(Text, nullable=False)
     tone_used = Column(String, nullable=False)
+    content_hash = Column(String(64), index=True)  # Hash of the prompt that produced this result
 
     # Relationships
     thread = relationship("Thread", back_populates="reply_draft")
@@ -6,13 +6,22 @@ from sqlalchemy.orm import declarative_base
 
 Base = declarative_base()
 
+# Postgres uuid columns surfaced as plain strings: skips building a uuid.UUID
+# per PK/FK column on every loaded row. The database type is unchanged.
+UUIDType = UUID(as_uuid=False)
+
+
+def generate_uuid() -> str:
+    """Default for primary keys"""
+    return str(uuid.uuid4())
+
 
 class BaseModel(Base):
     """Base model with common fields"""
 
     __abstract__ = True
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUIDType, primary_key=True, default=generate_uuid, index=True)
     created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
 
     def dict(self):
@@ -1,8 +1,8 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, DDL, event
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
-from .base import BaseModel
+from .base import BaseModel, UUIDType
 
 
 class CompanyContext(BaseModel):
@@ -10,13 +10,15 @@ class CompanyContext(BaseModel):
 
     __tablename__ = "company_context"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, unique=True, index=True)
+    user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False, unique=True, index=True)
     tone = Column(Text)  # Tone guidelines
     company_description = Column(Text)
-    products = Column(JSONB)  # List of products/services
-    policies = Column(JSONB)  # Company policies
-    faq = Column(JSONB)  # Frequently asked questions
-    roles = Column(JSONB)  # Team roles and responsibilities
+    # JSONB payload is deferred as one group: loaded together on first access
+    # or via undefer_group("payload")
+    products = deferred(Column(JSONB), group="payload")  # List of products/services
+    policies = deferred(Column(JSONB), group="payload")  # Company policies
+    faq = deferred(Column(JSONB), group="payload")  # Frequently asked questions
+    roles = deferred(Column(JSONB), group="payload")  # Team roles and responsibilities
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
@@ -24,3 +26,31 @@ class CompanyContext(BaseModel):
 
     def __repr__(self):
         return f"<CompanyContext(id={self.id}, user_id={self.user_id})>"
+
+
+# Every committed write to company_context NOTIFYs this channel with the
+# row's user_id, so cached copies are invalidated whichever code path wrote it.
+# Created with the table only; the API routes also invalidate explicitly.
+COMPANY_CONTEXT_CHANNEL = "company_context_changed"
+
+event.listen(
+    CompanyContext.__table__,
+    "after_create",
+    DDL(f"""
+        CREATE OR REPLACE FUNCTION notify_company_context_changed() RETURNS trigger AS $$
+        BEGIN
+            PERFORM pg_notify('{COMPANY_CONTEXT_CHANNEL}', COALESCE(NEW.user_id, OLD.user_id)::text);
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """),
+)
+event.listen(
+    CompanyContext.__table__,
+    "after_create",
+    DDL("""
+        CREATE TRIGGER company_context_notify
+        AFTER INSERT OR UPDATE OR DELETE ON company_context
+        FOR EACH ROW EXECUTE FUNCTION notify_company_context_changed()
+    """),
+)
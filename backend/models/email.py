@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from .base import BaseModel
+from sqlalchemy import Column, String, Text, DateTime, ForeignKey, Index, Computed
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
+from .base import BaseModel, UUIDType
 
 
 class Email(BaseModel):
@@ -9,14 +9,41 @@ class Email(BaseModel):
 
     __tablename__ = "emails"
 
-    thread_id = Column(UUID(as_uuid=True), ForeignKey("threads.id"), nullable=False, index=True)
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    thread_id = Column(UUIDType, ForeignKey("threads.id"), nullable=False)
+    user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False)
     email_id_provider = Column(String, nullable=False, unique=True, index=True)  # Gmail/Outlook email ID
     sender = Column(String, nullable=False)
-    recipients = Column(JSONB, nullable=False)  # List of recipient emails
+    # Large columns are deferred; undefer them where they are actually read
+    recipients = deferred(Column(JSONB, nullable=False))  # List of recipient emails
     body_html_url = Column(String)  # S3/R2 URL for HTML content
-    body_text_clean = Column(Text)  # Clean text version
-    timestamp = Column(DateTime, nullable=False, index=True)
+    body_text_clean = deferred(Column(Text))  # Clean text version
+    timestamp = Column(DateTime, nullable=False)
+    # Tokenized body maintained by Postgres on write, for indexed full-text search
+    body_tsv = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(body_text_clean, ''))", persisted=True),
+    ))
+
+    # Ordered scans of a thread's / user's emails; these also cover the
+    # plain thread_id and user_id foreign-key lookups
+    __table_args__ = (
+        Index("ix_emails_thread_ts", "thread_id", "timestamp"),
+        Index("ix_emails_user_ts", "user_id", "timestamp"),
+        # Rows arrive roughly in timestamp order, so a BRIN index serves
+        # time-range scans at a fraction of a B-tree's size
+        Index(
+            "ix_emails_ts_brin",
+            "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        Index("ix_emails_body_tsv", "body_tsv", postgresql_using="gin"),
+    )
+
+    # Don't fetch the generated tsvector back with RETURNING on insert: it is
+    # deferred and not read there, and the RETURNING path can't match string
+    # UUID keys to rows when several inserts are flushed together
+    __mapper_args__ = {"eager_defaults": False}
 
     # Relationships
     thread = relationship("Thread", back_populates="emails")
@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, Text, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
-from .base import BaseModel
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import relationship, deferred
+from .base import BaseModel, UUIDType
 
 
 class Integration(BaseModel):
@@ -9,12 +9,12 @@ class Integration(BaseModel):
 
     __tablename__ = "integrations"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False, index=True)
     type = Column(String, nullable=False)  # slack, notion, clickup, jira, trello
     access_token = Column(Text, nullable=False)
     refresh_token = Column(Text)
     workspace_id = Column(String)  # Slack workspace, Notion workspace, etc.
-    extra_data = Column(JSONB)  # Additional integration-specific data
+    extra_data = deferred(Column(JSONB))  # Additional integration-specific data
 
     # Relationships
     user = relationship("User", back_populates="integrations")
@@ -1,7 +1,6 @@
-from sqlalchemy import Column, String, Text, Integer, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy import Column, String, Text, Integer, ForeignKey, Index
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, UUIDType
 
 
 class SyncJobLog(BaseModel):
@@ -9,7 +8,7 @@ class SyncJobLog(BaseModel):
 
     __tablename__ = "sync_job_logs"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
+    user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False)
     provider = Column(String, nullable=False)  # gmail or outlook
     status = Column(String, nullable=False)  # success, error
     run_time_ms = Column(Integer)
@@ -20,3 +19,14 @@ class SyncJobLog(BaseModel):
 
     def __repr__(self):
         return f"<SyncJobLog(id={self.id}, provider={self.provider}, status={self.status})>"
+
+
+# Latest log per provider for a user (DISTINCT ON provider, newest first);
+# also serves plain user_id lookups. Declared after the class because it
+# needs the inherited created_at column.
+Index(
+    "ix_sync_job_logs_user_provider_created",
+    SyncJobLog.user_id,
+    SyncJobLog.provider,
+    SyncJobLog.created_at.desc(),
+)
@@ -1,7 +1,6 @@
 from sqlalchemy import Column, String, Text, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, UUIDType
 
 
 class Task(BaseModel):
@@ -9,7 +8,7 @@ class Task(BaseModel):
 
     __tablename__ = "tasks"
 
-    thread_id = Column(UUID(as_uuid=True), ForeignKey("threads.id"), nullable=False, index=True)
+    thread_id = Column(UUIDType, ForeignKey("threads.id"), nullable=False, index=True)
     title = Column(String, nullable=False)
     description = Column(Text)
     due_date = Column(DateTime)
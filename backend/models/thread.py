@@ -1,7 +1,7 @@
-from sqlalchemy import Column, String, DateTime, ForeignKey
-from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.orm import relationship
-from .base import BaseModel
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index, Computed, DDL, event, func
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import relationship, deferred
+from .base import BaseModel, UUIDType
 
 
 class Thread(BaseModel):
@@ -9,14 +9,36 @@ class Thread(BaseModel):
 
     __tablename__ = "threads"
 
-    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False, index=True)
-    thread_id_provider = Column(String, nullable=False, index=True)  # Gmail/Outlook thread ID
+    user_id = Column(UUIDType, ForeignKey("users.id"), nullable=False)
+    thread_id_provider = Column(String, nullable=False)  # Gmail/Outlook thread ID
     subject = Column(String, nullable=False)
     last_message_at = Column(DateTime, nullable=False)
+    provider = Column(String(16), index=True)  # gmail or outlook, set at sync time
+    # Tokenized subject maintained by Postgres on write, for ranked full-text search
+    subject_tsv = deferred(Column(
+        TSVECTOR,
+        Computed("to_tsvector('english', coalesce(subject, ''))", persisted=True),
+    ))
+
+    __table_args__ = (
+        # Provider-ID lookups are always scoped to the user
+        Index("ix_threads_user_provider_id", "user_id", "thread_id_provider"),
+        # Trigram index for substring search on subject (lower(subject) LIKE '%x%')
+        Index(
+            "ix_threads_subject_trgm",
+            func.lower(subject).label("subject_lower"),
+            postgresql_using="gin",
+            postgresql_ops={"subject_lower": "gin_trgm_ops"},
+        ),
+        Index("ix_threads_subject_tsv", "subject_tsv", postgresql_using="gin"),
+    )
+
+    # Same as Email: no RETURNING fetch of the generated tsvector on insert
+    __mapper_args__ = {"eager_defaults": False}
 
     # Relationships
     user = relationship("User", back_populates="threads")
-    emails = relationship("Email", back_populates="thread", cascade="all, delete-orphan")
+    emails = relationship("Email", back_populates="thread", cascade="all, delete-orphan", order_by="Email.timestamp")
     summary = relationship("AIThreadSummary", back_populates="thread", uselist=False, cascade="all, delete-orphan")
     priority = relationship("AIPriority", back_populates="thread", uselist=False, cascade="all, delete-orphan")
     sentiment = relationship("AISentiment", back_populates="thread", uselist=False, cascade="all, delete-orphan")
@@ -25,3 +47,16 @@ class Thread(BaseModel):
 
     def __repr__(self):
         return f"<Thread(id={self.id}, subject={self.subject[:50]})>"
+
+
+# Thread lists are per user, newest first (id breaks ties for keyset
+# pagination); also serves plain user_id lookups. Declared after the class
+# because it needs the mapped id column.
+Index("ix_threads_user_last", Thread.user_id, Thread.last_message_at.desc(), Thread.id.desc())
+
+# gin_trgm_ops comes from the pg_trgm extension
+event.listen(
+    Thread.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
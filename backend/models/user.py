@@ -1,5 +1,5 @@
 from sqlalchemy import Column, String, DateTime
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import relationship, deferred
 from datetime import datetime
 from .base import BaseModel
 
@@ -11,7 +11,8 @@ class User(BaseModel):
 
     name = Column(String, nullable=False)
     email = Column(String, unique=True, nullable=False, index=True)
-    password_hash = Column(String, nullable=False)
+    # Only login and password changes read it; undefer it there
+    password_hash = deferred(Column(String, nullable=False))
 
     # Relationships
     account_tokens = relationship("AccountToken", back_populates="user", cascade="all, delete-orphan")
@@ -1,4 +1,4 @@
 # API routers package
-from . import auth, users, emails, threads, context, ai, integrations
+from . import auth, users, emails, threads, context, ai, integrations, webhooks
 
-__all__ = ["auth", "users", "emails", "threads", "context", "ai", "integrations"]
+__all__ = ["auth", "users", "emails", "threads", "context", "ai", "integrations", "webhooks"]
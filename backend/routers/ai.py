@@ -1,7 +1,9 @@
+import asyncio
 from fastapi import APIRouter, Depends, Query
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
-from db import get_db
+from db import get_db, SessionLocal
 from models import User, Thread
 from schemas import (
     AIProcessRequest,
@@ -10,6 +12,7 @@ from schemas import (
     AISentimentResponse,
     AIReplyDraftResponse,
     AIReplyRegenerateRequest,
+    AIProcessAllResponse,
     TaskExtractionResponse,
     TaskResponse,
 )
@@ -29,7 +32,7 @@ logger = logging.getLogger(__name__)
 
 
 @router.post("/summarize", response_model=AISummaryResponse)
-def summarize_thread(
+async def summarize_thread(
     request: AIProcessRequest,
     force: bool = Query(False, description="Force regeneration even if summary exists"),
     current_user: User = Depends(get_current_user),
@@ -46,10 +49,12 @@ def summarize_thread(
     The AI will generate a concise 2-3 sentence summary of the thread.
     """
     try:
-        service = SummarizationService(db, current_user)
-        summary = service.summarize_thread(
-            thread_id=str(request.thread_id),
-            force_regenerate=force
+        # Service setup and the LLM call both block; run them off the event loop
+        summary = await run_in_threadpool(
+            lambda: SummarizationService(db, current_user).summarize_thread(
+                thread_id=request.thread_id,
+                force_regenerate=force
+            )
         )
         return summary
     except ValueError as e:
@@ -60,7 +65,7 @@ def summarize_thread(
 
 
 @router.post("/classify", response_model=AIPriorityResponse)
-def classify_priority(
+async def classify_priority(
     request: AIProcessRequest,
     force: bool = Query(False, description="Force reclassification"),
     current_user: User = Depends(get_current_user),
@@ -76,10 +81,12 @@ def classify_priority(
     Uses company context to better understand priorities.
     """
     try:
-        service = ClassificationService(db, current_user)
-        priority = service.classify_thread(
-            thread_id=str(request.thread_id),
-            force_regenerate=force
+        # Service setup and the LLM call both block; run them off the event loop
+        priority = await run_in_threadpool(
+            lambda: ClassificationService(db, current_user).classify_thread(
+                thread_id=request.thread_id,
+                force_regenerate=force
+            )
         )
         return priority
     except ValueError as e:
@@ -90,7 +97,7 @@ def classify_priority(
 
 
 @router.post("/sentiment", response_model=AISentimentResponse)
-def analyze_sentiment(
+async def analyze_sentiment(
     request: AIProcessRequest,
     force: bool = Query(False, description="Force re-analysis"),
     current_user: User = Depends(get_current_user),
@@ -108,10 +115,12 @@ def analyze_sentiment(
     Useful for detecting frustrated customers and escalating appropriately.
     """
     try:
-        service = SentimentAnalysisService(db, current_user)
-        sentiment = service.analyze_thread(
-            thread_id=str(request.thread_id),
-            force_regenerate=force
+        # Service setup and the LLM call both block; run them off the event loop
+        sentiment = await run_in_threadpool(
+            lambda: SentimentAnalysisService(db, current_user).analyze_thread(
+                thread_id=request.thread_id,
+                force_regenerate=force
+            )
         )
         return sentiment
     except ValueError as e:
@@ -122,7 +131,7 @@ def analyze_sentiment(
 
 
 @router.post("/reply", response_model=AIReplyDraftResponse)
-def generate_reply(
+async def generate_reply(
     request: AIProcessRequest,
     tone: Optional[str] = Query(None, description="Desired tone (overrides company context)"),
     force: bool = Query(False, description="Force regeneration"),
@@ -140,11 +149,13 @@ def generate_reply(
     The draft is ready to review and send - NO automatic sending!
     """
     try:
-        service = ReplyGenerationService(db, current_user)
-        draft = service.generate_reply(
-            thread_id=str(request.thread_id),
-            tone=tone,
-            force_regenerate=force
+        # Service setup and the LLM call both block; run them off the event loop
+        draft = await run_in_threadpool(
+            lambda: ReplyGenerationService(db, current_user).generate_reply(
+                thread_id=request.thread_id,
+                tone=tone,
+                force_regenerate=force
+            )
         )
         return draft
     except ValueError as e:
@@ -155,7 +166,7 @@ def generate_reply(
 
 
 @router.post("/reply/regenerate", response_model=AIReplyDraftResponse)
-def regenerate_reply(
+async def regenerate_reply(
     request: AIReplyRegenerateRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -171,10 +182,12 @@ def regenerate_reply(
     - "more empathetic" - Show more understanding
     """
     try:
-        service = ReplyGenerationService(db, current_user)
-        draft = service.regenerate_with_style(
-            thread_id=str(request.thread_id),
-            style=request.tone
+        # Service setup and the LLM call both block; run them off the event loop
+        draft = await run_in_threadpool(
+            lambda: ReplyGenerationService(db, current_user).regenerate_with_style(
+                thread_id=str(request.thread_id),
+                style=request.tone
+            )
         )
         return draft
     except ValueError as e:
@@ -184,8 +197,74 @@ def regenerate_reply(
         raise ExternalServiceError(f"Failed to regenerate reply: {str(e)}")
 
 
+def _in_new_session(fn, user_id: str):
+    """
+    Run fn(db, user) with a dedicated session
+
+    Used for concurrent fan-out: the request session, and the current
+    user bound to it, can't be shared across threads, so the user is
+    loaded again in the new session.
+    """
+    db = SessionLocal()
+    try:
+        return fn(db, db.get(User, user_id))
+    finally:
+        db.close()
+
+
+@router.post("/process-all", response_model=AIProcessAllResponse)
+async def process_all(
+    request: AIProcessRequest,
+    force: bool = Query(False, description="Force regeneration of all results"),
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Summarize, classify and analyze sentiment for a thread in one call
+
+    The three AI jobs run concurrently, so latency is that of the slowest
+    one rather than the sum of all three.
+    """
+    thread_id = request.thread_id
+    user_id = current_user.id
+
+    def summarize(db: Session, user: User):
+        summary = SummarizationService(db, user).summarize_thread(
+            thread_id=thread_id, force_regenerate=force
+        )
+        return AISummaryResponse.model_validate(summary)
+
+    def classify(db: Session, user: User):
+        priority = ClassificationService(db, user).classify_thread(
+            thread_id=thread_id, force_regenerate=force
+        )
+        return AIPriorityResponse.model_validate(priority)
+
+    def sentiment(db: Session, user: User):
+        result = SentimentAnalysisService(db, user).analyze_thread(
+            thread_id=thread_id, force_regenerate=force
+        )
+        return AISentimentResponse.model_validate(result)
+
+    try:
+        summary, priority, sentiment_result = await asyncio.gather(
+            run_in_threadpool(_in_new_session, summarize, user_id),
+            run_in_threadpool(_in_new_session, classify, user_id),
+            run_in_threadpool(_in_new_session, sentiment, user_id),
+        )
+        return AIProcessAllResponse(
+            summary=summary,
+            priority=priority,
+            sentiment=sentiment_result,
+        )
+    except ValueError as e:
+        raise NotFoundError(str(e))
+    except Exception as e:
+        logger.error(f"Process-all error: {str(e)}", exc_info=True)
+        raise ExternalServiceError(f"Failed to process thread: {str(e)}")
+
+
 @router.post("/tasks/extract", response_model=TaskExtractionResponse)
-def extract_tasks(
+async def extract_tasks(
     request: AIProcessRequest,
     force: bool = Query(False, description="Force re-extraction"),
     current_user: User = Depends(get_current_user),
@@ -204,14 +283,16 @@ def extract_tasks(
     Only extracts explicit action items - doesn't hallucinate tasks.
     """
     try:
-        service = TaskExtractionService(db, current_user)
-        tasks = service.extract_tasks(
-            thread_id=str(request.thread_id),
-            force_regenerate=force
+        # Service setup and the LLM call both block; run them off the event loop
+        tasks = await run_in_threadpool(
+            lambda: TaskExtractionService(db, current_user).extract_tasks(
+                thread_id=request.thread_id,
+                force_regenerate=force
+            )
         )
         return TaskExtractionResponse(
             thread_id=request.thread_id,
-            tasks=[TaskResponse.from_orm(task) for task in tasks]
+            tasks=[TaskResponse.model_validate(task) for task in tasks]
         )
     except ValueError as e:
         raise NotFoundError(str(e))
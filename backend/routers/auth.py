@@ -1,47 +1,81 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from fastapi.responses import RedirectResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import HTMLResponse, RedirectResponse
+from sqlalchemy.orm import Session, undefer
 from db import get_db
 from models import User
 from schemas import UserSignup, UserLogin, Token, OAuth2CallbackResponse
 from app.dependencies import get_current_user
 from core import (
-    verify_password,
+    verify_and_update_password,
     get_password_hash,
+    run_kdf,
+    load_user,
+    invalidate_user_cache,
     create_access_token,
     create_refresh_token,
     ConflictError,
     AuthenticationError,
 )
+import json
 import logging
+import string
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+def _redirect_to(request: Request, endpoint: str) -> RedirectResponse:
+    """308 to a canonical route, keeping the method, body and query string"""
+    url = str(request.app.url_path_for(endpoint))
+    if request.url.query:
+        url = f"{url}?{request.url.query}"
+    return RedirectResponse(url=url, status_code=308)
+
+
+# Aliases for frontend compatibility
+@router.post("/register", include_in_schema=False)
+def register_alias(request: Request):
+    return _redirect_to(request, "signup")
+
+
+@router.get("/gmail/authorize", include_in_schema=False)
+def gmail_authorize_alias(request: Request):
+    return _redirect_to(request, "google_oauth_start")
+
+
+@router.get("/outlook/authorize", include_in_schema=False)
+def outlook_authorize_alias(request: Request):
+    return _redirect_to(request, "outlook_oauth_start")
+
+
 @router.post("/signup", response_model=Token)
-@router.post("/register", response_model=Token)  # Alias for frontend compatibility
-def signup(user_data: UserSignup, db: Session = Depends(get_db)):
+async def signup(user_data: UserSignup, db: Session = Depends(get_db)):
     """
     User signup endpoint
 
     Creates a new user account and returns JWT tokens
     """
     # Check if user already exists
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_in_threadpool(
+        lambda: db.query(User).filter(User.email == user_data.email).first()
+    )
     if existing_user:
         raise ConflictError("Email already registered")
 
-    # Create new user
+    # Create new user; the KDF runs on its own executor, off the event loop
     new_user = User(
         name=user_data.name,
         email=user_data.email,
-        password_hash=get_password_hash(user_data.password),
+        password_hash=await run_kdf(get_password_hash, user_data.password),
     )
 
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    def _save():
+        db.add(new_user)
+        db.commit()
+        db.refresh(new_user)
+
+    await run_in_threadpool(_save)
 
     logger.info(f"New user created: {new_user.email}")
 
@@ -53,26 +87,43 @@ def signup(user_data: UserSignup, db: Session = Depends(get_db)):
 
 
 @router.post("/login", response_model=Token)
-def login(credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(credentials: UserLogin, db: Session = Depends(get_db)):
     """
     User login endpoint
 
     Authenticates user and returns JWT tokens
     """
     # Find user
-    user = db.query(User).filter(User.email == credentials.email).first()
+    user = await run_in_threadpool(
+        lambda: db.query(User)
+        .options(undefer(User.password_hash))
+        .filter(User.email == credentials.email)
+        .first()
+    )
     if not user:
         raise AuthenticationError("Invalid email or password")
 
     # Verify password
-    if not verify_password(credentials.password, user.password_hash):
+    is_valid, new_hash = await run_kdf(
+        verify_and_update_password, credentials.password, user.password_hash
+    )
+    if not is_valid:
         raise AuthenticationError("Invalid email or password")
 
-    logger.info(f"User logged in: {user.email}")
+    # Read before any commit expires them; a reload here would block the loop
+    user_id, user_email = str(user.id), user.email
+
+    # Upgrade legacy hashes while the plaintext is at hand
+    if new_hash:
+        user.password_hash = new_hash
+        await run_in_threadpool(db.commit)
+        invalidate_user_cache(user_id)
+
+    logger.info(f"User logged in: {user_email}")
 
     # Generate tokens
-    access_token = create_access_token(data={"sub": str(user.id)})
-    refresh_token = create_refresh_token(data={"sub": str(user.id)})
+    access_token = create_access_token(data={"sub": user_id})
+    refresh_token = create_refresh_token(data={"sub": user_id})
 
     return Token(access_token=access_token, refresh_token=refresh_token)
 
@@ -111,7 +162,7 @@ def get_user_from_token(token: str = None, db: Session = Depends(get_db)) -> Use
         logger.error("No user_id in token payload")
         raise AuthenticationError("Invalid token payload")
 
-    user = db.query(User).filter(User.id == user_id).first()
+    user = load_user(db, user_id)
     if not user:
         logger.error(f"User not found for id: {user_id}")
         raise AuthenticationError("User not found")
@@ -122,13 +173,12 @@ def get_user_from_token(token: str = None, db: Session = Depends(get_db)) -> Use
 
 # OAuth endpoints
 @router.get("/google/start", dependencies=[])
-@router.get("/gmail/authorize", dependencies=[])  # Alias for frontend compatibility
 def google_oauth_start(token: str = None, db: Session = Depends(get_db)):
     """
     Start Google OAuth flow
     Redirects to Google OAuth consent screen
     """
-    from services import GmailOAuthService
+    from services import gmail_oauth_service
 
     logger.info(f"google_oauth_start called with token={token is not None}")
 
@@ -136,8 +186,7 @@ def google_oauth_start(token: str = None, db: Session = Depends(get_db)):
         # Get user from token query parameter
         current_user = get_user_from_token(token, db)
 
-        oauth_service = GmailOAuthService()
-        auth_url = oauth_service.get_authorization_url(state=str(current_user.id))
+        auth_url = gmail_oauth_service.get_authorization_url(state=str(current_user.id))
 
         logger.info(f"Redirecting user {current_user.email} to Google OAuth")
         return RedirectResponse(url=auth_url)
@@ -151,7 +200,7 @@ def google_oauth_start(token: str = None, db: Session = Depends(get_db)):
 
 
 @router.get("/google/callback", dependencies=[])
-def google_oauth_callback(
+async def google_oauth_callback(
     code: str,
     state: str,
     db: Session = Depends(get_db)
@@ -160,23 +209,22 @@ def google_oauth_callback(
     Handle Google OAuth callback
     Exchanges code for tokens and stores them
     """
-    from services import GmailOAuthService
+    from services import gmail_oauth_service
 
     try:
         # Get user from state parameter
-        user = db.query(User).filter(User.id == state).first()
+        user = await run_in_threadpool(load_user, db, state)
         if not user:
             raise AuthenticationError("Invalid state parameter")
 
-        oauth_service = GmailOAuthService()
+        # Exchange code for tokens (blocking HTTP to the provider)
+        tokens = await run_in_threadpool(gmail_oauth_service.exchange_code_for_tokens, code)
 
-        # Exchange code for tokens
-        tokens = oauth_service.exchange_code_for_tokens(code)
+        # save_tokens commits, which expires the user; read the email first
+        user_email = user.email
+        await run_in_threadpool(gmail_oauth_service.save_tokens, db, user, tokens)
 
-        # Save tokens
-        oauth_service.save_tokens(db, user, tokens)
-
-        logger.info(f"Gmail connected for user {user.email}: {tokens['email_address']}")
+        logger.info(f"Gmail connected for user {user_email}: {tokens['email_address']}")
 
         return OAuth2CallbackResponse(
             success=True,
@@ -195,20 +243,18 @@ def google_oauth_callback(
 
 
 @router.get("/outlook/start", dependencies=[])
-@router.get("/outlook/authorize", dependencies=[])  # Alias for frontend compatibility
 def outlook_oauth_start(token: str = None, db: Session = Depends(get_db)):
     """
     Start Microsoft OAuth flow
     Redirects to Microsoft OAuth consent screen
     """
-    from services import OutlookOAuthService
+    from services import outlook_oauth_service
 
     try:
         # Get user from token query parameter
         current_user = get_user_from_token(token, db)
 
-        oauth_service = OutlookOAuthService()
-        auth_url = oauth_service.get_authorization_url(state=str(current_user.id))
+        auth_url = outlook_oauth_service.get_authorization_url(state=str(current_user.id))
 
         logger.info(f"Redirecting user {current_user.email} to Microsoft OAuth")
         return RedirectResponse(url=auth_url)
@@ -222,7 +268,7 @@ def outlook_oauth_start(token: str = None, db: Session = Depends(get_db)):
 
 
 @router.get("/outlook/callback", dependencies=[])
-def outlook_oauth_callback(
+async def outlook_oauth_callback(
     code: str,
     state: str,
     db: Session = Depends(get_db)
@@ -231,23 +277,22 @@ def outlook_oauth_callback(
     Handle Microsoft OAuth callback
     Exchanges code for tokens and stores them
     """
-    from services import OutlookOAuthService
+    from services import outlook_oauth_service
 
     try:
         # Get user from state parameter
-        user = db.query(User).filter(User.id == state).first()
+        user = await run_in_threadpool(load_user, db, state)
         if not user:
             raise AuthenticationError("Invalid state parameter")
 
-        oauth_service = OutlookOAuthService()
-
-        # Exchange code for tokens
-        tokens = oauth_service.exchange_code_for_tokens(code)
+        # Exchange code for tokens (blocking HTTP to the provider)
+        tokens = await run_in_threadpool(outlook_oauth_service.exchange_code_for_tokens, code)
 
-        # Save tokens
-        oauth_service.save_tokens(db, user, tokens)
+        # save_tokens commits, which expires the user; read the email first
+        user_email = user.email
+        await run_in_threadpool(outlook_oauth_service.save_tokens, db, user, tokens)
 
-        logger.info(f"Outlook connected for user {user.email}: {tokens['email_address']}")
+        logger.info(f"Outlook connected for user {user_email}: {tokens['email_address']}")
 
         return OAuth2CallbackResponse(
             success=True,
@@ -304,39 +349,51 @@ def get_connected_accounts(
         )
 
 
-@router.get("/extension-login-success", include_in_schema=False)
-async def extension_login_success(access_token: str, refresh_token: str):
-    """
-    Handles successful login for Chrome extension.
-    Sends tokens back to the extension using window.postMessage.
-    """
-    html_content = f"""
+# Compiled once; token values are substituted as JSON string literals
+_EXTENSION_LOGIN_SUCCESS_TEMPLATE = string.Template("""
     <!DOCTYPE html>
     <html>
     <head>
         <title>Login Success</title>
         <script>
-            window.onload = function() {{
-                if (window.opener) {{
-                    const message = {{
+            window.onload = function() {
+                if (window.opener) {
+                    const message = {
                         type: 'INBOX_MANAGER_AUTH_SUCCESS',
-                        access_token: '{access_token}',
-                        refresh_token: '{refresh_token}'
-                    }};
+                        access_token: $access_token,
+                        refresh_token: $refresh_token
+                    };
                     // Replace '*' with the actual Chrome extension ID for security in production
                     // During development, '*' might be acceptable if the extension's origin is dynamic.
                     // For example: 'chrome-extension://YOUR_EXTENSION_ID'
                     window.opener.postMessage(message, '*');
                     window.close();
-                }} else {{
+                } else {
                     document.body.innerHTML = '<h1>Login Successful!</h1><p>You can close this window.</p>';
-                }}
-            }};
+                }
+            };
         </script>
     </head>
     <body>
         <p>Processing login...</p>
     </body>
     </html>
+    """)
+
+
+def _js_string(value: str) -> str:
+    """JSON-encode a value for a <script> block (escapes quotes and '<')"""
+    return json.dumps(value).replace("<", "\\u003c")
+
+
+@router.get("/extension-login-success", include_in_schema=False)
+async def extension_login_success(access_token: str, refresh_token: str):
     """
+    Handles successful login for Chrome extension.
+    Sends tokens back to the extension using window.postMessage.
+    """
+    html_content = _EXTENSION_LOGIN_SUCCESS_TEMPLATE.substitute(
+        access_token=_js_string(access_token),
+        refresh_token=_js_string(refresh_token),
+    )
     return HTMLResponse(content=html_content, status_code=200)
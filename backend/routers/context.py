@@ -1,9 +1,12 @@
+from datetime import datetime
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, undefer_group
 from db import get_db
 from models import User, CompanyContext
 from schemas import CompanyContextCreate, CompanyContextUpdate, CompanyContextResponse
 from app.dependencies import get_current_user
+from services.ai_orchestrator import invalidate_company_context
 import logging
 
 router = APIRouter()
@@ -18,6 +21,7 @@ def get_company_context(
     """Get company context for current user"""
     context = (
         db.query(CompanyContext)
+        .options(undefer_group("payload"))
         .filter(CompanyContext.user_id == current_user.id)
         .first()
     )
@@ -39,33 +43,21 @@ def update_company_context(
     db: Session = Depends(get_db),
 ):
     """Update company context"""
-    context = (
-        db.query(CompanyContext)
-        .filter(CompanyContext.user_id == current_user.id)
-        .first()
-    )
+    # Only fields the client sent (None means "leave unchanged")
+    changes = context_data.model_dump(exclude_unset=True, exclude_none=True)
 
-    if not context:
-        # Create new context
-        context = CompanyContext(user_id=current_user.id)
-        db.add(context)
-
-    # Update fields
-    if context_data.tone is not None:
-        context.tone = context_data.tone
-    if context_data.company_description is not None:
-        context.company_description = context_data.company_description
-    if context_data.products is not None:
-        context.products = context_data.products
-    if context_data.policies is not None:
-        context.policies = context_data.policies
-    if context_data.faq is not None:
-        context.faq = context_data.faq
-    if context_data.roles is not None:
-        context.roles = context_data.roles
+    # Create-or-update in one statement; RETURNING replaces the refresh SELECT
+    stmt = pg_insert(CompanyContext).values(
+        user_id=current_user.id, updated_at=datetime.utcnow(), **changes
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CompanyContext.user_id],
+        set_={key: stmt.excluded[key] for key in (*changes, "updated_at")},
+    ).returning(*CompanyContext.__table__.columns)
 
+    context = dict(db.execute(stmt).mappings().one())
     db.commit()
-    db.refresh(context)
+    invalidate_company_context(current_user.id)
 
     logger.info(f"Company context updated for user: {current_user.email}")
     return context
@@ -91,6 +83,7 @@ def delete_context_section(
     if hasattr(context, section):
         setattr(context, section, None)
         db.commit()
+        invalidate_company_context(current_user.id)
         return {"message": f"Section '{section}' cleared"}
 
     return {"error": f"Section '{section}' not found"}
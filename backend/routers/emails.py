@@ -1,7 +1,9 @@
 from fastapi import APIRouter, Depends, Query, HTTPException
-from sqlalchemy.orm import Session
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, undefer
 from typing import List, Optional
 from pydantic import BaseModel
+from cachetools import TTLCache
 from db import get_db
 from models import User, Email, Thread, AccountToken
 from schemas import EmailResponse, EmailSyncRequest
@@ -15,6 +17,10 @@ import logging
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# (user_id, provider) pairs recently confirmed as connected. Only positive
+# results are cached; the send services still load the full token themselves.
+_connected_providers: TTLCache = TTLCache(maxsize=10000, ttl=60)
+
 
 @router.post("/sync")
 def trigger_email_sync(
@@ -85,13 +91,14 @@ def get_email(
     db: Session = Depends(get_db),
 ):
     """Get single email by ID"""
-    email = (
-        db.query(Email)
-        .filter(Email.id == email_id, Email.user_id == current_user.id)
-        .first()
+    # Primary-key get: served from the identity map when already loaded
+    email = db.get(
+        Email,
+        email_id,
+        options=[undefer(Email.recipients), undefer(Email.body_text_clean)],
     )
 
-    if not email:
+    if not email or email.user_id != current_user.id:
         raise NotFoundError("Email not found")
 
     return email
@@ -117,7 +124,7 @@ class SendReplyRequest(BaseModel):
 
 
 @router.post("/send")
-def send_email(
+async def send_email(
     request: SendEmailRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -138,41 +145,47 @@ def send_email(
     """
     try:
         # Check if user has connected the provider
-        account = (
-            db.query(AccountToken)
-            .filter(
-                AccountToken.user_id == current_user.id,
-                AccountToken.provider == request.provider
+        cache_key = (current_user.id, request.provider)
+        if cache_key not in _connected_providers:
+            connected = await run_in_threadpool(
+                lambda: db.query(AccountToken.id)
+                .filter(
+                    AccountToken.user_id == current_user.id,
+                    AccountToken.provider == request.provider
+                )
+                .first()
+                is not None
             )
-            .first()
-        )
 
-        if not account:
-            raise HTTPException(
-                status_code=400,
-                detail=f"{request.provider.capitalize()} account not connected"
-            )
+            if not connected:
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"{request.provider.capitalize()} account not connected"
+                )
+            _connected_providers[cache_key] = True
 
-        # Send via appropriate service
+        # Send via appropriate service; provider SDK calls block, keep them off the event loop
         if request.provider == 'gmail':
-            service = GmailService(db, current_user)
-            result = service.send_message(
-                to=request.to,
-                subject=request.subject,
-                body=request.body,
-                cc=request.cc,
-                bcc=request.bcc,
-                html=request.html
+            result = await run_in_threadpool(
+                lambda: GmailService.for_session(db, current_user).send_message(
+                    to=request.to,
+                    subject=request.subject,
+                    body=request.body,
+                    cc=request.cc,
+                    bcc=request.bcc,
+                    html=request.html
+                )
             )
         elif request.provider == 'outlook':
-            service = OutlookService(db, current_user)
-            result = service.send_message(
-                to=request.to,
-                subject=request.subject,
-                body=request.body,
-                is_html=request.html,
-                cc=request.cc,
-                bcc=request.bcc
+            result = await run_in_threadpool(
+                lambda: OutlookService.for_session(db, current_user).send_message(
+                    to=request.to,
+                    subject=request.subject,
+                    body=request.body,
+                    is_html=request.html,
+                    cc=request.cc,
+                    bcc=request.bcc
+                )
             )
         else:
             raise HTTPException(status_code=400, detail="Invalid provider")
@@ -194,7 +207,7 @@ def send_email(
 
 
 @router.post("/reply")
-def send_reply(
+async def send_reply(
     request: SendReplyRequest,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -216,42 +229,38 @@ def send_reply(
     - Use appropriate subject line (with Re: prefix)
     """
     try:
-        # Get the thread
-        thread = (
-            db.query(Thread)
+        # Thread plus its latest email's provider ID in one round trip
+        row = await run_in_threadpool(
+            lambda: db.query(Thread, Email.email_id_provider)
+            .outerjoin(Email, Email.thread_id == Thread.id)
             .filter(
                 Thread.id == request.thread_id,
                 Thread.user_id == current_user.id
             )
+            .order_by(Email.timestamp.desc())
             .first()
         )
 
-        if not thread:
+        if not row:
             raise HTTPException(status_code=404, detail="Thread not found")
 
-        # Get the latest email to determine provider
-        latest_email = (
-            db.query(Email)
-            .filter(Email.thread_id == thread.id)
-            .order_by(Email.received_at.desc())
-            .first()
-        )
-
-        if not latest_email:
+        thread, latest_email_id_provider = row
+        if not latest_email_id_provider:
             raise HTTPException(status_code=404, detail="No emails found in thread")
 
-        # Determine provider from the thread's provider ID format
-        # Gmail thread IDs are typically hex strings
-        # Outlook conversation IDs are longer alphanumeric strings
-        provider = None
-        if thread.thread_id_provider and len(thread.thread_id_provider) <= 20:
-            provider = 'gmail'
-        else:
-            provider = 'outlook'
+        # Provider is stored at sync time. Threads synced before the column
+        # existed fall back to the ID format: Gmail thread IDs are short hex
+        # strings, Outlook conversation IDs are longer
+        provider = thread.provider
+        if not provider:
+            if thread.thread_id_provider and len(thread.thread_id_provider) <= 20:
+                provider = 'gmail'
+            else:
+                provider = 'outlook'
 
         # Verify user has account connected
-        account = (
-            db.query(AccountToken)
+        account = await run_in_threadpool(
+            lambda: db.query(AccountToken)
             .filter(
                 AccountToken.user_id == current_user.id,
                 AccountToken.provider == provider
@@ -267,19 +276,21 @@ def send_reply(
 
         # Send reply via appropriate service
         if provider == 'gmail':
-            service = GmailService(db, current_user)
-            result = service.send_reply(
-                thread_id=thread.thread_id_provider,
-                body=request.body,
-                html=request.html
+            result = await run_in_threadpool(
+                lambda: GmailService.for_session(db, current_user).send_reply(
+                    thread_id=thread.thread_id_provider,
+                    body=request.body,
+                    html=request.html
+                )
             )
         else:  # outlook
-            service = OutlookService(db, current_user)
             # For Outlook, we need the message ID, not thread ID
-            result = service.send_reply(
-                message_id=latest_email.email_id_provider,
-                body=request.body,
-                is_html=request.html
+            result = await run_in_threadpool(
+                lambda: OutlookService.for_session(db, current_user).send_reply(
+                    message_id=latest_email_id_provider,
+                    body=request.body,
+                    is_html=request.html
+                )
             )
 
         logger.info(f"Reply sent to thread {request.thread_id} via {provider}")
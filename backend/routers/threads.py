@@ -1,57 +1,187 @@
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+import base64
+import hashlib
+import re
+import uuid
+from datetime import datetime
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, or_, tuple_
+from sqlalchemy.orm import Session, joinedload, load_only, raiseload, selectinload
+from typing import Any, Iterable, List, Optional, Tuple
+import orjson
 from db import get_db
-from models import User, Thread, AIPriority, AISentiment, AccountToken
-from schemas import ThreadListResponse, ThreadDetailResponse
+from models import User, Thread, Email, AIThreadSummary, AIPriority, AISentiment
+from schemas import (
+    ThreadListResponse,
+    ThreadDetailResponse,
+    AISummaryResponse,
+    AIPriorityResponse,
+    AISentimentResponse,
+    AIReplyDraftResponse,
+    TaskResponse,
+    TASK_LIST_ADAPTER,
+)
+from schemas._fast import to_fast_thread_detail
 from app.dependencies import get_current_user
+from core import BadRequestError
+from core.cache import cache_get, cache_set
 from services.gmail_service import GmailService
 import logging
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+# Gmail alias -> canonical thread ID resolutions (seconds)
+_GMAIL_RESOLVE_TTL = 86400
+_GMAIL_RESOLVE_MISS_TTL = 300
 
-def get_thread_with_fallback(db: Session, user: User, thread_id: str) -> Optional[Thread]:
+_UUID_RE = re.compile(
+    r"^[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}$"
+)
+
+# Thread reads are polled by the UI; unchanged results come back as bodiless 304s
+_CACHE_CONTROL = "private, max-age=10"
+
+_NDJSON = "application/x-ndjson"
+
+# The 1:1 AI results ride along in the thread SELECT as LEFT OUTER JOINs,
+# so the detail view doesn't lazy-load each one separately
+_AI_RESULT_LOADS = (
+    joinedload(Thread.summary),
+    joinedload(Thread.priority),
+    joinedload(Thread.sentiment),
+    joinedload(Thread.reply_draft),
+)
+
+
+def _encode_cursor(thread: Thread) -> str:
+    """Opaque keyset cursor for the page after ``thread``"""
+    raw = f"{thread.last_message_at.isoformat()}|{thread.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> Tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        timestamp, thread_id = raw.split("|", 1)
+        return datetime.fromisoformat(timestamp), str(uuid.UUID(thread_id))
+    except ValueError:
+        raise BadRequestError("Invalid cursor")
+
+
+def _conditional_response(request: Request, content: Any) -> Response:
+    """
+    Render JSON with an ETag, or a 304 if the client already has it
+
+    Args:
+        request: Incoming request (checked for If-None-Match)
+        content: JSON-compatible payload, or already encoded JSON bytes
+
+    Returns:
+        200 response with the body, or an empty 304
+    """
+    body = content if isinstance(content, bytes) else orjson.dumps(content)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _to_list_row(thread: Thread) -> dict:
+    """
+    Build a thread list item as a plain dict
+
+    Mirrors ThreadListResponse field for field. Rows are encoded straight
+    to bytes with orjson, so no schema instance is built or validated.
+    """
+    return {
+        "id": thread.id,
+        "subject": thread.subject,
+        "last_message_at": thread.last_message_at,
+        "priority": thread.priority.priority_level if thread.priority else None,
+        "sentiment_label": thread.sentiment.sentiment_label if thread.sentiment else None,
+        "has_summary": thread.summary is not None,
+        "email_count": 0,
+    }
+
+
+def _only(relationship):
+    """Eager-load one relationship and make touching any other one raise"""
+    return (selectinload(relationship), raiseload("*"))
+
+
+def _resolve_gmail_thread_id(db: Session, user: User, thread_id: str) -> Optional[str]:
+    """
+    Resolve a Gmail thread alias to its canonical ID, cached in Redis
+
+    Misses are cached briefly (as "") so bad IDs don't hit the Gmail API on
+    every poll.
+    """
+    key = f"gmail:resolve:{user.id}:{thread_id}"
+    cached = cache_get(key)
+    if cached is not None:
+        return cached or None
+
+    # GmailService already loads the account token
+    service = GmailService.for_session(db, user)
+    if not service.account_token:
+        return None
+
+    logger.info(f"Attempting to resolve Gmail ID: {thread_id}")
+    canonical_id = service.resolve_thread_id(thread_id)
+    logger.info(f"Resolved to: {canonical_id}")
+
+    if canonical_id:
+        cache_set(key, canonical_id, _GMAIL_RESOLVE_TTL)
+    else:
+        cache_set(key, "", _GMAIL_RESOLVE_MISS_TTL)
+    return canonical_id
+
+
+def _is_internal_id(thread_id: str) -> bool:
+    """True if the ID has the canonical UUID shape of an internal thread ID"""
+    return len(thread_id) == 36 and _UUID_RE.match(thread_id) is not None
+
+
+def get_thread_with_fallback(
+    db: Session, user: User, thread_id: str, load: Iterable = ()
+) -> Optional[Thread]:
     """
     Get thread by ID with fallback strategies:
     1. Internal UUID
     2. Provider ID (exact match)
     3. Resolved Gmail ID (canonical hex)
+
+    The ID's shape picks the strategy: a UUID is only ever an internal ID,
+    and provider IDs (Gmail hex, Outlook conversation IDs) are never UUIDs.
+
+    ``load`` is an iterable of loader options applied to each thread query.
     """
+    options = tuple(load)
     try:
-        # 1. Try UUID
-        try:
-            thread = db.query(Thread).filter(Thread.id == thread_id, Thread.user_id == user.id).first()
-            if thread: return thread
-        except Exception as e:
-            # Not a valid UUID, rollback to clean transaction state
-            logger.debug(f"Not a valid UUID: {thread_id}")
-            db.rollback()
+        # 1. Internal UUID: exactly one lookup, no provider fallbacks
+        if _is_internal_id(thread_id):
+            return db.query(Thread).options(*options).filter(Thread.id == thread_id, Thread.user_id == user.id).first()
 
-        # 2. Try Provider ID
-        thread = db.query(Thread).filter(Thread.thread_id_provider == thread_id, Thread.user_id == user.id).first()
+        # 2. Provider ID
+        thread = db.query(Thread).options(*options).filter(Thread.thread_id_provider == thread_id, Thread.user_id == user.id).first()
         if thread: return thread
 
         # 3. Try resolving Gmail ID
-        # Check if user has Gmail
-        has_gmail = db.query(AccountToken).filter(AccountToken.user_id == user.id, AccountToken.provider == 'gmail').first()
-        if has_gmail:
-            try:
-                logger.info(f"Attempting to resolve Gmail ID: {thread_id}")
-                service = GmailService(db, user)
-                canonical_id = service.resolve_thread_id(thread_id)
-                logger.info(f"Resolved to: {canonical_id}")
-                if canonical_id:
-                    # Try to find by canonical ID
-                    thread = db.query(Thread).filter(Thread.thread_id_provider == canonical_id, Thread.user_id == user.id).first()
-                    if thread: return thread
-
-                    # If not found, maybe we need to sync it?
-                    # But this function is just a getter. The caller should handle sync if needed.
-            except Exception as e:
-                logger.warning(f"Failed to resolve Gmail ID: {e}")
-                db.rollback()
+        try:
+            canonical_id = _resolve_gmail_thread_id(db, user, thread_id)
+            if canonical_id:
+                # Try to find by canonical ID
+                thread = db.query(Thread).options(*options).filter(Thread.thread_id_provider == canonical_id, Thread.user_id == user.id).first()
+                if thread: return thread
+
+                # If not found, maybe we need to sync it?
+                # But this function is just a getter. The caller should handle sync if needed.
+        except Exception as e:
+            logger.warning(f"Failed to resolve Gmail ID: {e}")
+            db.rollback()
 
         return None
     except Exception as e:
@@ -62,8 +192,10 @@ def get_thread_with_fallback(db: Session, user: User, thread_id: str) -> Optiona
 
 @router.get("/", response_model=List[ThreadListResponse])
 def list_threads(
+    request: Request,
     limit: int = Query(50, ge=1, le=100),
     offset: int = Query(0, ge=0),
+    cursor: Optional[str] = None,
     priority: Optional[str] = None,
     sentiment: Optional[str] = None,
     search: Optional[str] = None,
@@ -75,12 +207,28 @@ def list_threads(
 
     Query parameters:
     - limit: Number of threads to return (default: 50, max: 100)
-    - offset: Pagination offset (default: 0)
+    - cursor: Keyset cursor from a previous page's X-Next-Cursor header
+    - offset: Pagination offset (default: 0); prefer cursor, which does not
+      rescan skipped rows. Searches are ranked and page by offset only.
     - priority: Filter by priority level (urgent, customer, vendor, internal, low)
     - sentiment: Filter by sentiment (positive, neutral, negative)
-    - search: Search in subject
+    - search: Full-text search in subject (ranked), including substring matches
+
+    Send ``Accept: application/x-ndjson`` to receive one JSON object per
+    line, streamed as each item is encoded, instead of a single array.
     """
-    query = db.query(Thread).filter(Thread.user_id == current_user.id)
+    query = (
+        db.query(Thread)
+        .options(
+            # Only the columns the list item serializes
+            load_only(Thread.id, Thread.subject, Thread.last_message_at),
+            joinedload(Thread.priority).load_only(AIPriority.priority_level),
+            joinedload(Thread.sentiment).load_only(AISentiment.sentiment_label),
+            # Only existence matters for has_summary; skip the summary text
+            selectinload(Thread.summary).load_only(AIThreadSummary.id),
+        )
+        .filter(Thread.user_id == current_user.id)
+    )
 
     # Apply filters
     if priority:
@@ -89,24 +237,57 @@ def list_threads(
     if sentiment:
         query = query.join(AISentiment).filter(AISentiment.sentiment_label == sentiment)
 
+    order_by = [Thread.last_message_at.desc()]
     if search:
-        query = query.filter(Thread.subject.ilike(f"%{search}%"))
-
-    # Order and paginate
-    threads = (
-        query.order_by(Thread.last_message_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
+        # Stemmed word matches (subject_tsv GIN index) plus plain substring
+        # matches (lower(subject) trigram index); word matches rank first
+        ts_query = func.plainto_tsquery("english", search)
+        query = query.filter(
+            or_(
+                Thread.subject_tsv.op("@@")(ts_query),
+                func.lower(Thread.subject).like(f"%{search.lower()}%"),
+            )
+        )
+        order_by.insert(0, func.ts_rank_cd(Thread.subject_tsv, ts_query).desc())
+
+    if search:
+        query = query.order_by(*order_by).offset(offset)
+    else:
+        # Keyset: seek past the cursor row on the (user_id, last_message_at, id) index
+        if cursor:
+            cursor_ts, cursor_id = _decode_cursor(cursor)
+            query = query.filter(
+                tuple_(Thread.last_message_at, Thread.id) < tuple_(cursor_ts, cursor_id)
+            )
+        elif offset:
+            query = query.offset(offset)
+        query = query.order_by(Thread.last_message_at.desc(), Thread.id.desc())
 
-    # TODO: Add email count, has_summary flags
-    return threads
+    threads = query.limit(limit).all()
+
+    headers = {}
+    if not search and len(threads) == limit:
+        headers["X-Next-Cursor"] = _encode_cursor(threads[-1])
+
+    # TODO: Add email count
+    if _NDJSON in request.headers.get("accept", ""):
+        return StreamingResponse(
+            (orjson.dumps(_to_list_row(thread)) + b"\n" for thread in threads),
+            media_type=_NDJSON,
+            headers=headers,
+        )
+
+    return Response(
+        content=orjson.dumps([_to_list_row(thread) for thread in threads]),
+        media_type="application/json",
+        headers=headers,
+    )
 
 
 @router.get("/{thread_id}", response_model=ThreadDetailResponse)
 def get_thread_detail(
     thread_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
@@ -119,105 +300,135 @@ def get_thread_detail(
     - Extracted tasks
     - Reply draft
     """
-    thread = get_thread_with_fallback(db, current_user, thread_id)
+    thread = get_thread_with_fallback(
+        db,
+        current_user,
+        thread_id,
+        load=(
+            *_AI_RESULT_LOADS,
+            selectinload(Thread.emails).undefer(Email.recipients).undefer(Email.body_text_clean),
+            selectinload(Thread.tasks),
+        ),
+    )
 
     if not thread:
         # Return 404 instead of 200 with error dict
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Thread not found")
 
-    return thread
+    return _conditional_response(
+        request,
+        orjson.dumps(to_fast_thread_detail(thread)),
+    )
 
 
-@router.get("/{thread_id}/summary")
+@router.get("/{thread_id}/summary", response_model=AISummaryResponse)
 def get_thread_summary(
     thread_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     logger.info(f"Fetching summary for thread_id: {thread_id}")
-    thread = get_thread_with_fallback(db, current_user, thread_id)
+    thread = get_thread_with_fallback(
+        db, current_user, thread_id, load=_only(Thread.summary)
+    )
         
     if not thread:
         logger.warning(f"Thread not found: {thread_id}")
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Thread not found")
         
     if not thread.summary:
         logger.warning(f"Summary not found for thread: {thread.id}")
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Summary not found")
         
-    return thread.summary
+    return _conditional_response(
+        request, AISummaryResponse.from_orm_fast(thread.summary).model_dump(warnings=False)
+    )
 
 
-@router.get("/{thread_id}/priority")
+@router.get("/{thread_id}/priority", response_model=AIPriorityResponse)
 def get_thread_priority(
     thread_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    thread = get_thread_with_fallback(db, current_user, thread_id)
+    thread = get_thread_with_fallback(
+        db, current_user, thread_id, load=_only(Thread.priority)
+    )
         
     if not thread:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Thread not found")
         
     if not thread.priority:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Priority not found")
         
-    return thread.priority
+    return _conditional_response(
+        request, AIPriorityResponse.from_orm_fast(thread.priority).model_dump(warnings=False)
+    )
 
 
-@router.get("/{thread_id}/sentiment")
+@router.get("/{thread_id}/sentiment", response_model=AISentimentResponse)
 def get_thread_sentiment(
     thread_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    thread = get_thread_with_fallback(db, current_user, thread_id)
+    thread = get_thread_with_fallback(
+        db, current_user, thread_id, load=_only(Thread.sentiment)
+    )
         
     if not thread:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Thread not found")
         
     if not thread.sentiment:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Sentiment not found")
         
-    return thread.sentiment
+    return _conditional_response(
+        request, AISentimentResponse.from_orm_fast(thread.sentiment).model_dump(warnings=False)
+    )
 
 
-@router.get("/{thread_id}/reply")
+@router.get("/{thread_id}/reply", response_model=AIReplyDraftResponse)
 def get_thread_reply(
     thread_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    thread = get_thread_with_fallback(db, current_user, thread_id)
+    thread = get_thread_with_fallback(
+        db, current_user, thread_id, load=_only(Thread.reply_draft)
+    )
         
     if not thread:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Thread not found")
         
     if not thread.reply_draft:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Reply draft not found")
         
-    return thread.reply_draft
+    return _conditional_response(
+        request, AIReplyDraftResponse.from_orm_fast(thread.reply_draft).model_dump(warnings=False)
+    )
 
 
-@router.get("/{thread_id}/tasks")
+@router.get("/{thread_id}/tasks", response_model=List[TaskResponse])
 def get_thread_tasks(
     thread_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
-    thread = get_thread_with_fallback(db, current_user, thread_id)
+    thread = get_thread_with_fallback(
+        db, current_user, thread_id, load=_only(Thread.tasks)
+    )
         
     if not thread:
-        from fastapi import HTTPException
         raise HTTPException(status_code=404, detail="Thread not found")
         
-    return thread.tasks
+    return _conditional_response(
+        request,
+        TASK_LIST_ADAPTER.dump_json(
+            [TaskResponse.from_orm_fast(task) for task in thread.tasks], warnings=False
+        ),
+    )
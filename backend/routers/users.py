@@ -1,10 +1,19 @@
 from fastapi import APIRouter, Depends
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from db import get_db
 from models import User
 from schemas import UserResponse, UserUpdate, UserPasswordUpdate
 from app.dependencies import get_current_user
-from core import verify_password, get_password_hash, AuthenticationError
+from core import (
+    verify_password,
+    get_password_hash,
+    run_kdf,
+    invalidate_user_cache,
+    AuthenticationError,
+)
 import logging
 
 router = APIRouter()
@@ -24,43 +33,54 @@ def update_user_profile(
     db: Session = Depends(get_db),
 ):
     """Update user profile"""
-    if user_data.name is not None:
-        current_user.name = user_data.name
-
-    if user_data.email is not None:
-        # Check if email is already taken
-        existing_user = (
-            db.query(User)
-            .filter(User.email == user_data.email, User.id != current_user.id)
-            .first()
-        )
-        if existing_user:
-            raise AuthenticationError("Email already in use")
-        current_user.email = user_data.email
+    changes = user_data.model_dump(exclude_unset=True, exclude_none=True)
+    if not changes:
+        return current_user
 
-    db.commit()
-    db.refresh(current_user)
+    # One UPDATE ... RETURNING; the unique index on email rejects a taken
+    # address, so there is no separate existence check to race against
+    stmt = (
+        update(User)
+        .where(User.id == current_user.id)
+        .values(**changes)
+        .returning(*User.__table__.columns)
+    )
+    try:
+        user = dict(db.execute(stmt).mappings().one())
+        db.commit()
+    except IntegrityError:
+        db.rollback()
+        raise AuthenticationError("Email already in use")
 
-    logger.info(f"User profile updated: {current_user.email}")
-    return current_user
+    invalidate_user_cache(current_user.id)
+
+    logger.info(f"User profile updated: {user['email']}")
+    return user
 
 
 @router.put("/password")
-def update_password(
+async def update_password(
     password_data: UserPasswordUpdate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db),
 ):
     """Update user password"""
-    # Verify old password
-    if not verify_password(password_data.old_password, current_user.password_hash):
+    # The hash is deferred (and never in the user cache); load it off the loop
+    password_hash = await run_in_threadpool(lambda: current_user.password_hash)
+
+    # Verify old password; both KDF calls run on the executor, not the event loop
+    if not await run_kdf(verify_password, password_data.old_password, password_hash):
         raise AuthenticationError("Invalid current password")
 
+    # Read before the commit expires them; a reload here would block the loop
+    user_id, user_email = current_user.id, current_user.email
+
     # Update password
-    current_user.password_hash = get_password_hash(password_data.new_password)
-    db.commit()
+    current_user.password_hash = await run_kdf(get_password_hash, password_data.new_password)
+    await run_in_threadpool(db.commit)
+    invalidate_user_cache(user_id)
 
-    logger.info(f"Password updated for user: {current_user.email}")
+    logger.info(f"Password updated for user: {user_email}")
     return {"message": "Password updated successfully"}
 
 
@@ -72,6 +92,7 @@ def delete_account(
     """Delete user account"""
     db.delete(current_user)
     db.commit()
+    invalidate_user_cache(current_user.id)
 
     logger.info(f"User account deleted: {current_user.email}")
     return {"message": "Account deleted successfully"}
@@ -4,31 +4,56 @@ Webhook Handlers
 Handles incoming webhooks from Gmail and Outlook for real-time email notifications
 """
 
-from fastapi import APIRouter, Request, HTTPException, Depends, Header
+from fastapi import APIRouter, Request, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import Optional
 import logging
 import json
 import base64
 import hmac
-import hashlib
 
 from db import get_db
 from models import User, AccountToken
+from app.dependencies import get_current_user
 from services.gmail_service import GmailService
 from services.outlook_service import OutlookService
-from workers.redis_client import RedisClient
-from app.config import settings
+from core.redis_client import RedisClient
+from app.config import get_settings
+
+settings = get_settings()
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 redis_client = RedisClient()
 
+def _verify_pubsub_token(token: Optional[str]) -> bool:
+    """
+    Check the shared secret carried in the push endpoint URL
+
+    The Pub/Sub push subscription is configured with
+    ``.../webhooks/gmail/push?token=<PUBSUB_VERIFICATION_TOKEN>``; Pub/Sub
+    signs nothing itself. Verification is skipped when no token is configured.
+
+    Args:
+        token: Value of the ``token`` query parameter
+
+    Returns:
+        True if the token matches (or verification is disabled)
+    """
+    expected = settings.PUBSUB_VERIFICATION_TOKEN
+    if not expected:
+        return True
+    if not token:
+        return False
+    return hmac.compare_digest(token.encode(), expected.encode())
+
 
 @router.post("/gmail/push")
 async def gmail_push_notification(
     request: Request,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
+    token: Optional[str] = None
 ):
     """
     Handle Gmail push notifications
@@ -38,6 +63,10 @@ async def gmail_push_notification(
 
     Reference: https://developers.google.com/gmail/api/guides/push
     """
+    if not _verify_pubsub_token(token):
+        logger.warning("Rejected Gmail webhook with invalid verification token")
+        raise HTTPException(status_code=403, detail="Invalid token")
+
     try:
         # Parse Pub/Sub message
         body = await request.json()
@@ -65,12 +94,12 @@ async def gmail_push_notification(
             logger.warning("No email address in Gmail push notification")
             return {"status": "ignored"}
 
-        # Find user by Gmail account
-        account = (
-            db.query(AccountToken)
+        # Find user by Gmail account; the DB call blocks, keep it off the event loop
+        account = await run_in_threadpool(
+            lambda: db.query(AccountToken)
             .filter(
                 AccountToken.provider == 'gmail',
-                AccountToken.email == email_address
+                AccountToken.email_address == email_address
             )
             .first()
         )
@@ -87,7 +116,7 @@ async def gmail_push_notification(
             'incremental': True
         }
 
-        redis_client.enqueue('email_sync', job_data)
+        await run_in_threadpool(redis_client.enqueue, 'email_sync', job_data)
         logger.info(f"Enqueued Gmail sync job for user {account.user_id}")
 
         return {"status": "ok"}
@@ -128,52 +157,63 @@ async def outlook_push_notification(
 
         notifications = body['value']
 
-        for notification in notifications:
-            change_type = notification.get('changeType')
-            resource = notification.get('resource')
-            client_state = notification.get('clientState')
+        # Resolve every subscription in the batch with one query
+        subscription_ids = {
+            n['subscriptionId'] for n in notifications if n.get('subscriptionId')
+        }
+        by_sub = {}
+        if subscription_ids:
+            accounts = await run_in_threadpool(
+                lambda: db.query(AccountToken)
+                .filter(
+                    AccountToken.provider == 'outlook',
+                    AccountToken.subscription_id.in_(subscription_ids)
+                )
+                .all()
+            )
+            by_sub = {a.subscription_id: a for a in accounts}
 
-            logger.info(f"Outlook notification: changeType={change_type}, resource={resource}")
+        # Buffer every enqueue and flush them in one round trip
+        with redis_client.pipeline() as pipe:
+            for notification in notifications:
+                change_type = notification.get('changeType')
+                resource = notification.get('resource')
+                client_state = notification.get('clientState')
 
-            # Verify client state (security check)
-            if client_state != settings.OUTLOOK_WEBHOOK_CLIENT_STATE:
-                logger.warning(f"Invalid client state in Outlook webhook: {client_state}")
-                continue
+                logger.info(f"Outlook notification: changeType={change_type}, resource={resource}")
 
-            # Extract user email from resource
-            # Resource format: "Users/{user_id}/Messages/{message_id}"
-            # We need to find the account by subscription ID stored in our DB
-            subscription_id = notification.get('subscriptionId')
+                # Verify client state (security check)
+                if client_state != settings.OUTLOOK_WEBHOOK_CLIENT_STATE:
+                    logger.warning(f"Invalid client state in Outlook webhook: {client_state}")
+                    continue
 
-            if not subscription_id:
-                logger.warning("No subscription ID in Outlook notification")
-                continue
+                # Resource format: "Users/{user_id}/Messages/{message_id}"
+                # The account is found by the subscription ID stored in our DB
+                subscription_id = notification.get('subscriptionId')
 
-            # Find account by subscription ID (stored in AccountToken metadata)
-            account = (
-                db.query(AccountToken)
-                .filter(
-                    AccountToken.provider == 'outlook',
-                    AccountToken.metadata.contains({'subscription_id': subscription_id})
-                )
-                .first()
-            )
+                if not subscription_id:
+                    logger.warning("No subscription ID in Outlook notification")
+                    continue
 
-            if not account:
-                logger.warning(f"No account found for Outlook subscription: {subscription_id}")
-                continue
+                account = by_sub.get(subscription_id)
 
-            # Enqueue email sync job
-            job_data = {
-                'user_id': str(account.user_id),
-                'provider': 'outlook',
-                'change_type': change_type,
-                'resource': resource,
-                'incremental': True
-            }
+                if not account:
+                    logger.warning(f"No account found for Outlook subscription: {subscription_id}")
+                    continue
 
-            redis_client.enqueue('email_sync', job_data)
-            logger.info(f"Enqueued Outlook sync job for user {account.user_id}")
+                # Enqueue email sync job
+                job_data = {
+                    'user_id': str(account.user_id),
+                    'provider': 'outlook',
+                    'change_type': change_type,
+                    'resource': resource,
+                    'incremental': True
+                }
+
+                pipe.enqueue('email_sync', job_data)
+                logger.info(f"Enqueued Outlook sync job for user {account.user_id}")
+
+            await run_in_threadpool(pipe.execute)
 
         return {"status": "ok"}
 
@@ -202,24 +242,21 @@ async def outlook_webhook_validation(
 
 @router.post("/gmail/watch")
 async def setup_gmail_watch(
-    user_id: str,
+    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Setup Gmail push notifications for a user
+    Setup Gmail push notifications for the current user
 
     This endpoint sets up a watch on the user's Gmail inbox to receive
     push notifications when new emails arrive.
     """
+    user_id = current_user.id
     try:
-        # Get user
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-
         # Setup Gmail watch
-        gmail_service = GmailService(db, user)
-        watch_response = gmail_service.setup_push_notifications()
+        watch_response = await run_in_threadpool(
+            lambda: GmailService(db, current_user).setup_push_notifications()
+        )
 
         logger.info(f"Gmail watch setup for user {user_id}: {watch_response}")
 
@@ -236,24 +273,21 @@ async def setup_gmail_watch(
 
 @router.post("/outlook/subscription")
 async def setup_outlook_subscription(
-    user_id: str,
+    current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
-    Setup Outlook webhook subscription for a user
+    Setup Outlook webhook subscription for the current user
 
     This endpoint creates a webhook subscription for the user's Outlook inbox
     to receive push notifications when new emails arrive.
     """
+    user_id = current_user.id
     try:
-        # Get user
-        user = db.query(User).filter(User.id == user_id).first()
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-
         # Setup Outlook subscription
-        outlook_service = OutlookService(db, user)
-        subscription = outlook_service.setup_webhook_subscription()
+        subscription = await run_in_threadpool(
+            lambda: OutlookService(db, current_user).setup_webhook_subscription()
+        )
 
         logger.info(f"Outlook subscription setup for user {user_id}: {subscription}")
 
@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, Query, HTTPException
 from typing import Optional, List
 from pydantic import BaseModel
 
-from core.security import get_current_user
+from app.dependencies import get_current_user
 from models import User
 from workers import get_scheduler
 from workers.monitoring import get_monitor
@@ -6,6 +6,7 @@ from .thread import (
     ThreadListResponse,
     ThreadDetailResponse,
     ThreadQueryParams,
+    TASK_LIST_ADAPTER,
 )
 from .ai import (
     AIProcessRequest,
@@ -14,6 +15,7 @@ from .ai import (
     AISentimentResponse,
     AIReplyDraftResponse,
     AIReplyRegenerateRequest,
+    AIProcessAllResponse,
 )
 from .task import TaskCreate, TaskUpdate, TaskResponse, TaskExtractionResponse
 from .context import (
@@ -45,12 +47,14 @@ __all__ = [
     "ThreadListResponse",
     "ThreadDetailResponse",
     "ThreadQueryParams",
+    "TASK_LIST_ADAPTER",
     "AIProcessRequest",
     "AISummaryResponse",
     "AIPriorityResponse",
     "AISentimentResponse",
     "AIReplyDraftResponse",
     "AIReplyRegenerateRequest",
+    "AIProcessAllResponse",
     "TaskCreate",
     "TaskUpdate",
     "TaskResponse",
@@ -0,0 +1,60 @@
+"""
+Fast Response Rows
+
+Plain-dict mirrors of read-path response schemas, for routes that encode
+straight to JSON bytes with orjson instead of building a schema tree.
+Keys are taken from the Pydantic schemas, so the two can't drift apart.
+"""
+
+from typing import Any, Dict, Optional
+
+from .ai import AISummaryResponse, AIPriorityResponse, AISentimentResponse, AIReplyDraftResponse
+from .email import EmailResponse
+from .task import TaskResponse
+from .thread import ThreadDetailResponse
+
+# Nested fields of ThreadDetailResponse and the schema each one mirrors
+_DETAIL_ONE = {
+    "summary": AISummaryResponse,
+    "priority": AIPriorityResponse,
+    "sentiment": AISentimentResponse,
+    "reply_draft": AIReplyDraftResponse,
+}
+_DETAIL_MANY = {
+    "emails": EmailResponse,
+    "tasks": TaskResponse,
+}
+_DETAIL_SCALARS = tuple(
+    name for name in ThreadDetailResponse.model_fields
+    if name not in _DETAIL_ONE and name not in _DETAIL_MANY
+)
+
+
+def _row(schema, obj: Any) -> Dict[str, Any]:
+    """Copy the schema's fields off a trusted ORM object"""
+    return {name: getattr(obj, name) for name in schema.model_fields}
+
+
+def _optional_row(schema, obj: Any) -> Optional[Dict[str, Any]]:
+    return _row(schema, obj) if obj is not None else None
+
+
+def to_fast_thread_detail(thread) -> Dict[str, Any]:
+    """
+    Build a thread detail response as plain dicts
+
+    Mirrors ThreadDetailResponse field for field, nested results included.
+    Values are copied from the ORM objects as-is, without validation.
+
+    Args:
+        thread: Thread with its emails, tasks and AI results loaded
+
+    Returns:
+        Dictionary ready for orjson.dumps
+    """
+    detail = {name: getattr(thread, name) for name in _DETAIL_SCALARS}
+    for name, schema in _DETAIL_ONE.items():
+        detail[name] = _optional_row(schema, getattr(thread, name))
+    for name, schema in _DETAIL_MANY.items():
+        detail[name] = [_row(schema, obj) for obj in getattr(thread, name)]
+    return detail
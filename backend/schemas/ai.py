@@ -1,16 +1,19 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
+from .base import FastORMMixin
 
 
 class AIProcessRequest(BaseModel):
     """Generic AI processing request"""
 
+    # Internal UUID or provider (Gmail/Outlook) thread ID, so kept as str;
+    # UUID columns are loaded as strings and bind it without conversion
     thread_id: str
 
 
-class AISummaryResponse(BaseModel):
+class AISummaryResponse(FastORMMixin, BaseModel):
     """AI summary response"""
 
     id: UUID
@@ -19,11 +22,10 @@ class AISummaryResponse(BaseModel):
     model_used: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
-class AIPriorityResponse(BaseModel):
+class AIPriorityResponse(FastORMMixin, BaseModel):
     """AI priority classification response"""
 
     id: UUID
@@ -32,26 +34,26 @@ class AIPriorityResponse(BaseModel):
     category: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
-class AISentimentResponse(BaseModel):
+class AISentimentResponse(FastORMMixin, BaseModel):
     """AI sentiment analysis response"""
 
     id: UUID
     thread_id: UUID
-    sentiment_score: float = Field(..., ge=-1.0, le=1.0)
+    # Ranges are enforced when the LLM result is stored (see
+    # AIOrchestrator.analyze_sentiment), not re-checked on every read
+    sentiment_score: float  # -1.0 to 1.0
     sentiment_label: str  # positive, neutral, negative
-    anger_level: float = Field(..., ge=0.0, le=1.0)
-    urgency_score: float = Field(..., ge=0.0, le=1.0)
+    anger_level: float  # 0.0 to 1.0
+    urgency_score: float  # 0.0 to 1.0
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
-class AIReplyDraftResponse(BaseModel):
+class AIReplyDraftResponse(FastORMMixin, BaseModel):
     """AI reply draft response"""
 
     id: UUID
@@ -60,8 +62,15 @@ class AIReplyDraftResponse(BaseModel):
     tone_used: str
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+class AIProcessAllResponse(BaseModel):
+    """Combined summary, priority and sentiment response"""
+
+    summary: AISummaryResponse
+    priority: AIPriorityResponse
+    sentiment: AISentimentResponse
 
 
 class AIReplyRegenerateRequest(BaseModel):
@@ -0,0 +1,27 @@
+"""
+Schema Base Classes
+
+Shared helpers for response schemas that are built from ORM objects
+"""
+
+from typing import Any
+
+
+class FastORMMixin:
+    """
+    Adds ``from_orm_fast`` to a response schema
+
+    ``model_validate`` re-validates every field of data that was just read
+    from our own database. ``from_orm_fast`` copies the attributes across
+    with ``model_construct`` instead, skipping validation entirely.
+
+    Only use it for trusted ORM objects. Values are not coerced: UUID
+    columns load as ``str``, so dump these instances with ``warnings=False``.
+    """
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """Build the schema from an ORM object without validation"""
+        return cls.model_construct(
+            **{name: getattr(obj, name) for name in cls.model_fields}
+        )
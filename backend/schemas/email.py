@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import List, Optional
+from .base import FastORMMixin
 
 
 class EmailBase(BaseModel):
@@ -22,7 +23,7 @@ class EmailCreate(EmailBase):
     body_html_url: Optional[str] = None
 
 
-class EmailResponse(EmailBase):
+class EmailResponse(FastORMMixin, EmailBase):
     """Email response schema"""
 
     id: UUID
@@ -31,8 +32,7 @@ class EmailResponse(EmailBase):
     body_html_url: Optional[str] = None
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class EmailSyncRequest(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, Dict, Any
@@ -29,8 +29,7 @@ class IntegrationResponse(BaseModel):
     created_at: datetime
     is_active: bool = True
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class SlackAlertRequest(BaseModel):
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
+from .base import FastORMMixin
 
 
 class TaskBase(BaseModel):
@@ -29,15 +30,14 @@ class TaskUpdate(BaseModel):
     status: Optional[str] = None
 
 
-class TaskResponse(TaskBase):
+class TaskResponse(FastORMMixin, TaskBase):
     """Task response schema"""
 
     id: UUID
     thread_id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class TaskExtractionResponse(BaseModel):
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 from uuid import UUID
 from datetime import datetime
 from typing import Optional, List
@@ -32,8 +32,7 @@ class ThreadListResponse(BaseModel):
     has_summary: bool = False
     email_count: int = 0
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 
 class ThreadDetailResponse(ThreadBase):
@@ -48,8 +47,12 @@ class ThreadDetailResponse(ThreadBase):
     tasks: List[TaskResponse] = []
     reply_draft: Optional[AIReplyDraftResponse] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
+
+
+# Built once at import; dump_json serializes straight to JSON bytes in
+# pydantic-core instead of going through Python dicts
+TASK_LIST_ADAPTER = TypeAdapter(List[TaskResponse])
 
 
 class ThreadQueryParams(BaseModel):
@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
+from .base import FastORMMixin
 
 
 class UserBase(BaseModel):
@@ -31,11 +32,10 @@ class UserPasswordUpdate(BaseModel):
     new_password: str
 
 
-class UserResponse(UserBase):
+class UserResponse(FastORMMixin, UserBase):
     """User response schema"""
 
     id: UUID
     created_at: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
@@ -18,8 +18,8 @@ from .reply_generator import ReplyGenerationService
 from .task_extractor import TaskExtractionService
 
 # Email Sync Services
-from .gmail_oauth import GmailOAuthService
-from .outlook_oauth import OutlookOAuthService
+from .gmail_oauth import GmailOAuthService, gmail_oauth_service
+from .outlook_oauth import OutlookOAuthService, outlook_oauth_service
 from .gmail_service import GmailService
 from .outlook_service import OutlookService
 from .email_sync_service import EmailSyncService
@@ -39,6 +39,8 @@ __all__ = [
     # Email Sync Services
     "GmailOAuthService",
     "OutlookOAuthService",
+    "gmail_oauth_service",
+    "outlook_oauth_service",
     "GmailService",
     "OutlookService",
     "EmailSyncService",
@@ -10,19 +10,127 @@ This module coordinates all AI operations:
 - Manages token limits
 """
 
+import hashlib
 import logging
+import re
+import threading
 import time
-from typing import Dict, Any, Optional, List
-from sqlalchemy.orm import Session
-
-from models import Thread, Email, CompanyContext, User
-from services.prompts import PromptTemplates
+import uuid
+from functools import cached_property
+from typing import Dict, Any, Optional, List, Tuple
+from cachetools import TTLCache
+from sqlalchemy import or_
+from sqlalchemy.orm import Session, undefer_group
+
+from models import Thread, CompanyContext, User
+from db.stmts import GET_THREAD_WITH_EMAILS, GET_THREAD_LATEST_EMAIL
+from services.prompts import (
+    summarization_prompt,
+    priority_classification_prompt,
+    sentiment_analysis_prompt,
+    reply_generation_prompt,
+    task_extraction_prompt,
+    escalation_detection_prompt,
+    reply_rewrite_prompt,
+    render_emails,
+    EMAIL_FORMAT_BRIEF,
+    EMAIL_FORMAT_DATED,
+    EMAIL_FORMAT_RULED,
+)
 from services.llm_providers import get_llm_provider, parse_json_response
-from app.config import settings
+from app.config import get_settings
 from core import ExternalServiceError
+from core.cache import cache_get, cache_set, cache_delete
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+_WS_RE = re.compile(r"\s+")
+
+# Per-process copy of each user's company context (None for users without
+# one) in front of Redis, so building an orchestrator per email doesn't cost
+# a round trip. Short TTL: other processes only learn of edits by expiry.
+_ctx_cache: TTLCache = TTLCache(maxsize=5000, ttl=60)
+_ctx_cache_lock = threading.Lock()
+_MISSING = object()
+
+
+def _clamp(value: Any, low: float, high: float) -> float:
+    """Coerce an LLM-provided score to float and clamp it into [low, high]"""
+    return max(low, min(high, float(value)))
+
+
+def _company_context_key(user_id) -> str:
+    return f"company_context:{user_id}"
+
+
+def get_company_context(db: Session, user_id) -> Optional[Dict[str, Any]]:
+    """
+    Get a user's company context as a prompt-ready dictionary
+
+    Served from the per-process cache, then Redis, when possible; the row
+    rarely changes but every AI call needs it.
+
+    Args:
+        db: Database session
+        user_id: User ID
+
+    Returns:
+        Context dictionary or None if the user has no context
+    """
+    local_key = str(user_id)
+    with _ctx_cache_lock:
+        local = _ctx_cache.get(local_key, _MISSING)
+    if local is not _MISSING:
+        return local
+
+    key = _company_context_key(user_id)
+    cached = cache_get(key)
+    if cached is not None:
+        with _ctx_cache_lock:
+            _ctx_cache[local_key] = cached
+        return cached
+
+    context = (
+        db.query(CompanyContext)
+        .options(undefer_group("payload"))
+        .filter(CompanyContext.user_id == user_id)
+        .first()
+    )
+
+    if not context:
+        with _ctx_cache_lock:
+            _ctx_cache[local_key] = None
+        return None
+
+    result = {
+        "tone": context.tone,
+        "company_description": context.company_description,
+        "products": context.products or [],
+        "policies": context.policies or {},
+        "faq": context.faq or [],
+        "roles": context.roles or {},
+    }
+    cache_set(key, result, settings.COMPANY_CONTEXT_CACHE_TTL)
+    with _ctx_cache_lock:
+        _ctx_cache[local_key] = result
+    return result
+
+
+def invalidate_company_context(user_id) -> None:
+    """
+    Drop a user's cached company context after it has been modified
+
+    Called by the routes that write it, and from the company_context
+    NOTIFY listener (see app.main) for writes made outside the API. The
+    trigger behind the NOTIFY only exists on databases built by
+    create_all, so the routes can't rely on it.
+    """
+    with _ctx_cache_lock:
+        _ctx_cache.pop(str(user_id), None)
+    cache_delete(_company_context_key(user_id))
+
 
 class AIOrchestrator:
     """
@@ -52,59 +160,140 @@ class AIOrchestrator:
         self.db = db
         self.user = user
         self.provider = get_llm_provider(model)
-        self.company_context = self._fetch_company_context()
+        # Fixed for the provider's lifetime; part of every cache key
+        self._provider_name = self.provider.get_provider_name()
+        # thread_id -> (thread, emails) for threads already loaded by this instance
+        self._thread_cache: Dict[str, Tuple[Thread, List[Dict[str, Any]]]] = {}
+        # (thread_id, email format) -> rendered email block, shared across prompts
+        self._emails_block_cache: Dict[Tuple[str, str], str] = {}
+
+    def find_thread(self, thread_id: str, *options) -> Optional[Thread]:
+        """
+        Look up a thread owned by the current user by internal UUID or provider ID
+
+        One query: a value that parses as a UUID is matched against both
+        columns, anything else only against the provider ID, so a provider ID
+        never reaches the uuid column (whose cast error used to force a
+        rollback and a second query).
+
+        Args:
+            thread_id: Thread ID (UUID or Provider ID)
+            *options: Loader options for the thread query
 
-    def _fetch_company_context(self) -> Optional[Dict[str, Any]]:
-        """Fetch company context for the user"""
-        context = (
-            self.db.query(CompanyContext)
-            .filter(CompanyContext.user_id == self.user.id)
+        Returns:
+            Thread or None if not found
+        """
+        id_match = Thread.thread_id_provider == thread_id
+        try:
+            id_match = or_(Thread.id == str(uuid.UUID(thread_id)), id_match)
+        except ValueError:
+            pass
+
+        return (
+            self.db.query(Thread)
+            .options(*options)
+            .filter(id_match, Thread.user_id == self.user.id)
             .first()
         )
 
-        if not context:
-            return None
+    @cached_property
+    def company_context(self) -> Optional[Dict[str, Any]]:
+        """Company context for the user, fetched on first use"""
+        return get_company_context(self.db, self.user.id)
 
-        return {
-            "tone": context.tone,
-            "company_description": context.company_description,
-            "products": context.products or [],
-            "policies": context.policies or {},
-            "faq": context.faq or [],
-            "roles": context.roles or {},
-        }
-
-    def _fetch_thread_emails(self, thread_id: str) -> List[Dict[str, Any]]:
+    def _load_thread_with_emails(
+        self, thread_id: str
+    ) -> Tuple[Thread, List[Dict[str, Any]]]:
         """
-        Fetch all emails in a thread
+        Load a thread owned by the current user together with its emails
+
+        One round trip: the thread is outer-joined to only the email columns
+        the prompts need, streamed from a server-side cursor in batches so
+        long threads never materialize as full Email entities. The result is
+        memoized on this instance, since several AI operations often run
+        back to back on the same thread (e.g. sentiment, then escalation).
 
         Returns:
-            List of email dictionaries with sender, timestamp, body
+            Tuple of (thread, list of email dictionaries with sender, timestamp, body)
+
+        Raises:
+            ValueError: If the thread doesn't exist for this user
         """
-        thread = (
-            self.db.query(Thread)
-            .filter(Thread.id == thread_id, Thread.user_id == self.user.id)
-            .first()
+        loaded = self._thread_cache.get(thread_id)
+        if loaded is not None:
+            return loaded
+
+        rows = self.db.execute(
+            GET_THREAD_WITH_EMAILS,
+            {"tid": thread_id, "uid": self.user.id},
+            execution_options={"yield_per": 100},
         )
 
-        if not thread:
+        thread = None
+        emails = []
+        for thread, sender, timestamp, body_text_clean in rows:
+            if sender is None:
+                # Outer join row of a thread with no emails
+                continue
+            emails.append({
+                "sender": sender,
+                "timestamp": timestamp,
+                "body": self._clean_email_body(body_text_clean),
+            })
+
+        if thread is None:
             raise ValueError(f"Thread {thread_id} not found")
 
-        emails = (
-            self.db.query(Email)
-            .filter(Email.thread_id == thread_id)
-            .order_by(Email.timestamp)
-            .all()
-        )
+        loaded = self._thread_cache[thread_id] = (thread, emails)
+        return loaded
+
+    def _fetch_latest_email(
+        self, thread_id: str
+    ) -> Tuple[str, Optional[Dict[str, Any]]]:
+        """
+        Load a thread's subject and only its newest email
+
+        For prompts that look at the latest message alone: a single row is
+        read and cleaned instead of the whole thread. Reuses the full email
+        list if this instance already loaded it.
+
+        Returns:
+            Tuple of (thread subject, email dictionary or None if the thread is empty)
+
+        Raises:
+            ValueError: If the thread doesn't exist for this user
+        """
+        loaded = self._thread_cache.get(thread_id)
+        if loaded is not None:
+            thread, emails = loaded
+            return thread.subject, (emails[-1] if emails else None)
 
-        return [
-            {
-                "sender": email.sender,
-                "timestamp": email.timestamp.isoformat(),
-                "body": self._clean_email_body(email.body_text_clean),
-            }
-            for email in emails
-        ]
+        row = self.db.execute(
+            GET_THREAD_LATEST_EMAIL, {"tid": thread_id, "uid": self.user.id}
+        ).first()
+
+        if row is None:
+            raise ValueError(f"Thread {thread_id} not found")
+
+        subject, sender, timestamp, body_text_clean = row
+        if sender is None:
+            return subject, None
+
+        return subject, {
+            "sender": sender,
+            "timestamp": timestamp,
+            "body": self._clean_email_body(body_text_clean),
+        }
+
+    def _emails_block(
+        self, thread_id: str, emails: List[Dict[str, Any]], email_format: str
+    ) -> str:
+        """Render a thread's emails for a prompt, reusing an earlier rendering"""
+        key = (thread_id, email_format)
+        block = self._emails_block_cache.get(key)
+        if block is None:
+            block = self._emails_block_cache[key] = render_emails(emails, email_format)
+        return block
 
     def _clean_email_body(self, body: str, max_length: int = 5000) -> str:
         """
@@ -120,14 +309,17 @@ class AIOrchestrator:
         if not body:
             return ""
 
-        # Remove excessive whitespace
-        body = " ".join(body.split())
+        # Remove excessive whitespace, scanning only a bounded window: twice
+        # max_length leaves room for collapsed runs, and a multi-megabyte
+        # body never needs more than that to fill max_length
+        window = body[:max_length * 2]
+        cleaned = _WS_RE.sub(" ", window).strip()
 
         # Truncate if too long
-        if len(body) > max_length:
-            body = body[:max_length] + "...[truncated]"
+        if len(cleaned) > max_length or len(body) > len(window):
+            cleaned = f"{cleaned[:max_length]}...[truncated]"
 
-        return body
+        return cleaned
 
     def _call_llm_with_retry(
         self,
@@ -135,7 +327,8 @@ class AIOrchestrator:
         max_retries: int = 3,
         temperature: float = 0.7,
         max_tokens: int = 1000,
-        json_mode: bool = False
+        json_mode: bool = False,
+        stream: bool = False
     ) -> str:
         """
         Call LLM with retry logic
@@ -146,6 +339,7 @@ class AIOrchestrator:
             temperature: Sampling temperature
             max_tokens: Maximum tokens to generate
             json_mode: Whether to request JSON output
+            stream: Stream the completion (a failed stream is retried from the start)
 
         Returns:
             LLM response
@@ -161,7 +355,8 @@ class AIOrchestrator:
                     prompt=prompt,
                     temperature=temperature,
                     max_tokens=max_tokens,
-                    json_mode=json_mode
+                    json_mode=json_mode,
+                    stream=stream
                 )
                 return response
 
@@ -183,12 +378,50 @@ class AIOrchestrator:
             f"AI service temporarily unavailable: {str(last_error)}"
         )
 
-    def summarize_thread(self, thread_id: str) -> Dict[str, Any]:
+    def _call_llm_cached(
+        self,
+        kind: str,
+        prompt: str,
+        use_cache: bool = True,
+        **llm_kwargs
+    ) -> Tuple[str, str]:
+        """
+        Call the LLM, reusing a cached response for an identical prompt
+
+        The prompt already carries the thread content, company context and
+        tone, so hashing it together with the model gives a key that is safe
+        to share across threads and users.
+
+        Args:
+            kind: Result type, used to namespace the cache key
+            prompt: The prompt to send
+            use_cache: If False, always call the LLM (the result is still cached)
+            **llm_kwargs: Passed through to _call_llm_with_retry
+
+        Returns:
+            Tuple of (LLM response, content hash)
+        """
+        content_hash = hashlib.sha256(
+            f"{self._provider_name}\0{prompt}".encode()
+        ).hexdigest()
+        key = f"ai:{kind}:{content_hash}"
+
+        cached = cache_get(key) if use_cache else None
+        if cached is not None:
+            logger.info(f"AI {kind} cache hit ({content_hash[:12]})")
+            return cached, content_hash
+
+        response = self._call_llm_with_retry(prompt=prompt, **llm_kwargs)
+        cache_set(key, response, settings.AI_RESULT_CACHE_TTL)
+        return response, content_hash
+
+    def summarize_thread(self, thread_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Generate AI summary for email thread
 
         Args:
             thread_id: Thread ID
+            use_cache: Reuse a cached response for an identical prompt
 
         Returns:
             Dictionary with summary_text and model_used
@@ -196,65 +429,63 @@ class AIOrchestrator:
         logger.info(f"Generating summary for thread {thread_id}")
 
         # Fetch thread data
-        thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        if not thread:
-            raise ValueError("Thread not found")
-
-        emails = self._fetch_thread_emails(thread_id)
+        thread, emails = self._load_thread_with_emails(thread_id)
 
         # Build prompt with context injection
-        prompt = PromptTemplates.summarization_prompt(
+        prompt = summarization_prompt(
             thread_subject=thread.subject,
             emails=emails,
-            company_context=self.company_context
+            company_context=self.company_context,
+            emails_block=self._emails_block(thread_id, emails, EMAIL_FORMAT_DATED)
         )
 
         # Call LLM
-        summary = self._call_llm_with_retry(
-            prompt=prompt,
+        summary, content_hash = self._call_llm_cached(
+            "sum",
+            prompt,
+            use_cache=use_cache,
             temperature=0.5,  # Lower temperature for factual summarization
             max_tokens=200
         )
 
         return {
             "summary_text": summary.strip(),
-            "model_used": self.provider.get_provider_name()
+            "model_used": self._provider_name,
+            "content_hash": content_hash
         }
 
-    def classify_priority(self, thread_id: str) -> Dict[str, Any]:
+    def classify_priority(self, thread_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Classify email thread priority
 
         Args:
             thread_id: Thread ID
+            use_cache: Reuse a cached response for an identical prompt
 
         Returns:
             Dictionary with priority_level, category, reasoning
         """
         logger.info(f"Classifying priority for thread {thread_id}")
 
-        # Fetch thread data
-        thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        if not thread:
-            raise ValueError("Thread not found")
-
-        emails = self._fetch_thread_emails(thread_id)
-        latest_email = emails[-1] if emails else None
+        # Only the newest email is needed
+        subject, latest_email = self._fetch_latest_email(thread_id)
 
         if not latest_email:
             raise ValueError("No emails in thread")
 
         # Build prompt
-        prompt = PromptTemplates.priority_classification_prompt(
-            thread_subject=thread.subject,
+        prompt = priority_classification_prompt(
+            thread_subject=subject,
             latest_email_body=latest_email["body"],
             sender=latest_email["sender"],
             company_context=self.company_context
         )
 
         # Call LLM with JSON mode
-        response = self._call_llm_with_retry(
-            prompt=prompt,
+        response, content_hash = self._call_llm_cached(
+            "prio",
+            prompt,
+            use_cache=use_cache,
             temperature=0.3,  # Low temperature for consistent classification
             max_tokens=300,
             json_mode=True
@@ -266,15 +497,17 @@ class AIOrchestrator:
         return {
             "priority_level": result.get("priority_level", "low"),
             "category": result.get("category", "general"),
-            "reasoning": result.get("reasoning", "")
+            "reasoning": result.get("reasoning", ""),
+            "content_hash": content_hash
         }
 
-    def analyze_sentiment(self, thread_id: str) -> Dict[str, Any]:
+    def analyze_sentiment(self, thread_id: str, use_cache: bool = True) -> Dict[str, Any]:
         """
         Analyze sentiment of email thread
 
         Args:
             thread_id: Thread ID
+            use_cache: Reuse a cached response for an identical prompt
 
         Returns:
             Dictionary with sentiment_score, sentiment_label, anger_level, urgency_score
@@ -282,21 +515,20 @@ class AIOrchestrator:
         logger.info(f"Analyzing sentiment for thread {thread_id}")
 
         # Fetch thread data
-        thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        if not thread:
-            raise ValueError("Thread not found")
-
-        emails = self._fetch_thread_emails(thread_id)
+        thread, emails = self._load_thread_with_emails(thread_id)
 
         # Build prompt
-        prompt = PromptTemplates.sentiment_analysis_prompt(
+        prompt = sentiment_analysis_prompt(
             thread_subject=thread.subject,
-            emails=emails
+            emails=emails,
+            emails_block=self._emails_block(thread_id, emails, EMAIL_FORMAT_BRIEF)
         )
 
         # Call LLM with JSON mode
-        response = self._call_llm_with_retry(
-            prompt=prompt,
+        response, content_hash = self._call_llm_cached(
+            "sent",
+            prompt,
+            use_cache=use_cache,
             temperature=0.3,
             max_tokens=400,
             json_mode=True
@@ -306,17 +538,21 @@ class AIOrchestrator:
         result = parse_json_response(response)
 
         return {
-            "sentiment_score": float(result.get("sentiment_score", 0.0)),
+            # Scores are range-checked here, once, before they are stored;
+            # the response schema trusts what comes back out of the DB
+            "sentiment_score": _clamp(result.get("sentiment_score", 0.0), -1.0, 1.0),
             "sentiment_label": result.get("sentiment_label", "neutral"),
-            "anger_level": float(result.get("anger_level", 0.0)),
-            "urgency_score": float(result.get("urgency_score", 0.0)),
-            "key_indicators": result.get("key_indicators", [])
+            "anger_level": _clamp(result.get("anger_level", 0.0), 0.0, 1.0),
+            "urgency_score": _clamp(result.get("urgency_score", 0.0), 0.0, 1.0),
+            "key_indicators": result.get("key_indicators", []),
+            "content_hash": content_hash
         }
 
     def generate_reply(
         self,
         thread_id: str,
-        tone: Optional[str] = None
+        tone: Optional[str] = None,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Generate AI reply draft
@@ -324,6 +560,7 @@ class AIOrchestrator:
         Args:
             thread_id: Thread ID
             tone: Desired tone (defaults to company context tone)
+            use_cache: Reuse a cached response for an identical prompt
 
         Returns:
             Dictionary with draft_text and tone_used
@@ -331,11 +568,7 @@ class AIOrchestrator:
         logger.info(f"Generating reply for thread {thread_id}")
 
         # Fetch thread data
-        thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        if not thread:
-            raise ValueError("Thread not found")
-
-        emails = self._fetch_thread_emails(thread_id)
+        thread, emails = self._load_thread_with_emails(thread_id)
 
         # Determine tone
         if tone is None and self.company_context:
@@ -344,23 +577,27 @@ class AIOrchestrator:
             tone = "professional and helpful"
 
         # Build prompt with full context injection
-        prompt = PromptTemplates.reply_generation_prompt(
+        prompt = reply_generation_prompt(
             thread_subject=thread.subject,
             emails=emails,
             company_context=self.company_context,
-            tone=tone
+            tone=tone,
+            emails_block=self._emails_block(thread_id, emails, EMAIL_FORMAT_RULED)
         )
 
         # Call LLM
-        draft = self._call_llm_with_retry(
-            prompt=prompt,
+        draft, content_hash = self._call_llm_cached(
+            "reply",
+            prompt,
+            use_cache=use_cache,
             temperature=0.7,  # Higher temperature for more natural responses
             max_tokens=140  # Limit to ~100 words
         )
 
         return {
             "draft_text": draft.strip(),
-            "tone_used": tone
+            "tone_used": tone,
+            "content_hash": content_hash
         }
 
     def extract_tasks(self, thread_id: str) -> List[Dict[str, Any]]:
@@ -376,17 +613,14 @@ class AIOrchestrator:
         logger.info(f"Extracting tasks from thread {thread_id}")
 
         # Fetch thread data
-        thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        if not thread:
-            raise ValueError("Thread not found")
-
-        emails = self._fetch_thread_emails(thread_id)
+        thread, emails = self._load_thread_with_emails(thread_id)
 
         # Build prompt
-        prompt = PromptTemplates.task_extraction_prompt(
+        prompt = task_extraction_prompt(
             thread_subject=thread.subject,
             emails=emails,
-            company_context=self.company_context
+            company_context=self.company_context,
+            emails_block=self._emails_block(thread_id, emails, EMAIL_FORMAT_RULED)
         )
 
         # Call LLM with JSON mode
@@ -394,7 +628,8 @@ class AIOrchestrator:
             prompt=prompt,
             temperature=0.3,
             max_tokens=800,
-            json_mode=True
+            json_mode=True,
+            stream=True  # Long output; don't hold the whole response object
         )
 
         # Parse JSON response
@@ -425,7 +660,7 @@ class AIOrchestrator:
         """
         logger.info(f"Rewriting reply with instruction: {instruction}")
 
-        prompt = PromptTemplates.reply_rewrite_prompt(
+        prompt = reply_rewrite_prompt(
             original_draft=original_draft,
             rewrite_instruction=instruction
         )
@@ -457,20 +692,15 @@ class AIOrchestrator:
         """
         logger.info(f"Detecting escalation for thread {thread_id}")
 
-        # Fetch thread data
-        thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        if not thread:
-            raise ValueError("Thread not found")
-
-        emails = self._fetch_thread_emails(thread_id)
-        latest_email = emails[-1] if emails else None
+        # Only the newest email is needed
+        subject, latest_email = self._fetch_latest_email(thread_id)
 
         if not latest_email:
             raise ValueError("No emails in thread")
 
         # Build prompt
-        prompt = PromptTemplates.escalation_detection_prompt(
-            thread_subject=thread.subject,
+        prompt = escalation_detection_prompt(
+            thread_subject=subject,
             latest_email_body=latest_email["body"],
             sentiment_data=sentiment_data,
             priority_level=priority_level
@@ -5,9 +5,10 @@ This service handles AI-powered priority classification of email threads.
 """
 
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from models import AIPriority, User, Thread
+from db import upsert_row
 from services.ai_orchestrator import AIOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -32,28 +33,16 @@ class ClassificationService:
         Returns:
             AIPriority instance
         """
-        # Resolve thread_id to internal UUID
-        thread = None
-        try:
-            thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        except Exception:
-            self.db.rollback()
-            pass
-            
-        if not thread:
-            thread = self.db.query(Thread).filter(Thread.thread_id_provider == thread_id).first()
-            
+        # Resolve thread_id to internal UUID, loading the existing result up
+        # front so it doesn't need a separate query
+        thread = self.orchestrator.find_thread(thread_id, selectinload(Thread.priority))
         if not thread:
             raise ValueError(f"Thread not found: {thread_id}")
-            
+
         internal_thread_id = str(thread.id)
 
         # Check if classification already exists
-        existing_priority = (
-            self.db.query(AIPriority)
-            .filter(AIPriority.thread_id == internal_thread_id)
-            .first()
-        )
+        existing_priority = thread.priority
 
         if existing_priority and not force_regenerate:
             logger.info(f"Using existing classification for thread {internal_thread_id}")
@@ -61,26 +50,24 @@ class ClassificationService:
 
         # Generate new classification
         logger.info(f"Classifying thread {internal_thread_id}")
-        result = self.orchestrator.classify_priority(internal_thread_id)
-
-        # Save or update in database
-        if existing_priority:
-            existing_priority.priority_level = result["priority_level"]
-            existing_priority.category = result["category"]
-            priority = existing_priority
-        else:
-            priority = AIPriority(
-                thread_id=thread_id,
-                priority_level=result["priority_level"],
-                category=result["category"]
-            )
-            self.db.add(priority)
-
-        self.db.commit()
-        self.db.refresh(priority)
+        result = self.orchestrator.classify_priority(
+            internal_thread_id, use_cache=not force_regenerate
+        )
+
+        # Insert or update in a single statement
+        priority = upsert_row(
+            self.db,
+            AIPriority,
+            {
+                "thread_id": internal_thread_id,
+                "priority_level": result["priority_level"],
+                "category": result["category"],
+                "content_hash": result["content_hash"],
+            },
+        )
 
         logger.info(
             f"Priority classification saved for thread {thread_id}: "
-            f"{priority.priority_level} - {priority.category}"
+            f"{result['priority_level']} - {result['category']}"
         )
         return priority
@@ -5,15 +5,55 @@ Coordinates email syncing from multiple providers (Gmail, Outlook)
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
-from models import User, AccountToken
+from models import User, AccountToken, SyncJobLog
+from db import SessionLocal
 from services.gmail_service import GmailService
 from services.outlook_service import OutlookService
+from app.config import get_settings
+from core.cache import cache_get, cache_set, cache_delete
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
+_PROVIDER_SERVICES = {
+    'gmail': GmailService,
+    'outlook': OutlookService,
+}
+
+
+def _sync_status_key(user_id) -> str:
+    return f"sync_status:{user_id}"
+
+
+def invalidate_sync_status(user_id) -> None:
+    """Drop a user's cached sync status after a sync has logged its result"""
+    cache_delete(_sync_status_key(user_id))
+
+
+def _sync_provider(
+    account: AccountToken,
+    user: User,
+    lookback_days: Optional[int],
+    full_sync: bool
+) -> Dict[str, Any]:
+    """Sync one provider with its own session; sessions can't be shared across threads"""
+    db = SessionLocal()
+    try:
+        # Copy the caller's already-loaded user and token into this session
+        # without a query; the originals stay with the caller's session
+        user = db.merge(user, load=False)
+        account = db.merge(account, load=False)
+        service = _PROVIDER_SERVICES[account.provider](db, user, account_token=account)
+        return service.sync_emails(lookback_days, full_sync)
+    finally:
+        db.close()
+
 
 class EmailSyncService:
     """Main service for coordinating email sync across providers"""
@@ -52,30 +92,37 @@ class EmailSyncService:
             .all()
         )
 
-        for account in accounts:
-            provider = account.provider
+        accounts = [
+            account for account in accounts
+            if account.provider in _PROVIDER_SERVICES
+        ]
+        if not accounts:
+            return results
+
+        # Providers are independent network-bound syncs, so run them side by
+        # side: wall time is the slowest provider rather than the sum
+        with ThreadPoolExecutor(max_workers=len(accounts)) as pool:
+            futures = {}
+            for account in accounts:
+                logger.info(f"Starting {account.provider} sync for user {self.user.email}")
+                # Hand over the loaded token so the service doesn't query it again
+                futures[account.provider] = pool.submit(
+                    _sync_provider, account, self.user, lookback_days, full_sync
+                )
 
-            try:
-                if provider == 'gmail':
-                    logger.info(f"Starting Gmail sync for user {self.user.email}")
-                    gmail_service = GmailService(self.db, self.user)
-                    stats = gmail_service.sync_emails(lookback_days, full_sync)
-                    results['gmail'] = stats
+            for provider, future in futures.items():
+                try:
+                    stats = future.result()
+                    results[provider] = stats
                     results['total_emails'] += stats.get('emails_created', 0)
                     results['total_threads'] += stats.get('threads_created', 0)
 
-                elif provider == 'outlook':
-                    logger.info(f"Starting Outlook sync for user {self.user.email}")
-                    outlook_service = OutlookService(self.db, self.user)
-                    stats = outlook_service.sync_emails(lookback_days, full_sync)
-                    results['outlook'] = stats
-                    results['total_emails'] += stats.get('emails_created', 0)
-                    results['total_threads'] += stats.get('threads_created', 0)
+                except Exception as e:
+                    error_msg = f"Failed to sync {provider}: {str(e)}"
+                    logger.error(error_msg)
+                    results['errors'].append(error_msg)
 
-            except Exception as e:
-                error_msg = f"Failed to sync {provider}: {str(e)}"
-                logger.error(error_msg)
-                results['errors'].append(error_msg)
+        invalidate_sync_status(self.user.id)
 
         logger.info(
             f"Email sync completed for user {self.user.email}: "
@@ -101,7 +148,11 @@ class EmailSyncService:
         """
         logger.info(f"Starting Gmail sync for user {self.user.email}")
         gmail_service = GmailService(self.db, self.user)
-        return gmail_service.sync_emails(lookback_days, full_sync)
+        try:
+            return gmail_service.sync_emails(lookback_days, full_sync)
+        finally:
+            # The sync logged a new result (success or error)
+            invalidate_sync_status(self.user.id)
 
     def sync_outlook(
         self,
@@ -120,49 +171,69 @@ class EmailSyncService:
         """
         logger.info(f"Starting Outlook sync for user {self.user.email}")
         outlook_service = OutlookService(self.db, self.user)
-        return outlook_service.sync_emails(lookback_days, full_sync)
+        try:
+            return outlook_service.sync_emails(lookback_days, full_sync)
+        finally:
+            # The sync logged a new result (success or error)
+            invalidate_sync_status(self.user.id)
 
     def get_sync_status(self) -> Dict[str, Any]:
         """
         Get sync status for user's accounts
 
+        Cached briefly in Redis for polling clients; the sync methods drop
+        the entry as soon as a new result is logged.
+
         Returns:
             Dictionary with sync status for each provider
         """
-        from models import SyncJobLog
+        key = _sync_status_key(self.user.id)
+        cached = cache_get(key)
+        if cached is not None:
+            return cached
 
         status = {
             'gmail': {'connected': False, 'last_sync': None, 'status': None},
             'outlook': {'connected': False, 'last_sync': None, 'status': None}
         }
 
-        # Check connected accounts
-        accounts = (
-            self.db.query(AccountToken)
-            .filter(AccountToken.user_id == self.user.id)
-            .all()
+        # Newest log per provider (DISTINCT ON), joined to the connected
+        # accounts so one round trip returns everything
+        latest = (
+            select(
+                SyncJobLog.provider,
+                SyncJobLog.status,
+                SyncJobLog.message,
+                SyncJobLog.created_at,
+                SyncJobLog.run_time_ms,
+            )
+            .where(SyncJobLog.user_id == self.user.id)
+            .distinct(SyncJobLog.provider)
+            .order_by(SyncJobLog.provider, SyncJobLog.created_at.desc())
+            .subquery()
+        )
+        rows = self.db.execute(
+            select(
+                AccountToken.provider,
+                AccountToken.email_address,
+                latest.c.status,
+                latest.c.message,
+                latest.c.created_at,
+                latest.c.run_time_ms,
+            )
+            .outerjoin(latest, latest.c.provider == AccountToken.provider)
+            .where(AccountToken.user_id == self.user.id)
         )
 
-        for account in accounts:
-            provider = account.provider
+        for provider, email_address, log_status, message, created_at, run_time_ms in rows:
             status[provider]['connected'] = True
-            status[provider]['email_address'] = account.email_address
-
-            # Get last sync log
-            last_log = (
-                self.db.query(SyncJobLog)
-                .filter(
-                    SyncJobLog.user_id == self.user.id,
-                    SyncJobLog.provider == provider
-                )
-                .order_by(SyncJobLog.created_at.desc())
-                .first()
-            )
+            status[provider]['email_address'] = email_address
 
-            if last_log:
-                status[provider]['last_sync'] = last_log.created_at.isoformat()
-                status[provider]['status'] = last_log.status
-                status[provider]['message'] = last_log.message
-                status[provider]['run_time_ms'] = last_log.run_time_ms
+            if created_at is not None:
+                status[provider]['last_sync'] = created_at.isoformat()
+                status[provider]['status'] = log_status
+                status[provider]['message'] = message
+                status[provider]['run_time_ms'] = run_time_ms
 
+        cache_set(key, status, settings.SYNC_STATUS_CACHE_TTL)
         return status
@@ -9,15 +9,19 @@ from datetime import datetime, timedelta
 from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
 
+import requests
+from requests.adapters import HTTPAdapter
+from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import Flow
-from googleapiclient.discovery import build
 
-from app.config import settings
+from app.config import get_settings
 from models import User, AccountToken
 from utils import encrypt_token, decrypt_token
 from core import ExternalServiceError
 
+settings = get_settings()
+
 logger = logging.getLogger(__name__)
 
 # Gmail API scopes
@@ -27,6 +31,8 @@ GMAIL_SCOPES = [
     'https://www.googleapis.com/auth/gmail.modify'
 ]
 
+GMAIL_PROFILE_URL = 'https://gmail.googleapis.com/gmail/v1/users/me/profile'
+
 
 class GmailOAuthService:
     """Service for Gmail OAuth operations"""
@@ -35,6 +41,37 @@ class GmailOAuthService:
         self.client_id = settings.GOOGLE_CLIENT_ID
         self.client_secret = settings.GOOGLE_CLIENT_SECRET
         self.redirect_uri = settings.GOOGLE_REDIRECT_URI
+        self.client_config = {
+            "web": {
+                "client_id": self.client_id,
+                "client_secret": self.client_secret,
+                "auth_uri": "https://accounts.google.com/o/oauth2/auth",
+                "token_uri": "https://oauth2.googleapis.com/token",
+                "redirect_uris": [self.redirect_uri],
+            }
+        }
+        # Pooled keep-alive connections to Google, shared by token refresh,
+        # revoke and the OAuth code exchange
+        self.http = requests.Session()
+        self._adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+        self.http.mount("https://", self._adapter)
+        self.auth_request = Request(session=self.http)
+
+    def _flow(self) -> Flow:
+        """
+        Build an OAuth flow that sends its requests over the shared pool
+
+        A Flow carries per-authorization state, so one is built per call;
+        only its transport adapter is shared, so the token exchange reuses
+        warm TLS connections instead of handshaking each time.
+        """
+        flow = Flow.from_client_config(
+            self.client_config,
+            scopes=GMAIL_SCOPES,
+            redirect_uri=self.redirect_uri
+        )
+        flow.oauth2session.mount("https://", self._adapter)
+        return flow
 
     def get_authorization_url(self, state: Optional[str] = None) -> str:
         """
@@ -46,19 +83,7 @@ class GmailOAuthService:
         Returns:
             Authorization URL to redirect user to
         """
-        flow = Flow.from_client_config(
-            {
-                "web": {
-                    "client_id": self.client_id,
-                    "client_secret": self.client_secret,
-                    "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                    "token_uri": "https://oauth2.googleapis.com/token",
-                    "redirect_uris": [self.redirect_uri],
-                }
-            },
-            scopes=GMAIL_SCOPES,
-            redirect_uri=self.redirect_uri
-        )
+        flow = self._flow()
 
         authorization_url, _ = flow.authorization_url(
             access_type='offline',
@@ -83,27 +108,20 @@ class GmailOAuthService:
             ExternalServiceError: If token exchange fails
         """
         try:
-            flow = Flow.from_client_config(
-                {
-                    "web": {
-                        "client_id": self.client_id,
-                        "client_secret": self.client_secret,
-                        "auth_uri": "https://accounts.google.com/o/oauth2/auth",
-                        "token_uri": "https://oauth2.googleapis.com/token",
-                        "redirect_uris": [self.redirect_uri],
-                    }
-                },
-                scopes=GMAIL_SCOPES,
-                redirect_uri=self.redirect_uri
-            )
+            flow = self._flow()
 
             flow.fetch_token(code=code)
             credentials = flow.credentials
 
-            # Get user email
-            gmail_service = build('gmail', 'v1', credentials=credentials)
-            profile = gmail_service.users().getProfile(userId='me').execute()
-            email_address = profile.get('emailAddress')
+            # Get user email with one REST call; build() would fetch and
+            # parse the whole discovery document just for this field
+            profile_response = self.http.get(
+                GMAIL_PROFILE_URL,
+                headers={'Authorization': f'Bearer {credentials.token}'},
+                timeout=5
+            )
+            profile_response.raise_for_status()
+            email_address = profile_response.json().get('emailAddress')
 
             return {
                 'access_token': credentials.token,
@@ -204,8 +222,7 @@ class GmailOAuthService:
             )
 
             # Refresh the token
-            from google.auth.transport.requests import Request
-            credentials.refresh(Request())
+            credentials.refresh(self.auth_request)
 
             # Update in database
             account_token.access_token = credentials.token
@@ -273,8 +290,7 @@ class GmailOAuthService:
         try:
             # Revoke token with Google
             credentials = self.get_valid_credentials(db, account_token)
-            from google.auth.transport.requests import Request
-            credentials.revoke(Request())
+            credentials.revoke(self.auth_request)
 
             # Delete from database
             db.delete(account_token)
@@ -286,3 +302,7 @@ class GmailOAuthService:
         except Exception as e:
             logger.error(f"Failed to revoke Gmail access: {str(e)}")
             return False
+
+
+# Shared instance: configuration and the HTTP session are reused across requests
+gmail_oauth_service = GmailOAuthService()
@@ -11,9 +11,12 @@ from sqlalchemy.orm import Session
 from googleapiclient.discovery import build
 
 from models import User, AccountToken, Thread, Email, SyncJobLog
-from services.gmail_oauth import GmailOAuthService
+from db import insert_rows
+from services.gmail_oauth import gmail_oauth_service
 from utils import email_parser, storage_service
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
@@ -21,11 +24,48 @@ logger = logging.getLogger(__name__)
 class GmailService:
     """Service for Gmail email operations"""
 
-    def __init__(self, db: Session, user: User):
+    def __init__(
+        self,
+        db: Session,
+        user: User,
+        account_token: Optional[AccountToken] = None
+    ):
+        """
+        Initialize Gmail service
+
+        Args:
+            db: Database session
+            user: User model instance
+            account_token: The user's token if the caller already loaded it
+                (must belong to ``db``); looked up otherwise
+        """
         self.db = db
         self.user = user
-        self.oauth_service = GmailOAuthService()
-        self.account_token = self._get_account_token()
+        self.oauth_service = gmail_oauth_service
+        self.account_token = (
+            account_token if account_token is not None else self._get_account_token()
+        )
+
+    @classmethod
+    def for_session(cls, db: Session, user: User) -> "GmailService":
+        """
+        Get the service for this user, shared for the life of the session
+
+        The instance is memoized in ``db.info``, so repeated lookups within
+        one request reuse the loaded account token instead of re-querying.
+
+        Args:
+            db: Database session (one per request)
+            user: User model instance
+
+        Returns:
+            GmailService instance
+        """
+        key = ("gmail_service", user.id)
+        service = db.info.get(key)
+        if service is None:
+            service = db.info[key] = cls(db, user)
+        return service
 
     def _get_account_token(self) -> Optional[AccountToken]:
         """Get user's Gmail account token"""
@@ -237,14 +277,20 @@ class GmailService:
 
             logger.info(f"Syncing {len(message_ids)} Gmail messages")
 
-            # Process each message
+            # Process each message, inserting new emails in batches
+            batch: List[Dict[str, Any]] = []
             for msg_id in message_ids:
                 try:
-                    self._sync_single_message(msg_id, stats)
+                    self._sync_single_message(msg_id, stats, batch)
                 except Exception as e:
                     logger.error(f"Failed to sync message {msg_id}: {str(e)}")
                     stats['errors'] += 1
 
+                if len(batch) >= settings.EMAIL_SYNC_BATCH_SIZE:
+                    self._flush_email_batch(batch, stats)
+
+            self._flush_email_batch(batch, stats)
+
             # Log sync job
             run_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
             self._log_sync_job('success', run_time_ms, f"Synced {stats['emails_created']} emails")
@@ -258,13 +304,20 @@ class GmailService:
             self._log_sync_job('error', run_time_ms, str(e))
             raise
 
-    def _sync_single_message(self, message_id: str, stats: Dict[str, Any]):
+    def _sync_single_message(
+        self,
+        message_id: str,
+        stats: Dict[str, Any],
+        batch: Optional[List[Dict[str, Any]]] = None
+    ):
         """
         Sync a single message to database
 
         Args:
             message_id: Gmail message ID
             stats: Statistics dictionary to update
+            batch: If given, the email row is appended here for a later
+                bulk insert instead of being committed immediately
         """
         # Check if message already exists
         existing_email = (
@@ -313,23 +366,56 @@ class GmailService:
                 )
 
         # Create email record
-        email = Email(
-            thread_id=thread.id,
-            user_id=self.user.id,
-            email_id_provider=message_id,
-            sender=metadata['from'],
-            recipients=metadata['to'] + metadata['cc'],
-            body_html_url=html_url,
-            body_text_clean=text_content,
-            timestamp=datetime.utcnow()  # Parse from metadata['date'] if needed
-        )
+        email_row = {
+            'thread_id': thread.id,
+            'user_id': self.user.id,
+            'email_id_provider': message_id,
+            'sender': metadata['from'],
+            'recipients': metadata['to'] + metadata['cc'],
+            'body_html_url': html_url,
+            'body_text_clean': text_content,
+            'timestamp': datetime.utcnow(),  # Parse from metadata['date'] if needed
+        }
+
+        if batch is not None:
+            batch.append(email_row)
+            return
 
-        self.db.add(email)
+        self.db.add(Email(**email_row))
         self.db.commit()
 
         stats['emails_created'] += 1
         logger.info(f"Synced email {message_id} to thread {thread.id}")
 
+    def _flush_email_batch(self, batch: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """
+        Insert and clear a batch of pending email rows
+
+        Args:
+            batch: Email row mappings collected by _sync_single_message
+            stats: Statistics dictionary to update
+        """
+        if not batch:
+            return
+
+        try:
+            # Messages stored meanwhile (overlapping sync, concurrent worker)
+            # are skipped rather than failing the whole batch
+            inserted = insert_rows(
+                self.db, Email, batch, conflict_columns=("email_id_provider",)
+            )
+            stats['emails_created'] += inserted
+            logger.info(
+                f"Inserted batch of {len(batch)} emails "
+                f"({len(batch) - inserted} already stored)"
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to insert batch of {len(batch)} emails: {str(e)}")
+            stats['errors'] += len(batch)
+        finally:
+            batch.clear()
+
     def _get_or_create_thread(
         self,
         thread_id_provider: str,
@@ -367,6 +453,7 @@ class GmailService:
         thread = Thread(
             user_id=self.user.id,
             thread_id_provider=thread_id_provider,
+            provider="gmail",
             subject=subject or "(No subject)",
             last_message_at=last_message_at
         )
@@ -519,7 +606,7 @@ class GmailService:
         latest_email = (
             self.db.query(Email)
             .filter(Email.thread_id == thread.id)
-            .order_by(Email.received_at.desc())
+            .order_by(Email.timestamp.desc())
             .first()
         )
 
@@ -4,14 +4,16 @@ LLM Provider Client
 Provides interface to OpenAI and Gemini APIs for AI processing
 """
 
-import json
 import logging
 from typing import Optional, Dict, Any, Union
 
 import openai
+import orjson
 import google.generativeai as genai
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +31,8 @@ class GeminiProvider:
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 1000,
-        json_mode: bool = False
+        json_mode: bool = False,
+        stream: bool = False
     ) -> str:
         """
         Generate text using Gemini API
@@ -39,6 +42,7 @@ class GeminiProvider:
             temperature: Sampling temperature (0-1 for Gemini)
             max_tokens: Maximum tokens to generate
             json_mode: Whether to enforce JSON output
+            stream: Receive the completion in chunks as it is generated
 
         Returns:
             Generated text
@@ -57,10 +61,15 @@ class GeminiProvider:
 
             response = self.model.generate_content(
                 prompt,
-                generation_config=generation_config
+                generation_config=generation_config,
+                stream=stream
             )
-            
-            result = response.text
+
+            if stream:
+                # Collect chunk texts and join once at the end
+                result = "".join(chunk.text for chunk in response)
+            else:
+                result = response.text
             logger.info(f"Gemini API call successful - Model: {self.model_name}")
 
             return result
@@ -76,8 +85,13 @@ class GeminiProvider:
 class OpenAIProvider:
     """OpenAI GPT provider"""
 
-    def __init__(self, api_key: str, model: str = "gpt-4-turbo-preview"):
-        self.client = openai.OpenAI(api_key=api_key)
+    def __init__(
+        self,
+        api_key: str,
+        model: str = "gpt-4-turbo-preview",
+        base_url: Optional[str] = None
+    ):
+        self.client = openai.OpenAI(api_key=api_key, base_url=base_url)
         self.model = model
 
     def generate(
@@ -85,7 +99,8 @@ class OpenAIProvider:
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 1000,
-        json_mode: bool = False
+        json_mode: bool = False,
+        stream: bool = False
     ) -> str:
         """
         Generate text using OpenAI API
@@ -95,6 +110,7 @@ class OpenAIProvider:
             temperature: Sampling temperature (0-2)
             max_tokens: Maximum tokens to generate
             json_mode: Whether to enforce JSON output
+            stream: Receive the completion in chunks as it is generated
 
         Returns:
             Generated text
@@ -114,9 +130,18 @@ class OpenAIProvider:
             if json_mode and "gpt-4" in self.model:
                 params["response_format"] = {"type": "json_object"}
 
-            response = self.client.chat.completions.create(**params)
-
-            result = response.choices[0].message.content
+            if stream:
+                params["stream"] = True
+                # Collect deltas and join once at the end; the final chunk
+                # may carry no content (or no choices at all)
+                result = "".join(
+                    chunk.choices[0].delta.content
+                    for chunk in self.client.chat.completions.create(**params)
+                    if chunk.choices and chunk.choices[0].delta.content
+                )
+            else:
+                response = self.client.chat.completions.create(**params)
+                result = response.choices[0].message.content
             logger.info(f"OpenAI API call successful - Model: {self.model}")
 
             return result
@@ -155,6 +180,15 @@ def get_llm_provider(model: Optional[str] = None) -> Union[OpenAIProvider, Gemin
             
         return GeminiProvider(api_key=settings.GEMINI_API_KEY, model=model)
 
+    # Self-hosted OpenAI-compatible server (vLLM batches concurrent requests)
+    if settings.OPENAI_BASE_URL:
+        model = model or settings.OPENAI_MODEL
+        return OpenAIProvider(
+            api_key=settings.OPENAI_API_KEY or "EMPTY",
+            model=model,
+            base_url=settings.OPENAI_BASE_URL,
+        )
+
     # Default to OpenAI
     if not settings.OPENAI_API_KEY:
         # Fallback to Gemini if OpenAI is missing but Gemini is present
@@ -184,25 +218,25 @@ def parse_json_response(response: str) -> Dict[str, Any]:
     """
     try:
         # Try direct parsing first
-        return json.loads(response)
-    except json.JSONDecodeError:
+        return orjson.loads(response)
+    except orjson.JSONDecodeError:
         # Try to extract JSON from markdown code blocks
         if "```json" in response:
             start = response.find("```json") + 7
             end = response.find("```", start)
             json_str = response[start:end].strip()
-            return json.loads(json_str)
+            return orjson.loads(json_str)
         elif "```" in response:
             start = response.find("```") + 3
             end = response.find("```", start)
             json_str = response[start:end].strip()
-            return json.loads(json_str)
+            return orjson.loads(json_str)
         else:
             # Try to find JSON object in text
             start = response.find("{")
             end = response.rfind("}") + 1
             if start != -1 and end != 0:
                 json_str = response[start:end]
-                return json.loads(json_str)
+                return orjson.loads(json_str)
 
         raise ValueError(f"Could not parse JSON from response: {response[:200]}")
@@ -11,11 +11,13 @@ from sqlalchemy.orm import Session
 import msal
 import requests
 
-from app.config import settings
+from app.config import get_settings
 from models import User, AccountToken
 from utils import encrypt_token, decrypt_token
 from core import ExternalServiceError
 
+settings = get_settings()
+
 logger = logging.getLogger(__name__)
 
 # Microsoft Graph scopes
@@ -35,6 +37,26 @@ class OutlookOAuthService:
         self.redirect_uri = settings.MICROSOFT_REDIRECT_URI
         self.tenant_id = settings.MICROSOFT_TENANT_ID
         self.authority = f"https://login.microsoftonline.com/{self.tenant_id}"
+        # Pooled keep-alive connections to Microsoft Graph
+        self.http = requests.Session()
+        # Authority/discovery responses MSAL fetches while building a client;
+        # holds no tokens, so one cache is shared by every client
+        self._msal_http_cache = {}
+
+    def _msal_client(self) -> msal.ConfidentialClientApplication:
+        """
+        Build an MSAL client for a single token operation
+
+        Each client has its own token cache, which is dropped with it, so
+        tokens never pile up in the process or cross between users.
+        """
+        return msal.ConfidentialClientApplication(
+            self.client_id,
+            authority=self.authority,
+            client_credential=self.client_secret,
+            http_client=self.http,
+            http_cache=self._msal_http_cache,
+        )
 
     def get_authorization_url(self, state: str = None) -> str:
         """
@@ -46,13 +68,7 @@ class OutlookOAuthService:
         Returns:
             Authorization URL to redirect user to
         """
-        app = msal.ConfidentialClientApplication(
-            self.client_id,
-            authority=self.authority,
-            client_credential=self.client_secret
-        )
-
-        auth_url = app.get_authorization_request_url(
+        auth_url = self._msal_client().get_authorization_request_url(
             scopes=OUTLOOK_SCOPES,
             redirect_uri=self.redirect_uri,
             state=state,
@@ -75,13 +91,7 @@ class OutlookOAuthService:
             ExternalServiceError: If token exchange fails
         """
         try:
-            app = msal.ConfidentialClientApplication(
-                self.client_id,
-                authority=self.authority,
-                client_credential=self.client_secret
-            )
-
-            result = app.acquire_token_by_authorization_code(
+            result = self._msal_client().acquire_token_by_authorization_code(
                 code=code,
                 scopes=OUTLOOK_SCOPES,
                 redirect_uri=self.redirect_uri
@@ -95,7 +105,7 @@ class OutlookOAuthService:
             # Get user email from Microsoft Graph
             access_token = result['access_token']
             headers = {'Authorization': f'Bearer {access_token}'}
-            user_response = requests.get(
+            user_response = self.http.get(
                 'https://graph.microsoft.com/v1.0/me',
                 headers=headers
             )
@@ -195,13 +205,7 @@ class OutlookOAuthService:
             # Decrypt refresh token
             refresh_token = decrypt_token(account_token.refresh_token)
 
-            app = msal.ConfidentialClientApplication(
-                self.client_id,
-                authority=self.authority,
-                client_credential=self.client_secret
-            )
-
-            result = app.acquire_token_by_refresh_token(
+            result = self._msal_client().acquire_token_by_refresh_token(
                 refresh_token=refresh_token,
                 scopes=OUTLOOK_SCOPES
             )
@@ -284,3 +288,7 @@ class OutlookOAuthService:
         except Exception as e:
             logger.error(f"Failed to revoke Outlook access: {str(e)}")
             return False
+
+
+# Shared instance: configuration, the MSAL client and the HTTP session are reused
+outlook_oauth_service = OutlookOAuthService()
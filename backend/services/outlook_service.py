@@ -8,26 +8,72 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
-import requests
 
 from models import User, AccountToken, Thread, Email, SyncJobLog
-from services.outlook_oauth import OutlookOAuthService
+from db import insert_rows
+from services.outlook_oauth import outlook_oauth_service
 from utils import email_parser, storage_service
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
 GRAPH_API_ENDPOINT = 'https://graph.microsoft.com/v1.0'
 
 
+def _parse_graph_datetime(value: str) -> datetime:
+    """Graph's ISO 8601 UTC timestamp as a naive UTC datetime, like our columns"""
+    return datetime.fromisoformat(value.replace('Z', '+00:00')).replace(tzinfo=None)
+
+
 class OutlookService:
     """Service for Outlook email operations"""
 
-    def __init__(self, db: Session, user: User):
+    def __init__(
+        self,
+        db: Session,
+        user: User,
+        account_token: Optional[AccountToken] = None
+    ):
+        """
+        Initialize Outlook service
+
+        Args:
+            db: Database session
+            user: User model instance
+            account_token: The user's token if the caller already loaded it
+                (must belong to ``db``); looked up otherwise
+        """
         self.db = db
         self.user = user
-        self.oauth_service = OutlookOAuthService()
-        self.account_token = self._get_account_token()
+        self.oauth_service = outlook_oauth_service
+        # Keep-alive connection pool shared with the OAuth service
+        self.http = outlook_oauth_service.http
+        self.account_token = (
+            account_token if account_token is not None else self._get_account_token()
+        )
+
+    @classmethod
+    def for_session(cls, db: Session, user: User) -> "OutlookService":
+        """
+        Get the service for this user, shared for the life of the session
+
+        The instance is memoized in ``db.info``, so repeated lookups within
+        one request reuse the loaded account token instead of re-querying.
+
+        Args:
+            db: Database session (one per request)
+            user: User model instance
+
+        Returns:
+            OutlookService instance
+        """
+        key = ("outlook_service", user.id)
+        service = db.info.get(key)
+        if service is None:
+            service = db.info[key] = cls(db, user)
+        return service
 
     def _get_account_token(self) -> Optional[AccountToken]:
         """Get user's Outlook account token"""
@@ -84,7 +130,7 @@ class OutlookService:
             if filter_query:
                 params['$filter'] = filter_query
 
-            response = requests.get(
+            response = self.http.get(
                 url,
                 headers=self._get_headers(),
                 params=params
@@ -118,7 +164,7 @@ class OutlookService:
         try:
             url = f"{GRAPH_API_ENDPOINT}/me/messages/{message_id}"
 
-            response = requests.get(
+            response = self.http.get(
                 url,
                 headers=self._get_headers()
             )
@@ -168,14 +214,20 @@ class OutlookService:
 
             logger.info(f"Syncing {len(messages)} Outlook messages")
 
-            # Process each message
+            # Process each message, inserting new emails in batches
+            batch: List[Dict[str, Any]] = []
             for message in messages:
                 try:
-                    self._sync_single_message(message, stats)
+                    self._sync_single_message(message, stats, batch)
                 except Exception as e:
                     logger.error(f"Failed to sync message {message.get('id')}: {str(e)}")
                     stats['errors'] += 1
 
+                if len(batch) >= settings.EMAIL_SYNC_BATCH_SIZE:
+                    self._flush_email_batch(batch, stats)
+
+            self._flush_email_batch(batch, stats)
+
             # Log sync job
             run_time_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
             self._log_sync_job('success', run_time_ms, f"Synced {stats['emails_created']} emails")
@@ -189,13 +241,20 @@ class OutlookService:
             self._log_sync_job('error', run_time_ms, str(e))
             raise
 
-    def _sync_single_message(self, message_data: Dict[str, Any], stats: Dict[str, Any]):
+    def _sync_single_message(
+        self,
+        message_data: Dict[str, Any],
+        stats: Dict[str, Any],
+        batch: Optional[List[Dict[str, Any]]] = None
+    ):
         """
         Sync a single message to database
 
         Args:
             message_data: Full message data from Graph API
             stats: Statistics dictionary to update
+            batch: If given, the email row is appended here for a later
+                bulk insert instead of being committed immediately
         """
         message_id = message_data.get('id')
 
@@ -247,23 +306,56 @@ class OutlookService:
                 )
 
         # Create email record
-        email = Email(
-            thread_id=thread.id,
-            user_id=self.user.id,
-            email_id_provider=message_id,
-            sender=metadata['from'],
-            recipients=metadata['to'] + metadata['cc'],
-            body_html_url=html_url,
-            body_text_clean=text_content,
-            timestamp=timestamp
-        )
+        email_row = {
+            'thread_id': thread.id,
+            'user_id': self.user.id,
+            'email_id_provider': message_id,
+            'sender': metadata['from'],
+            'recipients': metadata['to'] + metadata['cc'],
+            'body_html_url': html_url,
+            'body_text_clean': text_content,
+            'timestamp': timestamp,
+        }
+
+        if batch is not None:
+            batch.append(email_row)
+            return
 
-        self.db.add(email)
+        self.db.add(Email(**email_row))
         self.db.commit()
 
         stats['emails_created'] += 1
         logger.info(f"Synced email {message_id} to thread {thread.id}")
 
+    def _flush_email_batch(self, batch: List[Dict[str, Any]], stats: Dict[str, Any]):
+        """
+        Insert and clear a batch of pending email rows
+
+        Args:
+            batch: Email row mappings collected by _sync_single_message
+            stats: Statistics dictionary to update
+        """
+        if not batch:
+            return
+
+        try:
+            # Messages stored meanwhile (overlapping sync, concurrent worker)
+            # are skipped rather than failing the whole batch
+            inserted = insert_rows(
+                self.db, Email, batch, conflict_columns=("email_id_provider",)
+            )
+            stats['emails_created'] += inserted
+            logger.info(
+                f"Inserted batch of {len(batch)} emails "
+                f"({len(batch) - inserted} already stored)"
+            )
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"Failed to insert batch of {len(batch)} emails: {str(e)}")
+            stats['errors'] += len(batch)
+        finally:
+            batch.clear()
+
     def _get_or_create_thread(
         self,
         thread_id_provider: str,
@@ -302,6 +394,7 @@ class OutlookService:
         thread = Thread(
             user_id=self.user.id,
             thread_id_provider=thread_id_provider,
+            provider="outlook",
             subject=subject or "(No subject)",
             last_message_at=last_message_at
         )
@@ -374,7 +467,7 @@ class OutlookService:
                     {"emailAddress": {"address": addr}} for addr in bcc
                 ]
 
-            response = requests.post(
+            response = self.http.post(
                 url,
                 headers=self._get_headers(),
                 json=message_data
@@ -417,7 +510,7 @@ class OutlookService:
             if is_html:
                 return self._send_html_reply(message_id, body)
 
-            response = requests.post(
+            response = self.http.post(
                 url,
                 headers=self._get_headers(),
                 json=reply_data
@@ -445,7 +538,7 @@ class OutlookService:
         try:
             # Step 1: Create reply draft
             create_url = f"{GRAPH_API_ENDPOINT}/me/messages/{message_id}/createReply"
-            response = requests.post(create_url, headers=self._get_headers())
+            response = self.http.post(create_url, headers=self._get_headers())
             response.raise_for_status()
 
             draft = response.json()
@@ -459,7 +552,7 @@ class OutlookService:
                     "content": body
                 }
             }
-            response = requests.patch(
+            response = self.http.patch(
                 update_url,
                 headers=self._get_headers(),
                 json=update_data
@@ -468,7 +561,7 @@ class OutlookService:
 
             # Step 3: Send the draft
             send_url = f"{GRAPH_API_ENDPOINT}/me/messages/{draft_id}/send"
-            response = requests.post(send_url, headers=self._get_headers())
+            response = self.http.post(send_url, headers=self._get_headers())
             response.raise_for_status()
 
             logger.info(f"Sent HTML reply to message {message_id}")
@@ -499,7 +592,7 @@ class OutlookService:
                 "clientState": settings.OUTLOOK_WEBHOOK_CLIENT_STATE
             }
 
-            response = requests.post(
+            response = self.http.post(
                 url,
                 headers=self._get_headers(),
                 json=subscription_data
@@ -508,13 +601,12 @@ class OutlookService:
 
             subscription = response.json()
 
-            # Store subscription ID in account metadata
+            # Store the subscription ID; webhook notifications are matched by it
             if self.account_token:
-                if not self.account_token.metadata:
-                    self.account_token.metadata = {}
-
-                self.account_token.metadata['subscription_id'] = subscription['id']
-                self.account_token.metadata['subscription_expiration'] = subscription['expirationDateTime']
+                self.account_token.subscription_id = subscription['id']
+                self.account_token.subscription_expires_at = _parse_graph_datetime(
+                    subscription['expirationDateTime']
+                )
                 self.db.commit()
 
             logger.info(f"Outlook subscription created: {subscription['id']}")
@@ -543,7 +635,7 @@ class OutlookService:
                 "expirationDateTime": self._get_subscription_expiration()
             }
 
-            response = requests.patch(
+            response = self.http.patch(
                 url,
                 headers=self._get_headers(),
                 json=update_data
@@ -552,9 +644,11 @@ class OutlookService:
 
             subscription = response.json()
 
-            # Update metadata
-            if self.account_token and self.account_token.metadata:
-                self.account_token.metadata['subscription_expiration'] = subscription['expirationDateTime']
+            # Update the stored expiration
+            if self.account_token and self.account_token.subscription_id == subscription_id:
+                self.account_token.subscription_expires_at = _parse_graph_datetime(
+                    subscription['expirationDateTime']
+                )
                 self.db.commit()
 
             logger.info(f"Outlook subscription renewed: {subscription_id}")
@@ -579,16 +673,16 @@ class OutlookService:
         try:
             url = f"{GRAPH_API_ENDPOINT}/subscriptions/{subscription_id}"
 
-            response = requests.delete(
+            response = self.http.delete(
                 url,
                 headers=self._get_headers()
             )
             response.raise_for_status()
 
-            # Clear metadata
-            if self.account_token and self.account_token.metadata:
-                self.account_token.metadata.pop('subscription_id', None)
-                self.account_token.metadata.pop('subscription_expiration', None)
+            # Forget the subscription
+            if self.account_token and self.account_token.subscription_id == subscription_id:
+                self.account_token.subscription_id = None
+                self.account_token.subscription_expires_at = None
                 self.db.commit()
 
             logger.info(f"Outlook subscription deleted: {subscription_id}")
@@ -5,7 +5,29 @@ This module contains all prompt templates for different AI tasks.
 These are the foundation of the AI orchestration layer.
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+# Per-email layouts used to render a thread's emails into a prompt. The
+# timestamp stays a datetime until a layout that shows it is rendered.
+EMAIL_FORMAT_DATED = (
+    "From: {sender}\nDate: {timestamp:%Y-%m-%d %H:%M}\nMessage:\n{body}\n\n---\n\n"
+)
+EMAIL_FORMAT_BRIEF = "From: {sender}:\n{body}\n\n"
+EMAIL_FORMAT_RULED = "From: {sender}:\n{body}\n\n---\n\n"
+
+
+def render_emails(emails: List[Dict[str, Any]], email_format: str) -> str:
+    """
+    Render a thread's emails into one prompt block
+
+    Args:
+        emails: List of email dictionaries with sender, timestamp, body
+        email_format: One of the EMAIL_FORMAT_* layouts
+
+    Returns:
+        The concatenated email block
+    """
+    return "".join(email_format.format_map(email) for email in emails)
 
 
 class PromptTemplates:
@@ -15,7 +37,8 @@ class PromptTemplates:
     def summarization_prompt(
         thread_subject: str,
         emails: list,
-        company_context: Dict[str, Any] = None
+        company_context: Dict[str, Any] = None,
+        emails_block: Optional[str] = None
     ) -> str:
         """
         Generate prompt for email thread summarization
@@ -24,17 +47,15 @@ class PromptTemplates:
             thread_subject: Email thread subject
             emails: List of email dictionaries with sender, timestamp, body
             company_context: Optional company context for better understanding
+            emails_block: Prebuilt render_emails(emails, EMAIL_FORMAT_DATED)
 
         Returns:
             Formatted prompt string
         """
         # Build email thread text
-        thread_text = f"Subject: {thread_subject}\n\n"
-        for email in emails:
-            thread_text += f"From: {email['sender']}\n"
-            thread_text += f"Date: {email['timestamp']}\n"
-            thread_text += f"Message:\n{email['body']}\n\n"
-            thread_text += "---\n\n"
+        if emails_block is None:
+            emails_block = render_emails(emails, EMAIL_FORMAT_DATED)
+        thread_text = f"Subject: {thread_subject}\n\n{emails_block}"
 
         # Add company context if available
         context_section = ""
@@ -116,17 +137,19 @@ Output as JSON:
     @staticmethod
     def sentiment_analysis_prompt(
         thread_subject: str,
-        emails: list
+        emails: list,
+        emails_block: Optional[str] = None
     ) -> str:
         """
         Generate prompt for sentiment analysis
 
-        Returns sentiment score, label, anger level, urgency score
+        Returns sentiment score, label, anger level, urgency score.
+        ``emails_block`` is a prebuilt render_emails(emails, EMAIL_FORMAT_BRIEF).
         """
         # Build thread text
-        thread_text = f"Subject: {thread_subject}\n\n"
-        for email in emails:
-            thread_text += f"From: {email['sender']}:\n{email['body']}\n\n"
+        if emails_block is None:
+            emails_block = render_emails(emails, EMAIL_FORMAT_BRIEF)
+        thread_text = f"Subject: {thread_subject}\n\n{emails_block}"
 
         prompt = f"""You are an AI assistant specialized in analyzing the emotional tone of email conversations.
 
@@ -157,7 +180,8 @@ Consider:
         thread_subject: str,
         emails: list,
         company_context: Dict[str, Any] = None,
-        tone: str = "professional and helpful"
+        tone: str = "professional and helpful",
+        emails_block: Optional[str] = None
     ) -> str:
         """
         Generate prompt for auto-reply drafting
@@ -167,14 +191,15 @@ Consider:
             emails: Email history
             company_context: Company policies, FAQs, tone guidelines
             tone: Desired tone (professional, friendly, formal, concise)
+            emails_block: Prebuilt render_emails(emails, EMAIL_FORMAT_RULED)
 
         Returns:
             Draft reply
         """
         # Build conversation history
-        conversation = f"Subject: {thread_subject}\n\n"
-        for email in emails:
-            conversation += f"From: {email['sender']}:\n{email['body']}\n\n---\n\n"
+        if emails_block is None:
+            emails_block = render_emails(emails, EMAIL_FORMAT_RULED)
+        conversation = f"Subject: {thread_subject}\n\n{emails_block}"
 
         # Build company context section
         context_section = ""
@@ -221,17 +246,19 @@ Draft Reply:"""
     def task_extraction_prompt(
         thread_subject: str,
         emails: list,
-        company_context: Dict[str, Any] = None
+        company_context: Dict[str, Any] = None,
+        emails_block: Optional[str] = None
     ) -> str:
         """
         Generate prompt for extracting action items and tasks
 
-        Returns list of tasks with title, description, due date, owner
+        Returns list of tasks with title, description, due date, owner.
+        ``emails_block`` is a prebuilt render_emails(emails, EMAIL_FORMAT_RULED).
         """
         # Build thread text
-        thread_text = f"Subject: {thread_subject}\n\n"
-        for email in emails:
-            thread_text += f"From: {email['sender']}:\n{email['body']}\n\n---\n\n"
+        if emails_block is None:
+            emails_block = render_emails(emails, EMAIL_FORMAT_RULED)
+        thread_text = f"Subject: {thread_subject}\n\n{emails_block}"
 
         roles_info = ""
         if company_context and company_context.get('roles'):
@@ -342,3 +369,14 @@ Requirements:
 Rewritten Draft:"""
 
         return prompt
+
+
+# Module-level aliases of the templates (plain functions), so hot callers
+# can import them directly instead of going through the class each call
+summarization_prompt = PromptTemplates.summarization_prompt
+priority_classification_prompt = PromptTemplates.priority_classification_prompt
+sentiment_analysis_prompt = PromptTemplates.sentiment_analysis_prompt
+reply_generation_prompt = PromptTemplates.reply_generation_prompt
+task_extraction_prompt = PromptTemplates.task_extraction_prompt
+escalation_detection_prompt = PromptTemplates.escalation_detection_prompt
+reply_rewrite_prompt = PromptTemplates.reply_rewrite_prompt
@@ -5,10 +5,11 @@ This service handles AI-powered auto-reply draft generation.
 """
 
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional
 
 from models import AIReplyDraft, User, Thread
+from db import upsert_row
 from services.ai_orchestrator import AIOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -39,28 +40,16 @@ class ReplyGenerationService:
         Returns:
             AIReplyDraft instance
         """
-        # Resolve thread_id to internal UUID
-        thread = None
-        try:
-            thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        except Exception:
-            self.db.rollback()
-            pass
-            
-        if not thread:
-            thread = self.db.query(Thread).filter(Thread.thread_id_provider == thread_id).first()
-            
+        # Resolve thread_id to internal UUID, loading the existing result up
+        # front so it doesn't need a separate query
+        thread = self.orchestrator.find_thread(thread_id, selectinload(Thread.reply_draft))
         if not thread:
             raise ValueError(f"Thread not found: {thread_id}")
-            
+
         internal_thread_id = str(thread.id)
 
         # Check if reply draft already exists
-        existing_draft = (
-            self.db.query(AIReplyDraft)
-            .filter(AIReplyDraft.thread_id == internal_thread_id)
-            .first()
-        )
+        existing_draft = thread.reply_draft
 
         if existing_draft and not force_regenerate:
             logger.info(f"Using existing reply draft for thread {internal_thread_id}")
@@ -68,23 +57,21 @@ class ReplyGenerationService:
 
         # Generate new reply
         logger.info(f"Generating reply draft for thread {thread_id}")
-        result = self.orchestrator.generate_reply(thread_id, tone)
-
-        # Save or update in database
-        if existing_draft:
-            existing_draft.draft_text = result["draft_text"]
-            existing_draft.tone_used = result["tone_used"]
-            draft = existing_draft
-        else:
-            draft = AIReplyDraft(
-                thread_id=thread_id,
-                draft_text=result["draft_text"],
-                tone_used=result["tone_used"]
-            )
-            self.db.add(draft)
+        result = self.orchestrator.generate_reply(
+            thread_id, tone, use_cache=not force_regenerate
+        )
 
-        self.db.commit()
-        self.db.refresh(draft)
+        # Insert or update in a single statement
+        draft = upsert_row(
+            self.db,
+            AIReplyDraft,
+            {
+                "thread_id": internal_thread_id,
+                "draft_text": result["draft_text"],
+                "tone_used": result["tone_used"],
+                "content_hash": result["content_hash"],
+            },
+        )
 
         logger.info(f"Reply draft saved for thread {thread_id}")
         return draft
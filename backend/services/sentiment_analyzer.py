@@ -5,9 +5,10 @@ This service handles AI-powered sentiment analysis of email threads.
 """
 
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from models import AISentiment, User, Thread
+from db import upsert_row
 from services.ai_orchestrator import AIOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -32,28 +33,16 @@ class SentimentAnalysisService:
         Returns:
             AISentiment instance
         """
-        # Resolve thread_id to internal UUID
-        thread = None
-        try:
-            thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        except Exception:
-            self.db.rollback()
-            pass
-            
-        if not thread:
-            thread = self.db.query(Thread).filter(Thread.thread_id_provider == thread_id).first()
-            
+        # Resolve thread_id to internal UUID, loading the existing result up
+        # front so it doesn't need a separate query
+        thread = self.orchestrator.find_thread(thread_id, selectinload(Thread.sentiment))
         if not thread:
             raise ValueError(f"Thread not found: {thread_id}")
-            
+
         internal_thread_id = str(thread.id)
 
         # Check if sentiment analysis already exists
-        existing_sentiment = (
-            self.db.query(AISentiment)
-            .filter(AISentiment.thread_id == internal_thread_id)
-            .first()
-        )
+        existing_sentiment = thread.sentiment
 
         if existing_sentiment and not force_regenerate:
             logger.info(f"Using existing sentiment analysis for thread {internal_thread_id}")
@@ -61,30 +50,26 @@ class SentimentAnalysisService:
 
         # Generate new sentiment analysis
         logger.info(f"Analyzing sentiment for thread {internal_thread_id}")
-        result = self.orchestrator.analyze_sentiment(internal_thread_id)
-
-        # Save or update in database
-        if existing_sentiment:
-            existing_sentiment.sentiment_score = result["sentiment_score"]
-            existing_sentiment.sentiment_label = result["sentiment_label"]
-            existing_sentiment.anger_level = result["anger_level"]
-            existing_sentiment.urgency_score = result["urgency_score"]
-            sentiment = existing_sentiment
-        else:
-            sentiment = AISentiment(
-                thread_id=thread_id,
-                sentiment_score=result["sentiment_score"],
-                sentiment_label=result["sentiment_label"],
-                anger_level=result["anger_level"],
-                urgency_score=result["urgency_score"]
-            )
-            self.db.add(sentiment)
-
-        self.db.commit()
-        self.db.refresh(sentiment)
+        result = self.orchestrator.analyze_sentiment(
+            internal_thread_id, use_cache=not force_regenerate
+        )
+
+        # Insert or update in a single statement
+        sentiment = upsert_row(
+            self.db,
+            AISentiment,
+            {
+                "thread_id": internal_thread_id,
+                "sentiment_score": result["sentiment_score"],
+                "sentiment_label": result["sentiment_label"],
+                "anger_level": result["anger_level"],
+                "urgency_score": result["urgency_score"],
+                "content_hash": result["content_hash"],
+            },
+        )
 
         logger.info(
             f"Sentiment analysis saved for thread {thread_id}: "
-            f"{sentiment.sentiment_label} (score: {sentiment.sentiment_score:.2f})"
+            f"{result['sentiment_label']} (score: {result['sentiment_score']:.2f})"
         )
         return sentiment
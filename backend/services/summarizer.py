@@ -5,10 +5,11 @@ This service handles generating and storing AI summaries for email threads.
 """
 
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import Optional
 
 from models import Thread, AIThreadSummary, User
+from db import upsert_row
 from services.ai_orchestrator import AIOrchestrator
 
 logger = logging.getLogger(__name__)
@@ -33,28 +34,16 @@ class SummarizationService:
         Returns:
             AIThreadSummary instance
         """
-        # Resolve thread_id to internal UUID
-        thread = None
-        try:
-            thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        except Exception:
-            self.db.rollback()
-            pass
-            
-        if not thread:
-            thread = self.db.query(Thread).filter(Thread.thread_id_provider == thread_id).first()
-            
+        # Resolve thread_id to internal UUID, loading the existing result up
+        # front so it doesn't need a separate query
+        thread = self.orchestrator.find_thread(thread_id, selectinload(Thread.summary))
         if not thread:
             raise ValueError(f"Thread not found: {thread_id}")
-            
+
         internal_thread_id = str(thread.id)
 
         # Check if summary already exists
-        existing_summary = (
-            self.db.query(AIThreadSummary)
-            .filter(AIThreadSummary.thread_id == internal_thread_id)
-            .first()
-        )
+        existing_summary = thread.summary
 
         if existing_summary and not force_regenerate:
             logger.info(f"Using existing summary for thread {internal_thread_id}")
@@ -62,23 +51,21 @@ class SummarizationService:
 
         # Generate new summary
         logger.info(f"Generating new summary for thread {internal_thread_id}")
-        result = self.orchestrator.summarize_thread(internal_thread_id)
-
-        # Save or update in database
-        if existing_summary:
-            existing_summary.summary_text = result["summary_text"]
-            existing_summary.model_used = result["model_used"]
-            summary = existing_summary
-        else:
-            summary = AIThreadSummary(
-                thread_id=thread_id,
-                summary_text=result["summary_text"],
-                model_used=result["model_used"]
-            )
-            self.db.add(summary)
-
-        self.db.commit()
-        self.db.refresh(summary)
+        result = self.orchestrator.summarize_thread(
+            internal_thread_id, use_cache=not force_regenerate
+        )
+
+        # Insert or update in a single statement
+        summary = upsert_row(
+            self.db,
+            AIThreadSummary,
+            {
+                "thread_id": internal_thread_id,
+                "summary_text": result["summary_text"],
+                "model_used": result["model_used"],
+                "content_hash": result["content_hash"],
+            },
+        )
 
         logger.info(f"Summary saved for thread {thread_id}")
         return summary
@@ -5,7 +5,7 @@ This service handles AI-powered extraction of action items and tasks from emails
 """
 
 import logging
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from typing import List
 from datetime import datetime
 
@@ -38,28 +38,16 @@ class TaskExtractionService:
         Returns:
             List of Task instances
         """
-        # Resolve thread_id to internal UUID
-        thread = None
-        try:
-            thread = self.db.query(Thread).filter(Thread.id == thread_id).first()
-        except Exception:
-            self.db.rollback()
-            pass
-            
-        if not thread:
-            thread = self.db.query(Thread).filter(Thread.thread_id_provider == thread_id).first()
-            
+        # Resolve thread_id to internal UUID, loading the existing result up
+        # front so it doesn't need a separate query
+        thread = self.orchestrator.find_thread(thread_id, selectinload(Thread.tasks))
         if not thread:
             raise ValueError(f"Thread not found: {thread_id}")
-            
+
         internal_thread_id = str(thread.id)
 
         # Check if tasks already exist
-        existing_tasks = (
-            self.db.query(Task)
-            .filter(Task.thread_id == internal_thread_id)
-            .all()
-        )
+        existing_tasks = list(thread.tasks)
 
         if existing_tasks and not force_regenerate:
             logger.info(f"Using existing tasks for thread {internal_thread_id}")
@@ -98,9 +98,9 @@ def test_redis_connection():
     """Test Redis connection"""
     print("\n📦 Testing Redis connection...")
     try:
-        from core.redis_client import get_redis_client
+        from core.redis_client import get_redis
 
-        redis_client = get_redis_client()
+        redis_client = get_redis()
         redis_client.ping()
         print("✅ Redis connection successful")
         return True
@@ -128,7 +128,8 @@ def check_openai_key():
     """Check if OpenAI API key is configured"""
     print("\n🤖 Checking OpenAI API key...")
     try:
-        from app.config import settings
+        from app.config import get_settings
+        settings = get_settings()
 
         if settings.OPENAI_API_KEY and not settings.OPENAI_API_KEY.startswith("your-"):
             print("✅ OpenAI API key configured")
@@ -2,39 +2,56 @@
 Test Configuration
 
 Pytest fixtures and configuration for backend tests
+
+Database tests run against the Postgres database in TEST_DATABASE_URL (the
+models use JSONB, tsvector and trigram indexes, so SQLite can't stand in).
+Its tables are created and dropped around every test, so never point it at
+a database you care about. Without it, database tests are skipped.
 """
 
+import os
+
+# Settings are read at import time, so the environment must be in place
+# before anything from the app is imported
+TEST_DATABASE_URL = os.environ.get("TEST_DATABASE_URL")
+if TEST_DATABASE_URL:
+    os.environ["DATABASE_URL"] = TEST_DATABASE_URL
+
+for _name, _value in {
+    "DATABASE_URL": "postgresql://localhost/inbox_manager_test",
+    "REDIS_URL": "redis://localhost:6379/15",
+    "SECRET_KEY": "test-secret-key",
+    "GOOGLE_CLIENT_ID": "test-google-client-id",
+    "GOOGLE_CLIENT_SECRET": "test-google-client-secret",
+    "GOOGLE_REDIRECT_URI": "http://localhost:8000/api/v1/auth/google/callback",
+    "MICROSOFT_CLIENT_ID": "test-microsoft-client-id",
+    "MICROSOFT_CLIENT_SECRET": "test-microsoft-client-secret",
+    "MICROSOFT_REDIRECT_URI": "http://localhost:8000/api/v1/auth/outlook/callback",
+    "OUTLOOK_WEBHOOK_CLIENT_STATE": "test-client-state",
+}.items():
+    os.environ.setdefault(_name, _value)
+
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
 
 from app.main import app
-from db import Base, get_db
-from models import User
-from app.security import create_access_token
-
-# Test database setup
-SQLALCHEMY_DATABASE_URL = "sqlite:///:memory:"
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-    poolclass=StaticPool,
-)
-
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from db import engine, get_db, SessionLocal
+from models import Base, User
+from core import create_access_token, get_password_hash
 
 
 @pytest.fixture(scope="function")
 def db_session():
     """Create a fresh database for each test"""
+    if not TEST_DATABASE_URL:
+        pytest.skip("TEST_DATABASE_URL is not set")
+
     Base.metadata.create_all(bind=engine)
-    session = TestingSessionLocal()
+    session = SessionLocal()
     try:
         yield session
     finally:
+        # Close first: an open transaction would block the DROPs
         session.close()
         Base.metadata.drop_all(bind=engine)
 
@@ -57,13 +74,10 @@ def client(db_session):
 @pytest.fixture(scope="function")
 def test_user(db_session):
     """Create a test user"""
-    from app.security import get_password_hash
-
     user = User(
+        name="Test User",
         email="test@example.com",
         password_hash=get_password_hash("testpassword123"),
-        full_name="Test User",
-        is_active=True
     )
     db_session.add(user)
     db_session.commit()
@@ -74,7 +88,7 @@ def test_user(db_session):
 @pytest.fixture(scope="function")
 def auth_token(test_user):
     """Create an auth token for the test user"""
-    token = create_access_token({"sub": test_user.email})
+    token = create_access_token({"sub": str(test_user.id)})
     return token
 
 
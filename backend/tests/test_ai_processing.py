@@ -0,0 +1,91 @@
+"""
+AI Processing Tests
+
+Tests for the background AI processing worker
+"""
+
+import uuid
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from models import Thread
+from routers import ai
+from workers import ai_processing_worker
+from workers.ai_processing_worker import AIProcessingWorker
+
+
+@pytest.fixture
+def thread(db_session, test_user):
+    """Create a test thread"""
+    thread = Thread(
+        user_id=test_user.id,
+        thread_id_provider='test_thread_123',
+        subject='Test Email',
+        last_message_at=datetime(2024, 1, 1),
+    )
+    db_session.add(thread)
+    db_session.commit()
+    db_session.refresh(thread)
+    return thread
+
+
+def test_ai_steps_load_user_in_their_own_session(db_session, test_user, thread):
+    """Each concurrent step works on a user bound to its own session"""
+    seen = []
+
+    def fake_step(db, user, thread_id):
+        seen.append((user.id, user in db, thread_id))
+        return {'success': True}
+
+    steps = {
+        'summarize': ('summary', fake_step, "Summarization"),
+        'reply': ('reply', fake_step, "Reply generation"),
+    }
+    with patch.dict(ai_processing_worker._AI_STEPS, steps, clear=True), \
+         patch('workers.base.get_monitor'):
+        results = AIProcessingWorker().execute(
+            str(test_user.id), str(thread.id), tasks=['summarize', 'reply']
+        )
+
+    assert results == {'summary': {'success': True}, 'reply': {'success': True}}
+    assert seen == [(str(test_user.id), True, str(thread.id))] * 2
+
+
+def test_process_all_loads_user_in_each_session(client, auth_headers, test_user):
+    """Each concurrent job gets the user from its own session, not the request's"""
+    seen = []
+    result = {
+        'id': uuid.uuid4(),
+        'thread_id': uuid.uuid4(),
+        'summary_text': 'Summary',
+        'model_used': 'test',
+        'priority_level': 'low',
+        'category': 'internal',
+        'sentiment_score': 0.0,
+        'sentiment_label': 'neutral',
+        'anger_level': 0.0,
+        'urgency_score': 0.0,
+        'created_at': datetime(2024, 1, 1),
+    }
+
+    class FakeService:
+        def __init__(self, db, user):
+            seen.append((user.id, user in db))
+
+        def _run(self, thread_id, force_regenerate):
+            return result
+
+        summarize_thread = classify_thread = analyze_thread = _run
+
+    with patch.object(ai, 'SummarizationService', FakeService), \
+         patch.object(ai, 'ClassificationService', FakeService), \
+         patch.object(ai, 'SentimentAnalysisService', FakeService):
+        response = client.post(
+            "/api/v1/ai/process-all",
+            json={'thread_id': str(result['thread_id'])},
+            headers=auth_headers
+        )
+
+    assert response.status_code == 200
+    assert seen == [(str(test_user.id), True)] * 3
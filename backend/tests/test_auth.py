@@ -97,3 +97,20 @@ def test_get_current_user_unauthorized(client):
     response = client.get("/api/v1/auth/me")
 
     assert response.status_code == 401
+
+
+def test_user_cache_snapshot_excludes_password_hash(db_session, test_user):
+    """The Redis user snapshot never carries the password hash"""
+    from unittest.mock import patch
+    from core.security import load_user
+
+    db_session.expunge_all()
+    with patch('core.security.cache_get', return_value=None), \
+         patch('core.security.cache_set') as mock_set:
+        user = load_user(db_session, test_user.id)
+
+    assert user.email == test_user.email
+    key, snapshot, ttl = mock_set.call_args.args
+    assert key == f"user:{test_user.id}"
+    assert 'password_hash' not in snapshot
+    assert set(snapshot) == {'id', 'email', 'name', 'created_at'}
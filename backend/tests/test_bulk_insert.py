@@ -0,0 +1,75 @@
+"""
+Bulk Insert Tests
+
+Tests for batched email inserts that skip already-stored messages
+"""
+
+from datetime import datetime
+
+import pytest
+from sqlalchemy.exc import IntegrityError
+from models import Thread, Email
+from db import insert_rows
+
+
+@pytest.fixture
+def thread(db_session, test_user):
+    """Create a test thread"""
+    thread = Thread(
+        user_id=test_user.id,
+        thread_id_provider='test_thread_123',
+        subject='Test Email',
+        last_message_at=datetime(2024, 1, 1),
+    )
+    db_session.add(thread)
+    db_session.commit()
+    db_session.refresh(thread)
+    return thread
+
+
+def _email_row(thread, email_id_provider):
+    return {
+        'thread_id': thread.id,
+        'user_id': thread.user_id,
+        'email_id_provider': email_id_provider,
+        'sender': 'sender@example.com',
+        'recipients': ['recipient@example.com'],
+        'body_text_clean': 'Test email body',
+        'timestamp': datetime(2024, 1, 1),
+    }
+
+
+def _stored_ids(db_session):
+    return sorted(row.email_id_provider for row in db_session.query(Email.email_id_provider))
+
+
+def test_insert_rows_skips_stored_emails(db_session, thread):
+    """Rows already in the table are skipped, the rest of the batch is inserted"""
+    first = [_email_row(thread, 'msg_a'), _email_row(thread, 'msg_b')]
+    assert insert_rows(db_session, Email, first, conflict_columns=('email_id_provider',)) == 2
+
+    second = [_email_row(thread, 'msg_b'), _email_row(thread, 'msg_c')]
+    assert insert_rows(db_session, Email, second, conflict_columns=('email_id_provider',)) == 1
+
+    assert _stored_ids(db_session) == ['msg_a', 'msg_b', 'msg_c']
+
+
+def test_insert_rows_skips_duplicates_within_batch(db_session, thread):
+    """A message repeated inside one batch is stored once"""
+    batch = [
+        _email_row(thread, 'msg_a'),
+        _email_row(thread, 'msg_a'),
+        _email_row(thread, 'msg_b'),
+    ]
+
+    assert insert_rows(db_session, Email, batch, conflict_columns=('email_id_provider',)) == 2
+    assert _stored_ids(db_session) == ['msg_a', 'msg_b']
+
+
+def test_insert_rows_without_conflict_columns_raises_on_duplicate(db_session, thread):
+    """Without conflict columns a duplicate still fails the batch"""
+    insert_rows(db_session, Email, [_email_row(thread, 'msg_a')])
+
+    with pytest.raises(IntegrityError):
+        insert_rows(db_session, Email, [_email_row(thread, 'msg_a')])
+    db_session.rollback()
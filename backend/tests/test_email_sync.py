@@ -106,3 +106,73 @@ def test_get_nonexistent_email(client, test_user, auth_headers):
     )
 
     assert response.status_code == 404
+
+
+def test_process_sync_queue_merges_duplicate_jobs():
+    """Queued webhook jobs run one sync per (user, provider)"""
+    from workers.email_sync_worker import process_sync_queue
+
+    jobs = [
+        {'user_id': 'user-1', 'provider': 'outlook', 'incremental': True},
+        {'user_id': 'user-1', 'provider': 'outlook', 'incremental': True},
+        {'user_id': 'user-1', 'provider': 'gmail', 'incremental': True},
+        {'user_id': 'user-2', 'provider': 'gmail', 'incremental': True},
+    ]
+
+    with patch('workers.email_sync_worker.RedisClient.dequeue', return_value=jobs), \
+         patch('workers.email_sync_worker.sync_user_emails') as mock_sync:
+        mock_sync.side_effect = [
+            {'status': 'success'},
+            {'status': 'failed'},
+            {'status': 'success'},
+        ]
+
+        stats = process_sync_queue()
+
+    assert [c.args for c in mock_sync.call_args_list] == [
+        ('user-1', 'outlook'),
+        ('user-1', 'gmail'),
+        ('user-2', 'gmail'),
+    ]
+    assert stats == {'jobs': 4, 'syncs': 2, 'failed': 1}
+
+
+def test_sync_all_accounts_gives_each_provider_its_own_user(db_session, test_user):
+    """Provider threads work on copies of the user bound to their own session"""
+    from datetime import datetime
+    from services import email_sync_service
+    from services.email_sync_service import EmailSyncService
+
+    db_session.add(AccountToken(
+        user_id=test_user.id,
+        provider='outlook',
+        email_address='test@outlook.com',
+        access_token='test_access_token',
+        refresh_token='test_refresh_token',
+        expires_at=datetime(2030, 1, 1),
+    ))
+    db_session.commit()
+
+    seen = {}
+
+    class FakeService:
+        def __init__(self, db, user, account_token=None):
+            seen.update(
+                user=user,
+                user_in_session=user in db,
+                account_in_session=account_token in db,
+            )
+
+        def sync_emails(self, lookback_days, full_sync):
+            return {'emails_created': 0, 'threads_created': 0}
+
+    with patch.dict(email_sync_service._PROVIDER_SERVICES, {'outlook': FakeService}), \
+         patch('services.email_sync_service.invalidate_sync_status'):
+        results = EmailSyncService(db_session, test_user).sync_all_accounts()
+
+    assert results['errors'] == []
+    assert seen['user'] is not test_user
+    assert seen['user'].id == test_user.id
+    assert seen['user_in_session']
+    assert seen['account_in_session']
+    assert test_user in db_session
@@ -0,0 +1,67 @@
+"""
+Thread Tests
+
+Tests for thread listing and keyset pagination
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+from models import Thread
+
+
+@pytest.fixture
+def threads(db_session, test_user):
+    """Create five threads, two of them sharing a last_message_at"""
+    base = datetime(2024, 1, 1)
+    offsets = [0, 1, 2, 2, 3]
+    threads = [
+        Thread(
+            user_id=test_user.id,
+            thread_id_provider=f'test_thread_{i}',
+            subject=f'Thread {i}',
+            last_message_at=base + timedelta(hours=hours),
+        )
+        for i, hours in enumerate(offsets)
+    ]
+    db_session.add_all(threads)
+    db_session.commit()
+    # Newest first, id breaks ties
+    return sorted(threads, key=lambda t: (t.last_message_at, t.id), reverse=True)
+
+
+def test_list_threads_keyset_pages(client, auth_headers, threads):
+    """Following X-Next-Cursor walks every thread once, in order"""
+    seen = []
+    params = {"limit": 2}
+    while True:
+        response = client.get("/api/v1/threads/", params=params, headers=auth_headers)
+        assert response.status_code == 200
+        seen.extend(item["id"] for item in response.json())
+
+        cursor = response.headers.get("X-Next-Cursor")
+        if not cursor:
+            break
+        params = {"limit": 2, "cursor": cursor}
+
+    assert seen == [t.id for t in threads]
+
+
+def test_list_threads_last_page_has_no_cursor(client, auth_headers, threads):
+    """A short page means there is nothing more to fetch"""
+    response = client.get("/api/v1/threads/", params={"limit": 10}, headers=auth_headers)
+
+    assert response.status_code == 200
+    assert len(response.json()) == len(threads)
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_threads_invalid_cursor(client, auth_headers, threads):
+    """A malformed cursor is a client error"""
+    response = client.get(
+        "/api/v1/threads/",
+        params={"cursor": "not-a-cursor"},
+        headers=auth_headers
+    )
+
+    assert response.status_code == 400
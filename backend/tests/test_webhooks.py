@@ -0,0 +1,114 @@
+"""
+Webhook Tests
+
+Tests for push notification verification and account matching
+"""
+
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+from models import AccountToken
+from routers import webhooks
+
+OUTLOOK_PUSH_URL = "/api/v1/webhooks/outlook/push"
+
+
+@pytest.fixture
+def outlook_account(db_session, test_user):
+    """Create a test Outlook account with a webhook subscription"""
+    account = AccountToken(
+        user_id=test_user.id,
+        provider='outlook',
+        email_address='test@outlook.com',
+        access_token='test_access_token',
+        refresh_token='test_refresh_token',
+        expires_at=datetime(2030, 1, 1),
+        subscription_id='sub-123',
+    )
+    db_session.add(account)
+    db_session.commit()
+    db_session.refresh(account)
+    return account
+
+
+def _notification(subscription_id, client_state=None):
+    return {
+        'subscriptionId': subscription_id,
+        'clientState': client_state or webhooks.settings.OUTLOOK_WEBHOOK_CLIENT_STATE,
+        'changeType': 'created',
+        'resource': 'Users/abc/Messages/msg-1',
+    }
+
+
+@pytest.fixture
+def queue_pipe():
+    """Capture the jobs the webhook enqueues instead of sending them to Redis"""
+    with patch.object(webhooks.redis_client, 'pipeline') as mock_pipeline:
+        yield mock_pipeline.return_value.__enter__.return_value
+
+
+def test_outlook_push_enqueues_sync_for_subscription(client, outlook_account, queue_pipe):
+    """A notification is matched to its account by subscription ID"""
+    response = client.post(OUTLOOK_PUSH_URL, json={'value': [_notification('sub-123')]})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
+    queue_pipe.enqueue.assert_called_once()
+    queue, job_data = queue_pipe.enqueue.call_args.args
+    assert queue == 'email_sync'
+    assert job_data['user_id'] == str(outlook_account.user_id)
+    assert job_data['provider'] == 'outlook'
+    queue_pipe.execute.assert_called_once()
+
+
+def test_outlook_push_ignores_unknown_subscription(client, outlook_account, queue_pipe):
+    """Notifications for subscriptions we don't have enqueue nothing"""
+    response = client.post(OUTLOOK_PUSH_URL, json={'value': [_notification('sub-unknown')]})
+
+    assert response.status_code == 200
+    queue_pipe.enqueue.assert_not_called()
+
+
+def test_outlook_push_rejects_bad_client_state(client, outlook_account, queue_pipe):
+    """Notifications with the wrong client state are dropped"""
+    response = client.post(
+        OUTLOOK_PUSH_URL,
+        json={'value': [_notification('sub-123', client_state='forged')]}
+    )
+
+    assert response.status_code == 200
+    queue_pipe.enqueue.assert_not_called()
+
+
+GMAIL_PUSH_URL = "/api/v1/webhooks/gmail/push"
+
+
+@pytest.fixture
+def pubsub_token():
+    """Require a Pub/Sub verification token for the test"""
+    settings = webhooks.settings.model_copy(update={'PUBSUB_VERIFICATION_TOKEN': 'pubsub-secret'})
+    with patch.object(webhooks, 'settings', settings):
+        yield 'pubsub-secret'
+
+
+def test_gmail_push_rejects_missing_token(client, pubsub_token):
+    """Pushes without the shared token are refused"""
+    response = client.post(GMAIL_PUSH_URL, json={'message': {}})
+
+    assert response.status_code == 403
+
+
+def test_gmail_push_rejects_wrong_token(client, pubsub_token):
+    """Pushes with the wrong shared token are refused"""
+    response = client.post(f"{GMAIL_PUSH_URL}?token=wrong", json={'message': {}})
+
+    assert response.status_code == 403
+
+
+def test_gmail_push_accepts_token(client, pubsub_token):
+    """Pushes with the shared token are processed"""
+    response = client.post(f"{GMAIL_PUSH_URL}?token={pubsub_token}", json={'message': {}})
+
+    assert response.status_code == 200
+    assert response.json() == {"status": "ignored"}
@@ -9,7 +9,9 @@ from typing import Optional
 import boto3
 from botocore.exceptions import ClientError
 
-from app.config import settings
+from app.config import get_settings
+
+settings = get_settings()
 
 logger = logging.getLogger(__name__)
 
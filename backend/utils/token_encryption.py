@@ -2,7 +2,10 @@ from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 from base64 import urlsafe_b64encode
-from app.config import settings
+from functools import lru_cache
+from app.config import get_settings
+
+settings = get_settings()
 
 
 def get_encryption_key() -> bytes:
@@ -22,6 +25,12 @@ def get_encryption_key() -> bytes:
     return urlsafe_b64encode(key)
 
 
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    """Fernet for the derived key, built once: the PBKDF2 derivation is deliberately slow"""
+    return Fernet(get_encryption_key())
+
+
 def encrypt_token(token: str) -> str:
     """
     Encrypt OAuth refresh token
@@ -32,9 +41,7 @@ def encrypt_token(token: str) -> str:
     Returns:
         Encrypted token string
     """
-    key = get_encryption_key()
-    f = Fernet(key)
-    encrypted = f.encrypt(token.encode())
+    encrypted = _get_fernet().encrypt(token.encode())
     return encrypted.decode()
 
 
@@ -48,7 +55,5 @@ def decrypt_token(encrypted_token: str) -> str:
     Returns:
         Decrypted token string
     """
-    key = get_encryption_key()
-    f = Fernet(key)
-    decrypted = f.decrypt(encrypted_token.encode())
+    decrypted = _get_fernet().decrypt(encrypted_token.encode())
     return decrypted.decode()
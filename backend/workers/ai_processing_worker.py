@@ -5,6 +5,7 @@ Background worker for AI processing of emails (summarization, classification, et
 """
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, Optional, List
 from sqlalchemy.orm import Session
 
@@ -23,6 +24,81 @@ from db import SessionLocal
 logger = logging.getLogger(__name__)
 
 
+def _summarize(db: Session, user: User, thread_id: str) -> Dict[str, Any]:
+    summary = SummarizationService(db, user).summarize_thread(thread_id)
+    return {
+        'success': True,
+        'summary_text': summary.summary_text,
+        'model_used': summary.model_used
+    }
+
+
+def _classify(db: Session, user: User, thread_id: str) -> Dict[str, Any]:
+    priority = ClassificationService(db, user).classify_thread(thread_id)
+    return {
+        'success': True,
+        'priority_level': priority.priority_level,
+        'category': priority.category
+    }
+
+
+def _analyze_sentiment(db: Session, user: User, thread_id: str) -> Dict[str, Any]:
+    sentiment = SentimentAnalysisService(db, user).analyze_thread(thread_id)
+    return {
+        'success': True,
+        'sentiment_label': sentiment.sentiment_label,
+        'sentiment_score': sentiment.sentiment_score,
+        'anger_level': sentiment.anger_level,
+        'urgency_score': sentiment.urgency_score
+    }
+
+
+def _generate_reply(db: Session, user: User, thread_id: str) -> Dict[str, Any]:
+    reply = ReplyGenerationService(db, user).generate_reply(thread_id)
+    return {
+        'success': True,
+        'draft_text': reply.draft_text,
+        'tone_used': reply.tone_used
+    }
+
+
+def _extract_tasks(db: Session, user: User, thread_id: str) -> Dict[str, Any]:
+    extracted_tasks = TaskExtractionService(db, user).extract_tasks(thread_id)
+    return {
+        'success': True,
+        'task_count': len(extracted_tasks),
+        'tasks': [
+            {
+                'title': task.title,
+                'due_date': task.due_date.isoformat() if task.due_date else None,
+                'owner': task.extracted_owner
+            }
+            for task in extracted_tasks
+        ]
+    }
+
+
+# Task name -> (result key, step, label for error logs)
+_AI_STEPS = {
+    'summarize': ('summary', _summarize, "Summarization"),
+    'classify': ('classification', _classify, "Classification"),
+    'sentiment': ('sentiment', _analyze_sentiment, "Sentiment analysis"),
+    'reply': ('reply', _generate_reply, "Reply generation"),
+    'tasks': ('tasks', _extract_tasks, "Task extraction"),
+}
+
+
+def _run_step(step, user_id: str, thread_id: str) -> Dict[str, Any]:
+    """Run one AI step with its own session; sessions can't be shared across threads"""
+    db = SessionLocal()
+    try:
+        # The caller's User belongs to the caller's session, so load our own
+        user = db.get(User, user_id)
+        return step(db, user, thread_id)
+    finally:
+        db.close()
+
+
 class AIProcessingWorker(BaseWorker):
     """Worker for processing individual threads with AI"""
 
@@ -146,86 +222,23 @@ class AIProcessingWorker(BaseWorker):
                 f"Processing thread {internal_thread_id} (Provider ID: {thread.thread_id_provider}) for user {user.email}: {tasks}"
             )
 
+            # Each step is an independent LLM round trip, so they run
+            # concurrently; latency is that of the slowest step, not the sum
+            steps = [(name, _AI_STEPS[name]) for name in _AI_STEPS if name in tasks]
             results = {}
 
-            # Summarization
-            if 'summarize' in tasks:
-                try:
-                    service = SummarizationService(db, user)
-                    summary = service.summarize_thread(internal_thread_id)
-                    results['summary'] = {
-                        'success': True,
-                        'summary_text': summary.summary_text,
-                        'model_used': summary.model_used
-                    }
-                except Exception as e:
-                    self.logger.error(f"Summarization failed: {str(e)}")
-                    results['summary'] = {'success': False, 'error': str(e)}
-
-            # Classification
-            if 'classify' in tasks:
-                try:
-                    service = ClassificationService(db, user)
-                    priority = service.classify_thread(internal_thread_id)
-                    results['classification'] = {
-                        'success': True,
-                        'priority_level': priority.priority_level,
-                        'category': priority.category
-                    }
-                except Exception as e:
-                    self.logger.error(f"Classification failed: {str(e)}")
-                    results['classification'] = {'success': False, 'error': str(e)}
-
-            # Sentiment Analysis
-            if 'sentiment' in tasks:
-                try:
-                    service = SentimentAnalysisService(db, user)
-                    sentiment = service.analyze_thread(internal_thread_id)
-                    results['sentiment'] = {
-                        'success': True,
-                        'sentiment_label': sentiment.sentiment_label,
-                        'sentiment_score': sentiment.sentiment_score,
-                        'anger_level': sentiment.anger_level,
-                        'urgency_score': sentiment.urgency_score
-                    }
-                except Exception as e:
-                    self.logger.error(f"Sentiment analysis failed: {str(e)}")
-                    results['sentiment'] = {'success': False, 'error': str(e)}
+            with ThreadPoolExecutor(max_workers=max(len(steps), 1)) as executor:
+                futures = {
+                    name: executor.submit(_run_step, step, user_id, internal_thread_id)
+                    for name, (_, step, _) in steps
+                }
 
-            # Reply Generation
-            if 'reply' in tasks:
-                try:
-                    service = ReplyGenerationService(db, user)
-                    reply = service.generate_reply(internal_thread_id)
-                    results['reply'] = {
-                        'success': True,
-                        'draft_text': reply.draft_text,
-                        'tone_used': reply.tone_used
-                    }
-                except Exception as e:
-                    self.logger.error(f"Reply generation failed: {str(e)}")
-                    results['reply'] = {'success': False, 'error': str(e)}
-
-            # Task Extraction
-            if 'tasks' in tasks:
-                try:
-                    service = TaskExtractionService(db, user)
-                    extracted_tasks = service.extract_tasks(internal_thread_id)
-                    results['tasks'] = {
-                        'success': True,
-                        'task_count': len(extracted_tasks),
-                        'tasks': [
-                            {
-                                'title': task.title,
-                                'due_date': task.due_date.isoformat() if task.due_date else None,
-                                'owner': task.extracted_owner
-                            }
-                            for task in extracted_tasks
-                        ]
-                    }
-                except Exception as e:
-                    self.logger.error(f"Task extraction failed: {str(e)}")
-                    results['tasks'] = {'success': False, 'error': str(e)}
+                for name, (result_key, _, label) in steps:
+                    try:
+                        results[result_key] = futures[name].result()
+                    except Exception as e:
+                        self.logger.error(f"{label} failed: {str(e)}")
+                        results[result_key] = {'success': False, 'error': str(e)}
 
             self.logger.info(f"AI processing completed for thread {internal_thread_id}")
             return results
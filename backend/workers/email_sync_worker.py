@@ -12,6 +12,7 @@ from workers.base import BaseWorker
 from models import User, AccountToken
 from services import EmailSyncService
 from db import SessionLocal
+from core.redis_client import RedisClient
 
 logger = logging.getLogger(__name__)
 
@@ -167,6 +168,41 @@ def sync_user_emails(
     return worker.run(user_id, provider, full_sync, lookback_days)
 
 
+def process_sync_queue(max_jobs: int = 100) -> Dict[str, Any]:
+    """
+    Run the email syncs queued by the Gmail/Outlook webhooks
+
+    Jobs are taken off the 'email_sync' queue in one batch. A burst of
+    notifications for the same mailbox becomes a single sync per
+    (user, provider).
+
+    Args:
+        max_jobs: Maximum number of queued jobs to take per run
+
+    Returns:
+        Counts of jobs taken and syncs run / failed
+    """
+    jobs = RedisClient.dequeue('email_sync', max_jobs)
+    stats = {'jobs': len(jobs), 'syncs': 0, 'failed': 0}
+    if not jobs:
+        return stats
+
+    # dict keeps first-seen order while dropping duplicates
+    targets = dict.fromkeys((job['user_id'], job.get('provider')) for job in jobs)
+    for user_id, provider in targets:
+        result = sync_user_emails(user_id, provider)
+        if result['status'] == 'success':
+            stats['syncs'] += 1
+        else:
+            stats['failed'] += 1
+
+    logger.info(
+        f"Processed {stats['jobs']} queued sync jobs: "
+        f"{stats['syncs']} syncs, {stats['failed']} failed"
+    )
+    return stats
+
+
 def sync_all_users(lookback_days: Optional[int] = None) -> Dict[str, Any]:
     """
     Sync emails for all users (standalone function for job queues)
@@ -11,11 +11,15 @@ from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
 from apscheduler.events import EVENT_JOB_ERROR, EVENT_JOB_EXECUTED
 from datetime import datetime
+from sqlalchemy import text
 
-from app.config import settings
-from workers.email_sync_worker import sync_all_users
+from app.config import get_settings
+from db import engine
+from workers.email_sync_worker import sync_all_users, process_sync_queue
 from workers.ai_processing_worker import process_all_unprocessed_threads
 
+settings = get_settings()
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +95,28 @@ class WorkerScheduler:
             f"lookback {lookback_days} days"
         )
 
+    def add_sync_queue_job(self, interval_seconds: Optional[int] = None):
+        """
+        Add the job that drains webhook-queued email syncs
+
+        The scheduler runs in a single process, so this is the only
+        consumer of the queue.
+
+        Args:
+            interval_seconds: Polling interval in seconds (from settings if None)
+        """
+        interval = interval_seconds or settings.EMAIL_SYNC_QUEUE_INTERVAL_SECONDS
+
+        self.scheduler.add_job(
+            func=process_sync_queue,
+            trigger=IntervalTrigger(seconds=interval),
+            id='email_sync_queue_job',
+            name='Queued Email Syncs',
+            replace_existing=True
+        )
+
+        logger.info(f"Scheduled email sync queue job: every {interval} seconds")
+
     def add_ai_processing_job(
         self,
         interval_minutes: Optional[int] = None,
@@ -162,6 +188,7 @@ class WorkerScheduler:
         # Add default jobs
         # self.add_email_sync_job()  # Disabled: using on-demand processing only
         # self.add_ai_processing_job()  # Disabled to prevent Gemini quota exhaustion
+        self.add_sync_queue_job()  # Syncs requested by Gmail/Outlook push notifications
         self.add_nightly_cleanup_job()
 
         # Start scheduler
@@ -241,6 +268,11 @@ class WorkerScheduler:
 # Global scheduler instance
 _scheduler_instance: Optional[WorkerScheduler] = None
 
+# Session-level advisory lock that elects the one process allowed to run the
+# scheduler; the key is an arbitrary constant reserved for this purpose
+_SCHEDULER_LOCK_KEY = 724_311_001
+_lock_connection = None
+
 
 def get_scheduler() -> WorkerScheduler:
     """
@@ -257,13 +289,51 @@ def get_scheduler() -> WorkerScheduler:
     return _scheduler_instance
 
 
-def start_scheduler():
-    """Start the global scheduler"""
+def start_scheduler() -> bool:
+    """
+    Start the global scheduler, unless another process is already running it
+
+    Every uvicorn worker runs the app lifespan, so without coordination each
+    one would schedule (and run) every job. The first process to take a
+    Postgres advisory lock runs the scheduler; the lock is held on a
+    dedicated connection while it runs and is released by Postgres if the
+    process dies, letting another worker take over on its next start.
+
+    Returns:
+        True if this process started the scheduler
+    """
+    global _lock_connection
+
+    connection = engine.connect()
+    acquired = connection.execute(
+        text("SELECT pg_try_advisory_lock(:key)"), {"key": _SCHEDULER_LOCK_KEY}
+    ).scalar()
+    # The lock is session-level; don't leave the connection idle in a transaction
+    connection.commit()
+
+    if not acquired:
+        connection.close()
+        logger.info("Worker scheduler is running in another process")
+        return False
+
+    _lock_connection = connection
     scheduler = get_scheduler()
     scheduler.start()
+    return True
 
 
 def stop_scheduler():
-    """Stop the global scheduler"""
+    """Stop the global scheduler and release the scheduler lock"""
+    global _lock_connection
+
+    if _lock_connection is None:
+        return
+
     scheduler = get_scheduler()
     scheduler.stop()
+
+    _lock_connection.execute(
+        text("SELECT pg_advisory_unlock(:key)"), {"key": _SCHEDULER_LOCK_KEY}
+    )
+    _lock_connection.close()
+    _lock_connection = None